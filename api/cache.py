@@ -0,0 +1,121 @@
+"""
+In-process TTL cache for idempotent Canvas API GET responses.
+
+Tool calls frequently re-fetch identical URLs (course lists, course
+details, announcement contexts) within a short window. Caching those
+responses per (token, URL) eliminates redundant round-trips without any
+external dependency. Caching is off by default and controlled by the
+ENABLE_CACHING setting.
+"""
+
+import hashlib
+import time
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+# Cache keys are (token_hash, method, url) tuples
+CacheKey = Tuple[str, str, str]
+
+
+class CachedResponse(NamedTuple):
+    """A cached response body plus the validators Canvas sent with it.
+
+    The ETag/Last-Modified validators let the client revalidate an
+    expired entry with a conditional request: a 304 answer means the
+    cached body is still current and the TTL can simply be refreshed,
+    skipping the response download entirely.
+    """
+
+    data: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@lru_cache(maxsize=1024)
+def hash_token(api_token: str) -> str:
+    """
+    Hash an API token for use in cache keys.
+
+    Keys live in memory for the cache's lifetime, so raw tokens are never
+    stored; a short blake2b digest is enough to keep tokens distinct.
+    Memoized — the same handful of tokens hit every request, so the
+    digest is computed once per token rather than once per call.
+    """
+    return hashlib.blake2b(api_token.encode(), digest_size=16).hexdigest()
+
+
+def make_cache_key(api_token: str, method: str, url: str) -> CacheKey:
+    """Build a cache key for a request."""
+    return (hash_token(api_token), method, url)
+
+
+class TTLCache:
+    """
+    Minimal time-based cache with a bounded size.
+
+    Entries expire after `ttl` seconds. When the cache is full, the oldest
+    entry is evicted (insertion order, which is close enough to LRU for
+    this workload).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[CacheKey, Tuple[float, Any]] = {}
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired.
+
+        Expired entries are left in place (until overwritten or evicted
+        by maxsize) so get_stale() can offer them for revalidation.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            return None
+
+        return value
+
+    def get_stale(self, key: CacheKey) -> Optional[Any]:
+        """Return the cached value for key even if expired, else None."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: CacheKey, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value for key, evicting the oldest entry if full."""
+        if len(self._entries) >= self.maxsize and key not in self._entries:
+            oldest_key = next(iter(self._entries))
+            del self._entries[oldest_key]
+
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+
+    def invalidate(self, token_hash: str, url_prefix: str) -> None:
+        """
+        Drop all entries for a token whose URL starts with url_prefix.
+
+        Called after POST/PUT/DELETE so stale reads of the mutated resource
+        aren't served from cache.
+        """
+        stale = [
+            key for key in self._entries
+            if key[0] == token_hash and key[2].startswith(url_prefix)
+        ]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+# Shared response cache for all CanvasAPIClient instances
+response_cache = TTLCache()
+
+# Negative cache for 404 responses: missing resources tend to stay missing,
+# so remembering them briefly stops tools from re-hitting the same dead
+# endpoint on every invocation. Kept separate from response_cache so a
+# longer TTL can be used.
+negative_cache = TTLCache(maxsize=1024, ttl=300.0)
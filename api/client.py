@@ -3,10 +3,31 @@ Canvas API HTTP client with comprehensive error handling.
 Handles authentication, pagination, and request/response processing.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import io
+import json
+import re
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 import httpx
-from urllib.parse import urljoin, urlencode
-
+from urllib.parse import urljoin, urlencode, urlparse, urlunparse, parse_qs
+
+# orjson decodes Canvas's large list payloads several times faster than the
+# stdlib json module and works directly on bytes; fall back to stdlib when
+# it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson enables incremental parsing of large list responses so callers that
+# stop early never materialize (or even download) the full payload.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from .cache import CachedResponse, CacheKey, hash_token, make_cache_key, negative_cache, response_cache
 from .exceptions import (
     CanvasAPIError,
     CanvasAuthError,
@@ -17,6 +38,161 @@ from .exceptions import (
 )
 from config import config
 
+# Matches one Link-header entry: <url>; rel="name"
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+# Rate-limit handling: honor Retry-After (or back off exponentially) and
+# retry a 429 a few times before surfacing CanvasRateLimitError. Blindly
+# refiring would just re-hit the quota.
+_MAX_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF_BASE = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+# Canvas throttling is a leaky bucket: every response reports
+# X-Rate-Limit-Remaining (starts near 700) and a drained bucket answers
+# 403 "Rate Limit Exceeded". Pagination fan-out narrows as the most
+# recent reading approaches the floor, so bursts back off before hitting
+# the wall instead of paying for retry storms.
+_RATE_LIMIT_LOW_WATER = 150.0
+_rate_limit_remaining = float("inf")
+
+
+def _observe_rate_limit(response: httpx.Response) -> None:
+    """Record the rate-limit quota reported by a Canvas response."""
+    global _rate_limit_remaining
+    remaining = response.headers.get("X-Rate-Limit-Remaining")
+    if remaining is not None:
+        try:
+            _rate_limit_remaining = float(remaining)
+        except ValueError:
+            pass
+
+
+def _page_concurrency() -> int:
+    """Current fan-out width, narrowed when the quota runs low."""
+    if _rate_limit_remaining < _RATE_LIMIT_LOW_WATER:
+        width = int(
+            config.max_page_concurrency * _rate_limit_remaining / _RATE_LIMIT_LOW_WATER
+        )
+        return max(1, width)
+    return config.max_page_concurrency
+
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    """Whether a response is a Canvas throttle (429, or the 403 variant)."""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and "rate limit exceeded" in response.text.lower()
+
+# HTTP/2 multiplexes concurrent page and fan-out requests over a single
+# TCP+TLS connection; it needs the optional h2 package.
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# In-flight GET coalescing: when several tools concurrently request the
+# same (token, URL), the first caller issues the HTTP round-trip and the
+# rest await the same task — one request instead of N duplicates. Keyed
+# like the response cache, plus the paginate flag since it changes the
+# result shape for list endpoints.
+_inflight: Dict[Tuple[CacheKey, bool], "asyncio.Task"] = {}
+
+# Shared HTTP client for all CanvasAPIClient instances.
+# Opening a new httpx.AsyncClient per request forces a fresh TCP+TLS handshake
+# every time; a single pooled client reuses keep-alive connections instead.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client with connection pooling."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=config.request_timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=60,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@lru_cache(maxsize=256)
+def _normalize_base_url(api_url: str) -> str:
+    """
+    Normalize a per-request Canvas URL to its /api/v1 base.
+
+    Memoized so trailing-slash variants of the same tenant URL resolve to
+    one canonical base — keeping cache keys and pooled connections shared
+    — without redoing the string work on every client construction.
+    """
+    api_url = api_url.rstrip("/")
+    if api_url.endswith("/api/v1"):
+        return api_url
+    return f"{api_url}/api/v1"
+
+
+@lru_cache(maxsize=1024)
+def _encode_query_cached(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    URL-encode a query-parameter tuple, memoized per combination.
+
+    The param builders in utils.canvas_params return shared, memoized
+    dicts whose values are strings, ints, and tuples — all hashable — so
+    the quote()-per-item work for a given combination (e.g. the 19-entry
+    COURSE_INCLUDE_ALL expansion) happens once per process instead of
+    once per request.
+    """
+    return urlencode(
+        [(key, value) for key, value in items if value is not None],
+        doseq=True,
+    )
+
+
+def _json_loads(response: httpx.Response) -> Any:
+    """Decode a response body, using orjson's bytes-level path when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def json_dumps(data: Any) -> bytes:
+    """Encode data to JSON bytes (request bodies, NDJSON stream lines)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+# Pagination pages past this size are parsed incrementally with ijson
+# (when installed) so items go straight into the combined list instead
+# of first materializing a throwaway per-page list alongside it.
+_LARGE_BODY_BYTES = 256 * 1024
+
+
+def _iter_page_items(response: httpx.Response):
+    """
+    Iterate a pagination page's array items.
+
+    Small bodies take the fast orjson full-decode path; large ones are
+    parsed incrementally to avoid briefly holding two copies of the page
+    (the decoded list plus the combined result) in memory.
+    """
+    if ijson is not None and len(response.content) > _LARGE_BODY_BYTES:
+        return ijson.items(io.BytesIO(response.content), "item")
+    return _json_loads(response)
+
 
 class CanvasAPIClient:
     """
@@ -39,16 +215,11 @@ class CanvasAPIClient:
         """
         self.api_url = api_url.rstrip("/")
         self.api_token = api_token
-        # Ensure base_url includes /api/v1
-        if self.api_url.endswith("/api/v1"):
-            self.base_url = self.api_url
-        else:
-            self.base_url = f"{self.api_url}/api/v1"
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers for Canvas API requests."""
-        return {
-            "Authorization": f"Bearer {self.api_token}",
+        # Ensure base_url includes /api/v1 (memoized across requests)
+        self.base_url = _normalize_base_url(api_url)
+        # Headers never change for a client, so build the dict once
+        self._headers = {
+            "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
@@ -73,20 +244,121 @@ class CanvasAPIClient:
         url = f"{self.base_url}{endpoint}"
 
         if params:
-            # Convert lists to multiple params (Canvas API format)
-            query_parts = []
-            for key, value in params.items():
-                if isinstance(value, list):
-                    for item in value:
-                        query_parts.append(f"{key}={item}")
-                elif value is not None:
-                    query_parts.append(f"{key}={value}")
-
-            if query_parts:
-                url = f"{url}?{'&'.join(query_parts)}"
+            # Encode in one pass; doseq=True expands tuple/list values into
+            # the repeated include[]=a&include[]=b form Canvas expects, and
+            # (unlike the old manual loop) values are properly URL-escaped.
+            # The memoized path handles the common case of builder-produced
+            # dicts; unhashable values (e.g. raw lists) fall through to a
+            # direct encode.
+            try:
+                query = _encode_query_cached(tuple(params.items()))
+            except TypeError:
+                query = urlencode(
+                    [(key, value) for key, value in params.items() if value is not None],
+                    doseq=True,
+                )
+            if query:
+                url = f"{url}?{query}"
 
         return url
 
+    def _invalidate_cache(self, endpoint: str) -> None:
+        """
+        Purge cached GET responses under a mutated resource path.
+
+        Called after POST/PUT/DELETE so subsequent reads of the resource
+        (or lists containing it) don't come back stale from cache.
+
+        Args:
+            endpoint: API endpoint that was mutated
+        """
+        if not config.enable_caching:
+            return
+
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+
+        response_cache.invalidate(hash_token(self.api_token), f"{self.base_url}{endpoint}")
+
+    def _record_not_found(self, response: httpx.Response, url: str) -> None:
+        """
+        Remember a 404 response so the next lookup fails fast.
+
+        Honors the server's Cache-Control max-age for the entry TTL when
+        present, falling back to the negative cache default.
+
+        Args:
+            response: HTTP response object
+            url: Fully built request URL
+        """
+        if response.status_code != 404 or not config.enable_caching:
+            return
+
+        ttl = self._cache_control_max_age(response)
+        negative_cache.set(make_cache_key(self.api_token, "GET", url), True, ttl=ttl)
+
+    @staticmethod
+    def _cache_control_max_age(response: httpx.Response) -> Optional[float]:
+        """Extract the max-age directive from Cache-Control, if present."""
+        cache_control = response.headers.get("Cache-Control", "")
+        for directive in cache_control.split(","):
+            directive = directive.strip()
+            if directive.startswith("max-age="):
+                try:
+                    return float(directive[len("max-age="):])
+                except ValueError:
+                    return None
+
+        return None
+
+    async def _get_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Issue a GET, waiting and retrying on rate-limit responses (429,
+        or Canvas's 403 "Rate Limit Exceeded" variant).
+
+        Sleeps for the server's Retry-After when given, otherwise backs off
+        exponentially (capped), and gives up after a bounded number of
+        attempts so the final throttle response still surfaces as an error.
+
+        Args:
+            client: Shared HTTP client
+            url: Fully built request URL
+            headers: Request headers (defaults to the client's auth headers)
+
+        Returns:
+            HTTP response object (possibly still a 429 on the last attempt)
+        """
+        if headers is None:
+            headers = self._headers
+
+        response = await client.get(url, headers=headers)
+        _observe_rate_limit(response)
+
+        for attempt in range(1, _MAX_RETRY_ATTEMPTS):
+            if not _is_rate_limited(response):
+                break
+
+            retry_after = response.headers.get("Retry-After")
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = _RETRY_BACKOFF_BASE * (2 ** (attempt - 1))
+            delay = min(delay, _RETRY_MAX_DELAY)
+
+            if config.enable_debug:
+                print(f"[DEBUG] {response.status_code} (throttled) on {url}, retrying in {delay:.1f}s")
+
+            await asyncio.sleep(delay)
+            response = await client.get(url, headers=headers)
+            _observe_rate_limit(response)
+
+        return response
+
     def _handle_error_response(self, response: httpx.Response, endpoint: str) -> None:
         """
         Handle error responses from Canvas API.
@@ -102,7 +374,7 @@ class CanvasAPIClient:
 
         # Try to parse error message from response
         try:
-            error_data = response.json()
+            error_data = _json_loads(response)
             error_message = error_data.get("message") or error_data.get("error", "Unknown error")
         except Exception:
             error_message = response.text or "Unknown error"
@@ -139,6 +411,8 @@ class CanvasAPIClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         paginate: bool = False,
+        cache_ttl: Optional[float] = None,
+        max_items: Optional[int] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Make GET request to Canvas API.
@@ -147,6 +421,11 @@ class CanvasAPIClient:
             endpoint: API endpoint (e.g., "/courses")
             params: Query parameters
             paginate: If True, automatically fetch all pages
+            cache_ttl: How long to keep the response fresh in the cache,
+                in seconds (None uses the configured default)
+            max_items: With paginate, stop fetching pages once this many
+                items are accumulated and truncate the result (None for
+                all items)
 
         Returns:
             Response data (dict or list depending on endpoint)
@@ -154,47 +433,413 @@ class CanvasAPIClient:
         Raises:
             CanvasAPIError: On API errors
         """
-        # Set default per_page if not specified and paginate is True
+        # Set default per_page if not specified and paginate is True.
+        # Copy instead of mutating: callers may pass shared/memoized dicts.
         if params is None:
             params = {}
 
         if paginate and "per_page" not in params:
-            params["per_page"] = config.default_per_page
+            params = {**params, "per_page": config.default_per_page}
+
+        url = self._build_url(endpoint, params)
+
+        # A truncated result must not shadow (or be shadowed by) the full
+        # list for the same URL, so the limit becomes part of the key
+        key_url = url if max_items is None else f"{url}#max_items={max_items}"
+
+        # Serve repeated idempotent reads from the in-process TTL cache
+        cache_key = None
+        stale = None
+        if config.enable_caching:
+            cache_key = make_cache_key(self.api_token, "GET", key_url)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return cached.data
+
+            # Known-missing resources fail fast without a network call.
+            # 404s are recorded under the plain URL — a resource's
+            # absence doesn't depend on max_items — so probe the same way
+            negative_key = (
+                cache_key if max_items is None
+                else make_cache_key(self.api_token, "GET", url)
+            )
+            if negative_cache.get(negative_key) is not None:
+                raise CanvasNotFoundError(resource=endpoint, endpoint=endpoint)
+
+            # An expired entry with validators can still be revalidated:
+            # a conditional GET answered with 304 skips the body download
+            stale = response_cache.get_stale(cache_key)
+
+        # Coalesce concurrent identical reads: only the first caller hits
+        # the network, later callers await the same in-flight task
+        inflight_key = (cache_key or make_cache_key(self.api_token, "GET", key_url), paginate)
+        task = _inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._get_uncached(endpoint, url, paginate, stale, max_items)
+            )
+            _inflight[inflight_key] = task
+            task.add_done_callback(lambda _task: _inflight.pop(inflight_key, None))
 
-        async with httpx.AsyncClient(timeout=config.request_timeout) as client:
-            url = self._build_url(endpoint, params)
+        entry = await task
 
-            if config.enable_debug:
-                print(f"[DEBUG] GET {url}")
+        if cache_key is not None:
+            if cache_ttl is None:
+                cache_ttl = config.cache_ttl
+            response_cache.set(cache_key, entry, ttl=cache_ttl)
+
+        return entry.data
+
+    async def _get_uncached(
+        self,
+        endpoint: str,
+        url: str,
+        paginate: bool,
+        stale: Optional[CachedResponse] = None,
+        max_items: Optional[int] = None,
+    ) -> CachedResponse:
+        """
+        Fetch a GET response (and all pages when paginating) from Canvas.
+
+        When an expired cache entry with validators is supplied, the
+        request goes out conditional (If-None-Match/If-Modified-Since); a
+        304 answer revalidates the stale body without re-downloading it.
+
+        Args:
+            endpoint: API endpoint (for error reporting)
+            url: Fully built request URL
+            paginate: If True, automatically fetch all pages
+            stale: Expired cache entry to offer for revalidation
+            max_items: Stop paginating once this many items are collected
+
+        Returns:
+            Response data plus the validators to cache with it
+
+        Raises:
+            CanvasAPIError: On API errors
+        """
+        client = _get_http_client()
+
+        headers = self._headers
+        if stale is not None and (stale.etag or stale.last_modified):
+            headers = dict(self._headers)
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+
+        if config.enable_debug:
+            print(f"[DEBUG] GET {url}")
+
+        response = await self._get_with_retry(client, url, headers)
+
+        if response.status_code == 304 and stale is not None:
+            return stale
+
+        if not response.is_success:
+            self._record_not_found(response, url)
+            self._handle_error_response(response, endpoint)
+
+        data = _json_loads(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        # Handle pagination if requested
+        if paginate and isinstance(data, list):
+            all_data = data
+
+            # Enough already? Skip the remaining pages entirely.
+            if max_items is not None and len(all_data) >= max_items:
+                return CachedResponse(all_data[:max_items])
+
+            links = self._parse_link_header(response)
+
+            last_url = links.get("last")
+            total_pages = self._extract_page_number(last_url) if last_url else None
+
+            if total_pages and total_pages > 1 and max_items is not None and all_data:
+                # Page 1 is full when more pages exist, so its length
+                # bounds how many pages the limit actually needs
+                pages_needed = -(-max_items // len(all_data))
+                total_pages = min(total_pages, pages_needed)
+
+            if total_pages and total_pages > 1:
+                # The Link header exposes rel="last", so we know the page
+                # count up front and can fetch pages 2..N concurrently
+                # instead of serially walking next-links.
+                semaphore = asyncio.Semaphore(_page_concurrency())
+
+                async def fetch_page(page_url: str) -> httpx.Response:
+                    async with semaphore:
+                        if config.enable_debug:
+                            print(f"[DEBUG] GET {page_url} (pagination)")
+
+                        page_response = await self._get_with_retry(client, page_url)
+
+                        if not page_response.is_success:
+                            self._handle_error_response(page_response, endpoint)
+
+                        return page_response
+
+                page_urls = [
+                    self._replace_page_param(last_url, page)
+                    for page in range(2, total_pages + 1)
+                ]
+                for page_response in await asyncio.gather(*(fetch_page(u) for u in page_urls)):
+                    all_data.extend(_iter_page_items(page_response))
+
+                if max_items is not None:
+                    del all_data[max_items:]
+
+                # A stitched multi-page body has no single validator pair
+                return CachedResponse(all_data)
+
+            # Fall back to sequential fetching when rel="last" is missing
+            # (some Canvas endpoints only expose rel="next").
+            next_url = links.get("next")
+
+            if next_url is None:
+                # Single page: its validators cover the whole payload
+                return CachedResponse(all_data, etag, last_modified)
+
+            while next_url:
+                if config.enable_debug:
+                    print(f"[DEBUG] GET {next_url} (pagination)")
+
+                response = await self._get_with_retry(client, next_url)
+
+                if not response.is_success:
+                    self._handle_error_response(response, endpoint)
+
+                all_data.extend(_iter_page_items(response))
+
+                if max_items is not None and len(all_data) >= max_items:
+                    del all_data[max_items:]
+                    break
+
+                next_url = self._get_next_page_url(response)
 
-            response = await client.get(url, headers=self._get_headers())
+            return CachedResponse(all_data)
 
+        return CachedResponse(data, etag, last_modified)
+
+    async def get_many(
+        self,
+        endpoints: List[str],
+        params: Optional[Dict[str, Any]] = None,
+        paginate: bool = False,
+    ) -> List[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Fetch several endpoints concurrently with shared headers.
+
+        The precomputed auth headers and pooled connections are reused
+        across the whole fan-out, and results come back in endpoint
+        order. Concurrency is bounded by the same limit as pagination.
+
+        Args:
+            endpoints: API endpoints to fetch
+            params: Query parameters applied to every endpoint
+            paginate: If True, fetch all pages of each endpoint
+
+        Returns:
+            Response data per endpoint, in input order
+
+        Raises:
+            CanvasAPIError: On API errors (first failure propagates)
+        """
+        semaphore = asyncio.Semaphore(_page_concurrency())
+
+        async def fetch(endpoint: str):
+            async with semaphore:
+                return await self.get(endpoint, params=params, paginate=paginate)
+
+        return list(await asyncio.gather(*(fetch(endpoint) for endpoint in endpoints)))
+
+    async def iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream items from a list endpoint one at a time.
+
+        With ijson installed, the JSON array is parsed incrementally as
+        response chunks arrive, so a caller that breaks out early (e.g.
+        after a limit is reached) never builds the full Python list in
+        memory. Without ijson this degrades to a regular full-body GET.
+
+        Args:
+            endpoint: API endpoint returning a JSON array
+            params: Query parameters
+
+        Yields:
+            Parsed items from the response array
+
+        Raises:
+            CanvasAPIError: On API errors
+        """
+        if ijson is None:
+            data = await self.get(endpoint, params)
+            for item in data if isinstance(data, list) else [data]:
+                yield item
+            return
+
+        client = _get_http_client()
+        url = self._build_url(endpoint, params)
+
+        if config.enable_debug:
+            print(f"[DEBUG] GET {url} (streaming)")
+
+        async with client.stream("GET", url, headers=self._headers) as response:
             if not response.is_success:
+                await response.aread()
+                self._record_not_found(response, url)
                 self._handle_error_response(response, endpoint)
 
-            data = response.json()
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item")
 
-            # Handle pagination if requested
-            if paginate and isinstance(data, list):
-                all_data = data
-                next_url = self._get_next_page_url(response)
+            async for chunk in response.aiter_bytes():
+                try:
+                    parser.send(chunk)
+                except StopIteration:
+                    pass
+
+                while items:
+                    yield items.pop(0)
+
+            parser.close()
+            while items:
+                yield items.pop(0)
+
+    async def iter_paginated(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a paginated list endpoint item by item, in page order.
+
+        Page 1 yields as soon as it arrives; when the Link header exposes
+        rel="last", the remaining pages are prefetched concurrently
+        (bounded by the usual pagination semaphore) while earlier items
+        are being consumed. Unlike get(paginate=True), the full result
+        list is never materialized, and a caller that stops early cancels
+        the outstanding page fetches.
+
+        Args:
+            endpoint: API endpoint returning a JSON array
+            params: Query parameters
+            max_pages: Hard cap on pages fetched (None for all)
+
+        Yields:
+            Items from each page, in page order
+
+        Raises:
+            CanvasAPIError: On API errors
+        """
+        if params is None:
+            params = {}
+
+        # Copy instead of mutating: callers may pass shared/memoized
+        # (read-only) mappings, same as get()
+        if "per_page" not in params:
+            params = {**params, "per_page": config.default_per_page}
+
+        client = _get_http_client()
+        url = self._build_url(endpoint, params)
+
+        if config.enable_debug:
+            print(f"[DEBUG] GET {url} (paginated stream)")
 
-                while next_url:
+        response = await self._get_with_retry(client, url)
+
+        if not response.is_success:
+            self._record_not_found(response, url)
+            self._handle_error_response(response, endpoint)
+
+        data = _json_loads(response)
+
+        if not isinstance(data, list):
+            yield data
+            return
+
+        for item in data:
+            yield item
+
+        links = self._parse_link_header(response)
+        last_url = links.get("last")
+        total_pages = self._extract_page_number(last_url) if last_url else None
+
+        if total_pages and total_pages > 1:
+            if max_pages is not None:
+                total_pages = min(total_pages, max_pages)
+
+            semaphore = asyncio.Semaphore(_page_concurrency())
+
+            async def fetch_page(page_url: str) -> httpx.Response:
+                async with semaphore:
                     if config.enable_debug:
-                        print(f"[DEBUG] GET {next_url} (pagination)")
+                        print(f"[DEBUG] GET {page_url} (paginated stream)")
+
+                    page_response = await self._get_with_retry(client, page_url)
 
-                    response = await client.get(next_url, headers=self._get_headers())
+                    if not page_response.is_success:
+                        self._handle_error_response(page_response, endpoint)
 
-                    if not response.is_success:
-                        self._handle_error_response(response, endpoint)
+                    return page_response
 
-                    page_data = response.json()
-                    all_data.extend(page_data)
-                    next_url = self._get_next_page_url(response)
+            tasks = [
+                asyncio.ensure_future(fetch_page(self._replace_page_param(last_url, page)))
+                for page in range(2, total_pages + 1)
+            ]
+            try:
+                for task in tasks:
+                    for item in _iter_page_items(await task):
+                        yield item
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return
+
+        # rel="last" missing: walk next-links, yielding page by page
+        next_url = links.get("next")
+        pages_fetched = 1
+
+        while next_url and (max_pages is None or pages_fetched < max_pages):
+            if config.enable_debug:
+                print(f"[DEBUG] GET {next_url} (paginated stream)")
 
-                return all_data
+            response = await self._get_with_retry(client, next_url)
+
+            if not response.is_success:
+                self._handle_error_response(response, endpoint)
 
-            return data
+            for item in _iter_page_items(response):
+                yield item
+
+            pages_fetched += 1
+            next_url = self._get_next_page_url(response)
+
+    def _encode_body(self, json_data: Optional[Dict[str, Any]]):
+        """
+        Serialize a request body on the orjson path when available.
+
+        Bodies are sent uncompressed: Canvas's nginx/Rails stack does not
+        inflate Content-Encoding: gzip request bodies, so compressing
+        uploads would break large valid writes.
+
+        Args:
+            json_data: JSON body data (or None for an empty body)
+
+        Returns:
+            (content bytes or None, headers to send)
+        """
+        if json_data is None:
+            return None, self._headers
+
+        return json_dumps(json_data), self._headers
 
     async def post(
         self,
@@ -216,22 +861,20 @@ class CanvasAPIClient:
         Raises:
             CanvasAPIError: On API errors
         """
-        async with httpx.AsyncClient(timeout=config.request_timeout) as client:
-            url = self._build_url(endpoint, params)
+        client = _get_http_client()
+        url = self._build_url(endpoint, params)
 
-            if config.enable_debug:
-                print(f"[DEBUG] POST {url}")
+        if config.enable_debug:
+            print(f"[DEBUG] POST {url}")
 
-            response = await client.post(
-                url,
-                headers=self._get_headers(),
-                json=json_data,
-            )
+        content, headers = self._encode_body(json_data)
+        response = await client.post(url, headers=headers, content=content)
 
-            if not response.is_success:
-                self._handle_error_response(response, endpoint)
+        if not response.is_success:
+            self._handle_error_response(response, endpoint)
 
-            return response.json()
+        self._invalidate_cache(endpoint)
+        return _json_loads(response)
 
     async def put(
         self,
@@ -253,22 +896,20 @@ class CanvasAPIClient:
         Raises:
             CanvasAPIError: On API errors
         """
-        async with httpx.AsyncClient(timeout=config.request_timeout) as client:
-            url = self._build_url(endpoint, params)
+        client = _get_http_client()
+        url = self._build_url(endpoint, params)
 
-            if config.enable_debug:
-                print(f"[DEBUG] PUT {url}")
+        if config.enable_debug:
+            print(f"[DEBUG] PUT {url}")
 
-            response = await client.put(
-                url,
-                headers=self._get_headers(),
-                json=json_data,
-            )
+        content, headers = self._encode_body(json_data)
+        response = await client.put(url, headers=headers, content=content)
 
-            if not response.is_success:
-                self._handle_error_response(response, endpoint)
+        if not response.is_success:
+            self._handle_error_response(response, endpoint)
 
-            return response.json()
+        self._invalidate_cache(endpoint)
+        return _json_loads(response)
 
     async def delete(
         self,
@@ -288,22 +929,24 @@ class CanvasAPIClient:
         Raises:
             CanvasAPIError: On API errors
         """
-        async with httpx.AsyncClient(timeout=config.request_timeout) as client:
-            url = self._build_url(endpoint, params)
+        client = _get_http_client()
+        url = self._build_url(endpoint, params)
 
-            if config.enable_debug:
-                print(f"[DEBUG] DELETE {url}")
+        if config.enable_debug:
+            print(f"[DEBUG] DELETE {url}")
 
-            response = await client.delete(url, headers=self._get_headers())
+        response = await client.delete(url, headers=self._headers)
 
-            if not response.is_success:
-                self._handle_error_response(response, endpoint)
+        if not response.is_success:
+            self._handle_error_response(response, endpoint)
 
-            # DELETE might return empty response
-            try:
-                return response.json()
-            except Exception:
-                return {}
+        self._invalidate_cache(endpoint)
+
+        # DELETE might return empty response
+        try:
+            return _json_loads(response)
+        except Exception:
+            return {}
 
     def _get_next_page_url(self, response: httpx.Response) -> Optional[str]:
         """
@@ -318,16 +961,41 @@ class CanvasAPIClient:
         Returns:
             Next page URL or None if no more pages
         """
+        return self._parse_link_header(response).get("next")
+
+    def _parse_link_header(self, response: httpx.Response) -> Dict[str, str]:
+        """
+        Parse the Link header into a rel -> URL mapping.
+
+        Canvas exposes "current", "next", "prev", "first" and "last" rels,
+        which allows the pagination code to compute the page count up front.
+
+        Args:
+            response: HTTP response object
+
+        Returns:
+            Mapping of rel name to URL (empty if no Link header)
+        """
         link_header = response.headers.get("Link")
         if not link_header:
-            return None
+            return {}
 
-        # Parse Link header to find rel="next"
-        links = link_header.split(",")
-        for link in links:
-            if 'rel="next"' in link:
-                # Extract URL between < and >
-                url_part = link.split(";")[0].strip()
-                return url_part.strip("<>")
+        # Single compiled-regex pass instead of split()/substring scans
+        return {rel: url for url, rel in _LINK_RE.findall(link_header)}
 
-        return None
+    @staticmethod
+    def _extract_page_number(url: str) -> Optional[int]:
+        """Extract the page query parameter from a pagination URL."""
+        query = parse_qs(urlparse(url).query)
+        try:
+            return int(query["page"][0])
+        except (KeyError, IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def _replace_page_param(url: str, page: int) -> str:
+        """Return a copy of a pagination URL pointing at a different page."""
+        parts = urlparse(url)
+        query = parse_qs(parts.query, keep_blank_values=True)
+        query["page"] = [str(page)]
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
@@ -74,6 +74,8 @@ class CanvasRateLimitError(CanvasAPIError):
     """Raised when rate limit is exceeded (429)."""
 
     def __init__(self, retry_after: Optional[int] = None, endpoint: Optional[str] = None):
+        self.retry_after = retry_after
+
         message = "Rate limit exceeded."
         if retry_after:
             message += f" Retry after {retry_after} seconds."
@@ -4,10 +4,22 @@ Comprehensive type definitions for all course-related responses.
 """
 
 from typing import Any, Dict, List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
+class CanvasModel(BaseModel):
+    """Base class for Canvas data models.
+
+    These models document the Canvas payload shapes but are not used to
+    validate responses on the hot path, so their core schemas are built
+    lazily on first use instead of at import — keeping serverless cold
+    starts from paying for 40+-field validator construction up front.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
 # ==================== Tool Request/Response Models ====================
 
 class ToolRequest(BaseModel):
@@ -17,18 +29,49 @@ class ToolRequest(BaseModel):
     args: Dict[str, Any] = Field(default_factory=dict, description="Tool arguments")
     canvasApiUrl: str = Field(description="Canvas API base URL")
     canvasApiToken: str = Field(description="Canvas API access token")
+    stream: bool = Field(default=False, description="Stream list results as NDJSON lines")
 
 
 class ToolResponse(BaseModel):
-    """Response format for MCP tool calls."""
+    """Response format for MCP tool calls.
+
+    Schema-only at runtime: /tools/call declares this as its
+    response_model for OpenAPI but serializes the result dict directly,
+    so no instance of this model is allocated per request.
+    """
 
     result: Any = Field(description="Tool execution result (usually dict or list)")
     error: Optional[str] = Field(default=None, description="Error message if tool failed")
 
 
+class BatchToolCall(BaseModel):
+    """One invocation inside a batch tool request."""
+
+    tool: str = Field(description="Name of the tool to execute")
+    args: Dict[str, Any] = Field(default_factory=dict, description="Tool arguments")
+
+
+class BatchToolRequest(BaseModel):
+    """Request format for executing several tools in one HTTP call."""
+
+    calls: List[BatchToolCall] = Field(description="Tool invocations to run concurrently")
+    canvasApiUrl: str = Field(description="Canvas API base URL")
+    canvasApiToken: str = Field(description="Canvas API access token")
+
+
+class BatchToolResponse(BaseModel):
+    """Response format for batch tool calls.
+
+    Schema-only at runtime, like ToolResponse: the endpoint serializes
+    the per-call result dicts directly.
+    """
+
+    results: List[ToolResponse] = Field(description="Per-call results, in request order")
+
+
 # ==================== Canvas Core Models ====================
 
-class EnrollmentGrades(BaseModel):
+class EnrollmentGrades(CanvasModel):
     """Grade information for an enrollment."""
 
     html_url: Optional[str] = None
@@ -42,7 +85,7 @@ class EnrollmentGrades(BaseModel):
     unposted_final_grade: Optional[str] = None
 
 
-class Enrollment(BaseModel):
+class Enrollment(CanvasModel):
     """Student enrollment information."""
 
     id: int
@@ -73,7 +116,7 @@ class Enrollment(BaseModel):
     current_period_computed_final_grade: Optional[str] = None
 
 
-class Term(BaseModel):
+class Term(CanvasModel):
     """Enrollment term information."""
 
     id: int
@@ -88,7 +131,7 @@ class Term(BaseModel):
     overrides: Optional[Dict[str, Any]] = None
 
 
-class GradingPeriod(BaseModel):
+class GradingPeriod(CanvasModel):
     """Grading period information."""
 
     id: int
@@ -100,13 +143,13 @@ class GradingPeriod(BaseModel):
     is_closed: bool = False
 
 
-class CourseCalendar(BaseModel):
+class CourseCalendar(CanvasModel):
     """Course calendar information."""
 
     ics: str  # ICS feed URL
 
 
-class Section(BaseModel):
+class Section(CanvasModel):
     """Course section information."""
 
     id: int
@@ -124,14 +167,14 @@ class Section(BaseModel):
     sis_import_id: Optional[int] = None
 
 
-class CoursePermissions(BaseModel):
+class CoursePermissions(CanvasModel):
     """User permissions within a course."""
 
     create_discussion_topic: bool = False
     create_announcement: bool = False
 
 
-class CourseProgress(BaseModel):
+class CourseProgress(CanvasModel):
     """Student's progress in a course."""
 
     requirement_count: int = 0
@@ -140,7 +183,7 @@ class CourseProgress(BaseModel):
     completed_at: Optional[datetime] = None
 
 
-class Course(BaseModel):
+class Course(CanvasModel):
     """
     Complete Canvas Course object with all possible fields.
     This includes all data that can be returned via include[] parameters.
@@ -235,7 +278,7 @@ class Course(BaseModel):
     enable_course_paces: Optional[bool] = None
 
 
-class User(BaseModel):
+class User(CanvasModel):
     """Canvas user information."""
 
     id: int
@@ -259,20 +302,20 @@ class User(BaseModel):
 
 # ==================== Response Models ====================
 
-class CoursesListResponse(BaseModel):
+class CoursesListResponse(CanvasModel):
     """Response for list_courses tool."""
 
     courses: List[Course]
     total: int
 
 
-class CourseDetailResponse(BaseModel):
+class CourseDetailResponse(CanvasModel):
     """Response for get_course tool."""
 
     course: Course
 
 
-class CourseUsersResponse(BaseModel):
+class CourseUsersResponse(CanvasModel):
     """Response for get_course_users tool."""
 
     users: List[User]
@@ -280,7 +323,7 @@ class CourseUsersResponse(BaseModel):
     total: int
 
 
-class PreviewHtmlResponse(BaseModel):
+class PreviewHtmlResponse(CanvasModel):
     """Response for preview_html tool."""
 
     html: str
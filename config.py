@@ -18,10 +18,13 @@ class Config(BaseModel):
     default_per_page: int = Field(default=100, description="Default pagination size")
     max_per_page: int = Field(default=100, description="Maximum pagination size")
     request_timeout: int = Field(default=30, description="HTTP request timeout in seconds")
+    max_page_concurrency: int = Field(default=8, description="Maximum concurrent page fetches during pagination")
 
     # Feature Flags
     enable_caching: bool = Field(default=False, description="Enable response caching")
+    cache_ttl: int = Field(default=60, description="Response cache TTL in seconds")
     enable_debug: bool = Field(default=False, description="Enable debug logging")
+    enable_profiling: bool = Field(default=False, description="Enable ?profile=1 request profiling")
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -30,8 +33,11 @@ class Config(BaseModel):
             default_per_page=int(os.getenv("DEFAULT_PER_PAGE", "100")),
             max_per_page=int(os.getenv("MAX_PER_PAGE", "100")),
             request_timeout=int(os.getenv("REQUEST_TIMEOUT", "30")),
+            max_page_concurrency=int(os.getenv("MAX_PAGE_CONCURRENCY", "8")),
             enable_caching=os.getenv("ENABLE_CACHING", "false").lower() == "true",
+            cache_ttl=int(os.getenv("CACHE_TTL", "60")),
             enable_debug=os.getenv("ENABLE_DEBUG", "false").lower() == "true",
+            enable_profiling=os.getenv("ENABLE_PROFILING", "false").lower() == "true",
         )
 
 
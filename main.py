@@ -6,13 +6,48 @@ All tools are automatically registered via the registry system.
 Returns JSON responses with complete Canvas API data for better LLM context.
 """
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+import hashlib
+import sys
 import traceback
 
+import httpx
+
+# ORJSONResponse serializes large Canvas payloads (lots of datetimes)
+# several times faster than the stdlib json default.
+try:
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+    import orjson  # noqa: F401  (ORJSONResponse needs it at render time)
+except ImportError:
+    from fastapi.responses import JSONResponse as _DefaultResponse
+
+# uvloop speeds up socket-heavy asyncio workloads like our paginated
+# Canvas fan-outs; it's optional and unavailable on Windows.
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+
 # Import models
-from api.models import ToolRequest, ToolResponse
+from api.models import BatchToolRequest, BatchToolResponse, ToolRequest, ToolResponse
 from api.exceptions import CanvasAPIError
+from api.client import close_http_client, json_dumps
+from api.cache import negative_cache, response_cache
+from config import config
+
+# Profiling is opt-in twice over (env flag + query param) so normal
+# traffic never pays for it; pyinstrument itself is an optional install.
+try:
+    from pyinstrument import Profiler
+except ImportError:
+    Profiler = None
 
 # Import tools (this triggers automatic registration)
 from tools.base import ToolContext
@@ -22,6 +57,7 @@ from tools.registry import registry
 from tools.courses import (
     list_courses,
     get_course,
+    get_course_dashboard,
     get_course_progress,
     get_course_users,
     preview_html,
@@ -44,11 +80,32 @@ from tools.quizzes import (
     list_quiz_submissions,
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Tie warm-up and teardown to the app's lifetime.
+
+    Tool modules are imported (and registered) at module import time, so
+    startup only needs to pre-build the lazily computed /tools payload
+    and ETag — that moves the work out of the first request, which on a
+    serverless cold start is the one that pays for everything.
+
+    The shared HTTP client is created lazily on first Canvas call so its
+    keep-alive connections are reused across requests; here we just make
+    sure it is closed cleanly on shutdown.
+    """
+    _get_tools_payload()
+    _get_tools_etag()
+    yield
+    await close_http_client()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Canvas MCP HTTP API",
     description="Student-focused Canvas LMS tools with comprehensive JSON responses",
     version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=_DefaultResponse,
 )
 
 # Configure CORS
@@ -61,12 +118,122 @@ app.add_middleware(
 )
 
 
+if config.enable_profiling and Profiler is not None:
+    from fastapi.responses import HTMLResponse
+
+    @app.middleware("http")
+    async def profile_request(request, call_next):
+        """Return a pyinstrument flame graph when ?profile=1 is passed."""
+        if not request.query_params.get("profile"):
+            return await call_next(request)
+
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        await call_next(request)
+        profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+
+# The registry is immutable once the tool imports above finish, so the
+# /tools payload and ETag are computed once and served as constants.
+_tools_payload: dict | None = None
+_tools_etag: str | None = None
+
+
+def _get_tools_payload() -> dict:
+    global _tools_payload
+    if _tools_payload is None:
+        tools_list = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "category": tool.category,
+            }
+            for tool in registry.list_all()
+        ]
+
+        by_category = {}
+        for tool_info in tools_list:
+            by_category.setdefault(tool_info["category"], []).append(tool_info)
+
+        _tools_payload = {
+            "tools": tools_list,
+            "total": len(tools_list),
+            "by_category": by_category,
+            "categories": list(by_category.keys()),
+        }
+    return _tools_payload
+
+
+def _get_tools_etag() -> str:
+    global _tools_etag
+    if _tools_etag is None:
+        names = ",".join(sorted(registry.list_tool_names())).encode("utf-8")
+        _tools_etag = '"' + hashlib.blake2b(names, digest_size=8).hexdigest() + '"'
+    return _tools_etag
+
+
+def _cached_metadata_response(request: Request, payload: dict, max_age: int = 300):
+    """Serve a constant payload with ETag/Cache-Control, honoring If-None-Match.
+
+    Repeat hits from well-behaved clients (and CDN edges) turn into 304s
+    that skip rendering the body entirely.
+    """
+    etag = _get_tools_etag()
+    headers = {
+        "ETag": etag,
+        # s-maxage lets Vercel's edge serve repeats without invoking the
+        # function; stale-while-revalidate hides the refresh latency
+        "Cache-Control": f"public, max-age={max_age}, s-maxage={max_age * 12}, "
+                         f"stale-while-revalidate=86400",
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return _DefaultResponse(payload, headers=headers)
+
+
+def _iter_ndjson(result):
+    """Frame a tool result as NDJSON lines.
+
+    A list result (or a dict result with exactly one list field) streams
+    one item per line, so clients can parse items as they arrive and the
+    server never renders the payload as a single buffer. A meta line with
+    the remaining scalar fields (and "_list_field" naming the streamed
+    key) comes first. Anything else degrades to a single JSON line.
+    """
+    if isinstance(result, list):
+        items, meta = result, None
+    elif isinstance(result, dict):
+        list_fields = [key for key, value in result.items() if isinstance(value, list)]
+        if len(list_fields) == 1:
+            key = list_fields[0]
+            items = result[key]
+            meta = {k: v for k, v in result.items() if k != key}
+            meta["_list_field"] = key
+        else:
+            items, meta = None, None
+    else:
+        items, meta = None, None
+
+    if items is None:
+        yield json_dumps(result) + b"\n"
+        return
+
+    if meta is not None:
+        yield json_dumps(meta) + b"\n"
+
+    for item in items:
+        yield json_dumps(item) + b"\n"
+
+
 # ==================== API Routes ====================
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """API root - returns service information."""
-    return {
+    return _cached_metadata_response(request, {
         "message": "Canvas MCP HTTP API",
         "version": "2.0.0",
         "description": "Comprehensive student-focused Canvas LMS tools",
@@ -75,21 +242,22 @@ async def root():
             "/health": "Health check",
             "/tools": "List available tools",
             "/tools/call": "Execute a tool",
+            "/tools/batch": "Execute several tools concurrently",
         },
-    }
+    })
 
 
 @app.get("/health")
-async def health():
+async def health(request: Request):
     """Health check endpoint."""
-    return {
+    return _cached_metadata_response(request, {
         "status": "healthy",
-        "tools_registered": len(registry.list_all()),
-    }
+        "tools_registered": registry.count(),
+    }, max_age=30)
 
 
 @app.get("/tools")
-async def list_tools():
+async def list_tools(request: Request):
     """
     List all available tools.
 
@@ -98,35 +266,13 @@ async def list_tools():
     - Description
     - Category
     """
-    tools_list = []
-
-    for tool in registry.list_all():
-        tools_list.append({
-            "name": tool.name,
-            "description": tool.description,
-            "category": tool.category,
-        })
-
-    # Group by category
-    by_category = {}
-    for tool_info in tools_list:
-        category = tool_info["category"]
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append(tool_info)
-
-    return {
-        "tools": tools_list,
-        "total": len(tools_list),
-        "by_category": by_category,
-        "categories": list(by_category.keys()),
-    }
+    return _cached_metadata_response(request, _get_tools_payload())
 
 
 @app.get("/tools/count")
 async def tool_count():
     """Return only the number of registered MCP tools."""
-    return {"tool_count": len(registry.list_all())}
+    return {"tool_count": registry.count()}
 
 
 @app.post("/tools/call", response_model=ToolResponse)
@@ -172,17 +318,18 @@ async def call_tool(request: ToolRequest):
             "error": null
         }
     """
-    try:
-        # Validate tool exists
-        try:
-            tool = registry.get(request.tool)
-        except KeyError as e:
-            available_tools = registry.list_tool_names()
-            raise HTTPException(
-                status_code=404,
-                detail=f"Tool '{request.tool}' not found. Available tools: {', '.join(available_tools)}",
-            )
+    # Validate tool exists — outside the handler try block so the 404
+    # isn't swallowed by the generic error-to-ToolResponse conversion,
+    # and via find() so the lookup is a plain dict probe
+    tool = registry.find(request.tool)
+    if tool is None:
+        available_tools = registry.list_tool_names()
+        raise HTTPException(
+            status_code=404,
+            detail=f"Tool '{request.tool}' not found. Available tools: {', '.join(available_tools)}",
+        )
 
+    try:
         # Create tool context
         ctx = ToolContext(
             api_url=request.canvasApiUrl,
@@ -193,30 +340,127 @@ async def call_tool(request: ToolRequest):
         # Execute tool
         result = await tool.run(ctx)
 
-        # Return successful response
-        return ToolResponse(result=result, error=None)
+        # Opt-in NDJSON framing for list-shaped results
+        if request.stream:
+            return StreamingResponse(
+                _iter_ndjson(result),
+                media_type="application/x-ndjson",
+                headers={
+                    # Tool results are per-user and incremental: never
+                    # cache them, and tell buffering proxies to pass
+                    # lines through as they are produced so clients see
+                    # the first items before the last page is rendered.
+                    "Cache-Control": "no-store",
+                    "X-Accel-Buffering": "no",
+                },
+            )
+
+        # Return a Response directly: the result is an arbitrary Canvas
+        # payload (ToolResponse.result is Any), so running it back
+        # through response_model validation and jsonable_encoder would
+        # walk the entire multi-KB structure for no added safety.
+        # response_model stays on the route for the OpenAPI schema.
+        return _DefaultResponse({"result": result, "error": None})
 
     except CanvasAPIError as e:
         # Canvas API errors (auth, not found, validation, etc.)
-        return ToolResponse(
-            result=None,
-            error=f"Canvas API Error [{e.status_code if e.status_code else 'Unknown'}]: {e.message}",
+        return _DefaultResponse({
+            "result": None,
+            "error": f"Canvas API Error [{e.status_code if e.status_code else 'Unknown'}]: {e.message}",
+        })
+
+    except httpx.RequestError as e:
+        # Network-level failures reaching Canvas (DNS, connect, timeout).
+        # Typed so they surface as a 502 without traceback formatting,
+        # and so CDNs/clients can treat them as retryable.
+        raise HTTPException(
+            status_code=502,
+            detail=f"Upstream Canvas request failed: {type(e).__name__}",
         )
 
     except ValueError as e:
         # Argument validation errors
-        return ToolResponse(
-            result=None,
-            error=f"Invalid arguments: {str(e)}",
+        return _DefaultResponse({
+            "result": None,
+            "error": f"Invalid arguments: {str(e)}",
+        })
+
+    except Exception:
+        # Unexpected errors: keep the traceback server-side. Only debug
+        # responses carry it; production callers get a static message, so
+        # exception details never leak and the response path stays cheap.
+        traceback.print_exc()
+        if app.debug:
+            return _DefaultResponse({
+                "result": None,
+                "error": f"Unexpected error: {traceback.format_exc()}",
+            })
+        return _DefaultResponse({"result": None, "error": "Unexpected error"})
+
+
+def _outcome_to_payload(outcome) -> dict:
+    """Convert one batch outcome (result or exception) to response form.
+
+    Mirrors the error formatting of /tools/call so a call fails the same
+    way whether it was issued alone or inside a batch.
+    """
+    if isinstance(outcome, CanvasAPIError):
+        return {
+            "result": None,
+            "error": f"Canvas API Error [{outcome.status_code if outcome.status_code else 'Unknown'}]: {outcome.message}",
+        }
+    if isinstance(outcome, ValueError):
+        return {"result": None, "error": f"Invalid arguments: {outcome}"}
+    if isinstance(outcome, httpx.RequestError):
+        return {"result": None, "error": f"Upstream Canvas request failed: {type(outcome).__name__}"}
+    if isinstance(outcome, BaseException):
+        traceback.print_exception(type(outcome), outcome, outcome.__traceback__)
+        return {"result": None, "error": "Unexpected error"}
+    return {"result": outcome, "error": None}
+
+
+@app.post("/tools/batch", response_model=BatchToolResponse)
+async def call_tools_batch(request: BatchToolRequest):
+    """
+    Execute several Canvas tools concurrently in one HTTP call.
+
+    All invocations share the caller's credentials and start at once, so
+    their Canvas requests overlap on the pooled connection instead of
+    paying one agent round-trip (plus serial Canvas RTTs) per tool.
+    Results come back in request order; each call succeeds or fails
+    independently with the same error format as /tools/call.
+
+    Example Request:
+        {
+            "calls": [
+                {"tool": "get_quiz", "args": {"courseId": 1, "quizId": 2}},
+                {"tool": "get_quiz_submission", "args": {"courseId": 1, "quizId": 2}}
+            ],
+            "canvasApiUrl": "https://canvas.example.com",
+            "canvasApiToken": "your-token-here"
+        }
+    """
+    # Reject unknown tool names up front, before any call runs
+    unknown = [call.tool for call in request.calls if registry.find(call.tool) is None]
+    if unknown:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown tools: {', '.join(unknown)}. Available tools: {', '.join(registry.list_tool_names())}",
         )
 
-    except Exception as e:
-        # Unexpected errors
-        error_details = traceback.format_exc() if app.debug else str(e)
-        return ToolResponse(
-            result=None,
-            error=f"Unexpected error: {error_details}",
+    outcomes = await registry.batch_execute([
+        (
+            call.tool,
+            ToolContext(
+                api_url=request.canvasApiUrl,
+                api_token=request.canvasApiToken,
+                args=call.args,
+            ),
         )
+        for call in request.calls
+    ])
+
+    return _DefaultResponse({"results": [_outcome_to_payload(outcome) for outcome in outcomes]})
 
 
 # ==================== Development/Debug Routes ====================
@@ -242,6 +486,17 @@ async def debug_tool(tool_name: str):
         )
 
 
+@app.post("/debug/cache/invalidate")
+async def invalidate_cache():
+    """
+    Drop all cached Canvas responses (positive and negative).
+    Useful when testing against live data that just changed.
+    """
+    response_cache.clear()
+    negative_cache.clear()
+    return {"status": "invalidated"}
+
+
 @app.get("/debug/registry")
 async def debug_registry():
     """
@@ -257,3 +512,24 @@ async def debug_registry():
             for category in registry.get_categories()
         },
     }
+
+
+# ==================== Local / Self-hosted Entry Point ====================
+
+if __name__ == "__main__":
+    # Vercel imports `app` directly and ignores this block. For local dev
+    # and self-hosting, run uvicorn with uvloop + httptools (both in
+    # requirements) and one worker per core.
+    import os
+
+    import uvicorn
+
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        log_level="warning",
+    )
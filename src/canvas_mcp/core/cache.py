@@ -82,10 +82,14 @@ async def get_course_id(course_identifier: str | int) -> str | None:
     return course_str
 
 
-async def get_course_code(course_id: str) -> str | None:
+async def get_course_code(course_id: str | int) -> str | None:
     """Get course code from ID, with caching."""
     global id_to_course_code_cache, course_code_to_id_cache
 
+    # Normalize: callers pass raw Canvas ids (ints) from response dicts;
+    # the cache is keyed by strings
+    course_id = str(course_id)
+
     # If it's already a code-like string with underscores
     if "_" in course_id:
         return course_id
@@ -110,5 +114,7 @@ async def get_course_code(course_id: str) -> str | None:
             course_code_to_id_cache[code] = course_id
         return code
 
-    # Last resort, return the ID
+    # Last resort: remember the miss so formatting loops calling us once
+    # per item don't re-fetch the same unresolvable course every time
+    id_to_course_code_cache[course_id] = course_id
     return course_id
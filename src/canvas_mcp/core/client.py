@@ -1,12 +1,28 @@
 """HTTP client and Canvas API utilities."""
 
+import asyncio
 import sys
 from typing import Any
 
 import httpx
 
+# orjson decodes large Canvas list responses noticeably faster than the
+# stdlib json module; fall back to stdlib when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .anonymization import anonymize_response_data
 
+# HTTP/2 lets the pagination and per-course gathers multiplex over one
+# TCP+TLS connection; it needs the optional h2 package.
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 # HTTP client will be initialized with configuration
 http_client: httpx.AsyncClient | None = None
 
@@ -72,14 +88,59 @@ def _get_http_client() -> httpx.AsyncClient:
         from .config import get_config
         config = get_config()
         http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
             headers={
                 'Authorization': f'Bearer {config.api_token}'
             },
-            timeout=config.api_timeout
+            timeout=config.api_timeout,
+            # One pooled client serves every tool call; keep-alive slots
+            # sized for the pagination and per-course fan-outs
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=60,
+            ),
         )
     return http_client
 
 
+async def close_http_client() -> None:
+    """Close the shared HTTP client (call on server shutdown)."""
+    global http_client
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+
+
+async def _send_get(client, url, params, data, use_form_data):
+    return await client.get(url, params=params)
+
+
+async def _send_post(client, url, params, data, use_form_data):
+    if use_form_data:
+        return await client.post(url, data=data)
+    return await client.post(url, json=data)
+
+
+async def _send_put(client, url, params, data, use_form_data):
+    if use_form_data:
+        return await client.put(url, data=data)
+    return await client.put(url, json=data)
+
+
+async def _send_delete(client, url, params, data, use_form_data):
+    return await client.delete(url, params=params)
+
+
+# O(1) method dispatch instead of re-comparing the method string per call
+_METHOD_SENDERS = {
+    "get": _send_get,
+    "post": _send_post,
+    "put": _send_put,
+    "delete": _send_delete,
+}
+
+
 async def make_canvas_request(
     method: str,
     endpoint: str,
@@ -108,25 +169,17 @@ async def make_canvas_request(
         if config.log_api_requests:
             print(f"Making {method.upper()} request to {url}", file=sys.stderr)
 
-        if method.lower() == "get":
-            response = await client.get(url, params=params)
-        elif method.lower() == "post":
-            if use_form_data:
-                response = await client.post(url, data=data)
-            else:
-                response = await client.post(url, json=data)
-        elif method.lower() == "put":
-            if use_form_data:
-                response = await client.put(url, data=data)
-            else:
-                response = await client.put(url, json=data)
-        elif method.lower() == "delete":
-            response = await client.delete(url, params=params)
-        else:
+        sender = _METHOD_SENDERS.get(method.lower())
+        if sender is None:
             return {"error": f"Unsupported method: {method}"}
 
+        response = await sender(client, url, params, data, use_form_data)
+
         response.raise_for_status()
-        result = response.json()
+        if orjson is not None:
+            result = orjson.loads(response.content)
+        else:
+            result = response.json()
 
         # Apply anonymization if enabled and this endpoint contains student data
         if config.enable_data_anonymization and _should_anonymize_endpoint(endpoint):
@@ -154,6 +207,54 @@ async def make_canvas_request(
         return {"error": f"Request failed: {str(e)}"}
 
 
+async def make_canvas_graphql_request(
+    query: str,
+    variables: dict[str, Any] | None = None
+) -> Any:
+    """Make a request to the Canvas GraphQL endpoint.
+
+    GraphQL lives at /api/graphql (not under /api/v1) and lets a tool
+    collapse an N-courses REST fan-out into a single round trip. Returns
+    the "data" payload, or an {"error": ...} dict in the same shape as
+    make_canvas_request so callers can fall back to REST.
+    """
+    try:
+        from .config import get_config
+        config = get_config()
+        client = _get_http_client()
+
+        base_url = config.api_base_url.rstrip('/')
+        if base_url.endswith('/api/v1'):
+            base_url = base_url[:-len('/api/v1')]
+        url = f"{base_url}/api/graphql"
+
+        if config.log_api_requests:
+            print(f"Making GraphQL request to {url}", file=sys.stderr)
+
+        response = await client.post(url, json={"query": query, "variables": variables or {}})
+        response.raise_for_status()
+        if orjson is not None:
+            result = orjson.loads(response.content)
+        else:
+            result = response.json()
+
+        if result.get("errors"):
+            return {"error": f"GraphQL errors: {result['errors']}"}
+        return result.get("data") or {}
+    except httpx.HTTPStatusError as e:
+        error_message = f"HTTP error: {e.response.status_code}"
+        print(f"GraphQL API error: {error_message}", file=sys.stderr)
+        return {"error": error_message}
+    except Exception as e:
+        print(f"GraphQL request failed: {str(e)}", file=sys.stderr)
+        return {"error": f"Request failed: {str(e)}"}
+
+
+# Pages fetched concurrently per wave once page 1 comes back full; latency
+# for an N-page listing becomes ~ceil(N / wave) round-trips instead of N.
+_PAGE_FAN_OUT = 8
+
+
 async def fetch_all_paginated_results(endpoint: str, params: dict[str, Any] | None = None) -> Any:
     """Fetch all results from a paginated Canvas API endpoint."""
     if params is None:
@@ -163,27 +264,42 @@ async def fetch_all_paginated_results(endpoint: str, params: dict[str, Any] | No
     if "per_page" not in params:
         params["per_page"] = 100
 
+    per_page = params.get("per_page", 100)
     all_results: list[Any] = []
     page = 1
 
     while True:
-        current_params = {**params, "page": page}
-        response = await make_canvas_request("get", endpoint, params=current_params)
+        # Page 1 goes out alone — most listings fit in one page and
+        # speculative extra requests would be pure waste. Only when a
+        # full page comes back do we fan out waves of subsequent pages.
+        pages = [page] if page == 1 else list(range(page, page + _PAGE_FAN_OUT))
+        responses = await asyncio.gather(
+            *(make_canvas_request("get", endpoint, params={**params, "page": p}) for p in pages)
+        )
 
-        if isinstance(response, dict) and "error" in response:
-            print(f"Error fetching page {page}: {response['error']}", file=sys.stderr)
-            return response
+        done = False
+        for p, response in zip(pages, responses):
+            if isinstance(response, dict) and "error" in response:
+                print(f"Error fetching page {p}: {response['error']}", file=sys.stderr)
+                return response
 
-        if not response or not isinstance(response, list) or len(response) == 0:
-            break
+            # Single emptiness test (the old code checked truthiness and
+            # len() separately)
+            if not isinstance(response, list) or not response:
+                done = True
+                break
+
+            all_results.extend(response)
 
-        all_results.extend(response)
+            # If we got fewer results than requested per page, we're done
+            if len(response) < per_page:
+                done = True
+                break
 
-        # If we got fewer results than requested per page, we're done
-        if len(response) < params.get("per_page", 100):
+        if done:
             break
 
-        page += 1
+        page = pages[-1] + 1
 
     # Apply anonymization to the complete result set if needed
     from .config import get_config
@@ -12,9 +12,11 @@ with the following conventions:
 """
 
 import datetime
+import functools
 import sys
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_date(date_str: str | None) -> datetime.datetime | None:
     """Parse a date string into a datetime object.
 
@@ -33,6 +35,16 @@ def parse_date(date_str: str | None) -> datetime.datetime | None:
     # Remove any surrounding whitespace
     date_str = date_str.strip()
 
+    # Fast path: Canvas emits ISO 8601, which fromisoformat parses in C
+    # without trying the whole strptime format list below
+    try:
+        dt = datetime.datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+        return dt
+    except ValueError:
+        pass
+
     # Try different date formats
     formats = [
         # ISO 8601 formats
@@ -65,6 +77,7 @@ def parse_date(date_str: str | None) -> datetime.datetime | None:
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date(date_str: str | None) -> str:
     """Format a date string to ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ) or return 'N/A' if None.
 
@@ -10,9 +10,12 @@ academic tracking.
 
 import argparse
 import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from mcp.server.fastmcp import FastMCP
 
+from .core.client import close_http_client
 from .core.config import get_config, validate_config
 from .resources import register_resources_and_prompts
 from .tools import (
@@ -29,10 +32,24 @@ from .tools import (
 )
 
 
+@asynccontextmanager
+async def _lifespan(mcp: FastMCP) -> AsyncIterator[None]:
+    """Release the pooled HTTP client inside the server's event loop.
+
+    Closing it after mcp.run() returns would need a fresh loop, and
+    aclosing connections whose transports belong to the dead loop raises
+    "Event loop is closed".
+    """
+    try:
+        yield
+    finally:
+        await close_http_client()
+
+
 def create_server() -> FastMCP:
     """Create and configure the Canvas MCP server."""
     config = get_config()
-    mcp = FastMCP(config.mcp_server_name)
+    mcp = FastMCP(config.mcp_server_name, lifespan=_lifespan)
     return mcp
 
 
@@ -150,7 +167,8 @@ def main() -> None:
         print(f"Server error: {e}", file=sys.stderr)
         sys.exit(1)
     finally:
-        # Cleanup
+        # The pooled HTTP client is closed by _lifespan while the server
+        # loop is still running
         print("Server stopped", file=sys.stderr)
 
 
@@ -1,6 +1,7 @@
 """Assignment-related MCP tools for Canvas API."""
 
 import datetime
+from operator import itemgetter
 from statistics import StatisticsError, mean, median, stdev
 
 from mcp.server.fastmcp import FastMCP
@@ -242,11 +243,11 @@ def register_assignment_tools(mcp: FastMCP):
 
         # Format the output
         course_display = await get_course_code(course_id) or course_identifier
-        output = f"Peer Reviews for Assignment {assignment_id} in course {course_display}:\n\n"
+        output = [f"Peer Reviews for Assignment {assignment_id} in course {course_display}:\n\n"]
 
         if not peer_reviews_by_submission:
-            output += "No peer reviews found for this assignment."
-            return output
+            output.append("No peer reviews found for this assignment.")
+            return "".join(output)
 
         # Display peer reviews grouped by reviewee
         for _submission_id, data in peer_reviews_by_submission.items():
@@ -254,10 +255,10 @@ def register_assignment_tools(mcp: FastMCP):
             reviewee_id = data["user_id"]
             reviews = data["peer_reviews"]
 
-            output += f"Reviews for {reviewee_name} (ID: {reviewee_id}):\n"
+            output.append(f"Reviews for {reviewee_name} (ID: {reviewee_id}):\n")
 
             if not reviews:
-                output += "  No peer reviews assigned.\n\n"
+                output.append("  No peer reviews assigned.\n\n")
                 continue
 
             for review in reviews:
@@ -265,19 +266,19 @@ def register_assignment_tools(mcp: FastMCP):
                 reviewer_name = user_map.get(reviewer_id, f"User {reviewer_id}")
                 workflow_state = review.get("workflow_state", "Unknown")
 
-                output += f"  Reviewer: {reviewer_name} (ID: {reviewer_id})\n"
-                output += f"  Status: {workflow_state}\n"
+                output.append(f"  Reviewer: {reviewer_name} (ID: {reviewer_id})\n")
+                output.append(f"  Status: {workflow_state}\n")
 
                 # Add assessment details if available
                 if "assessment" in review and review["assessment"]:
                     assessment = review["assessment"]
                     score = assessment.get("score")
                     if score is not None:
-                        output += f"  Score: {score}\n"
+                        output.append(f"  Score: {score}\n")
 
-                output += "\n"
+                output.append("\n")
 
-        return output
+        return "".join(output)
 
     @mcp.tool()
     @validate_params
@@ -436,16 +437,14 @@ def register_assignment_tools(mcp: FastMCP):
         # Track which students have submissions
         student_ids_with_submissions = set()
 
+        # One id -> name map instead of a linear scan per submission
+        student_names = {student.get("id"): student.get("name", "Unknown") for student in students}
+
         for submission in submissions:
             student_id = submission.get("user_id")
             student_ids_with_submissions.add(student_id)
 
-            # Find student name
-            student_name = "Unknown"
-            for student in students:
-                if student.get("id") == student_id:
-                    student_name = student.get("name", "Unknown")
-                    break
+            student_name = student_names.get(student_id, "Unknown")
 
             # Process submission data
             score = submission.get("score")
@@ -538,20 +537,20 @@ def register_assignment_tools(mcp: FastMCP):
 
         # Format the output
         course_display = await get_course_code(course_id) or course_identifier
-        output = f"Assignment Analytics for '{assignment_name}' in Course {course_display}\n\n"
+        output = [f"Assignment Analytics for '{assignment_name}' in Course {course_display}\n\n"]
 
         # Assignment details
-        output += "Assignment Details:\n"
-        output += f"  Due: {due_date_str}"
+        output.append("Assignment Details:\n")
+        output.append(f"  Due: {due_date_str}")
         if is_past_due:
-            output += " (Past Due)"
-        output += "\n"
+            output.append(" (Past Due)")
+        output.append("\n")
 
-        output += f"  Points Possible: {points_possible}\n"
-        output += f"  Published: {'Yes' if is_published else 'No'}\n\n"
+        output.append(f"  Points Possible: {points_possible}\n")
+        output.append(f"  Published: {'Yes' if is_published else 'No'}\n\n")
 
         # Submission statistics
-        output += "Submission Statistics:\n"
+        output.append("Submission Statistics:\n")
         total_students = submission_stats["total_students"]
         submitted = submission_stats["submitted_count"]
         graded = submission_stats["graded_count"]
@@ -564,38 +563,38 @@ def register_assignment_tools(mcp: FastMCP):
         missing_pct = (missing / total_students * 100) if total_students > 0 else 0
         late_pct = (late / submitted * 100) if submitted > 0 else 0
 
-        output += f"  Submitted: {submitted}/{total_students} ({round(submitted_pct, 1)}%)\n"
-        output += f"  Graded: {graded}/{total_students} ({round(graded_pct, 1)}%)\n"
-        output += f"  Missing: {missing}/{total_students} ({round(missing_pct, 1)}%)\n"
+        output.append(f"  Submitted: {submitted}/{total_students} ({round(submitted_pct, 1)}%)\n")
+        output.append(f"  Graded: {graded}/{total_students} ({round(graded_pct, 1)}%)\n")
+        output.append(f"  Missing: {missing}/{total_students} ({round(missing_pct, 1)}%)\n")
         if submitted > 0:
-            output += f"  Late: {late}/{submitted} ({round(late_pct, 1)}% of submissions)\n"
-        output += f"  Excused: {submission_stats['excused_count']}\n\n"
+            output.append(f"  Late: {late}/{submitted} ({round(late_pct, 1)}% of submissions)\n")
+        output.append(f"  Excused: {submission_stats['excused_count']}\n\n")
 
         # Grade statistics
         if scores:
-            output += "Grade Statistics:\n"
-            output += f"  Average Score: {round(avg_score, 2)}/{points_possible} ({round(avg_percentage, 1)}%)\n"
-            output += f"  Median Score: {round(median_score, 2)}/{points_possible} ({round((median_score/points_possible)*100, 1)}%)\n"
-            output += f"  Standard Deviation: {round(std_dev, 2)}\n"
+            output.append("Grade Statistics:\n")
+            output.append(f"  Average Score: {round(avg_score, 2)}/{points_possible} ({round(avg_percentage, 1)}%)\n")
+            output.append(f"  Median Score: {round(median_score, 2)}/{points_possible} ({round((median_score/points_possible)*100, 1)}%)\n")
+            output.append(f"  Standard Deviation: {round(std_dev, 2)}\n")
 
             # High/Low scores
             if low_scoring_students:
-                output += "\nStudents Scoring Below 70%:\n"
-                for name, score, percentage in sorted(low_scoring_students, key=lambda x: x[2]):
-                    output += f"  {name}: {round(score, 1)}/{points_possible} ({round(percentage, 1)}%)\n"
+                output.append("\nStudents Scoring Below 70%:\n")
+                for name, score, percentage in sorted(low_scoring_students, key=itemgetter(2)):
+                    output.append(f"  {name}: {round(score, 1)}/{points_possible} ({round(percentage, 1)}%)\n")
 
             if high_scoring_students:
-                output += "\nStudents Scoring Above 90%:\n"
-                for name, score, percentage in sorted(high_scoring_students, key=lambda x: x[2], reverse=True):
-                    output += f"  {name}: {round(score, 1)}/{points_possible} ({round(percentage, 1)}%)\n"
+                output.append("\nStudents Scoring Above 90%:\n")
+                for name, score, percentage in sorted(high_scoring_students, key=itemgetter(2), reverse=True):
+                    output.append(f"  {name}: {round(score, 1)}/{points_possible} ({round(percentage, 1)}%)\n")
 
         # Missing students
         if missing_students:
-            output += "\nStudents Missing Submission:\n"
+            output.append("\nStudents Missing Submission:\n")
             # Sort alphabetically and show first 10
             for name in sorted(missing_students)[:10]:
-                output += f"  {name}\n"
+                output.append(f"  {name}\n")
             if len(missing_students) > 10:
-                output += f"  ...and {len(missing_students) - 10} more\n"
+                output.append(f"  ...and {len(missing_students) - 10} more\n")
 
-        return output
+        return "".join(output)
@@ -1,6 +1,8 @@
 """Course-related MCP tools for Canvas API."""
 
+import heapq
 import re
+from collections import ChainMap
 
 from mcp.server.fastmcp import FastMCP
 
@@ -15,6 +17,12 @@ from ..core.dates import format_date
 from ..core.validation import validate_params
 
 
+# Row template hoisted to module scope so the format spec is parsed once,
+# not rebuilt per course in the listing loop
+_COURSE_ROW_TMPL = "Code: {course_code}\nName: {name}\nID: {id}\n"
+_COURSE_ROW_DEFAULTS = {"course_code": "No code", "name": "Unnamed course", "id": None}
+
+
 def strip_html_tags(html_content: str) -> str:
     """Remove HTML tags and clean up text content."""
     if not html_content:
@@ -74,14 +82,11 @@ def register_course_tools(mcp: FastMCP):
                 course_code_to_id_cache[course_code] = course_id
                 id_to_course_code_cache[course_id] = course_code
 
-        courses_info = []
-        for course in courses:
-            course_id = course.get("id")
-            name = course.get("name", "Unnamed course")
-            code = course.get("course_code", "No code")
-
-            # Emphasize code in the output
-            courses_info.append(f"Code: {code}\nName: {name}\nID: {course_id}\n")
+        # Emphasize code in the output; defaults fill in for missing fields
+        courses_info = [
+            _COURSE_ROW_TMPL.format_map(ChainMap(course, _COURSE_ROW_DEFAULTS))
+            for course in courses
+        ]
 
         return "Courses:\n\n" + "\n".join(courses_info)
 
@@ -162,11 +167,11 @@ def register_course_tools(mcp: FastMCP):
 
                 if published_pages:
                     pages_summary.append("\nRecent Published Pages:")
-                    # Sort by updated_at and show first 5
-                    sorted_pages = sorted(published_pages,
-                                        key=lambda x: x.get("updated_at", ""),
-                                        reverse=True)
-                    for page in sorted_pages[:5]:
+                    # Top 5 by updated_at; nlargest is O(n log 5) and skips
+                    # sorting (and allocating) the full list
+                    sorted_pages = heapq.nlargest(5, published_pages,
+                                                  key=lambda x: x.get("updated_at", ""))
+                    for page in sorted_pages:
                         title = page.get("title", "Untitled")
                         updated = format_date(page.get("updated_at"))
                         pages_summary.append(f"    {title} (Updated: {updated})")
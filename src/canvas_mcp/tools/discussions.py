@@ -1,5 +1,6 @@
 """Discussion and announcement MCP tools for Canvas API."""
 
+import html
 import json
 import re
 from datetime import datetime
@@ -13,6 +14,36 @@ from ..core.dates import format_date, truncate_text
 from ..core.validation import validate_params
 
 
+# Compiled once at module scope; per-call re.sub() recompiles the pattern
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _plain_message(item: dict) -> str:
+    """Strip tags and entities from an item's HTML message, caching the result.
+
+    The cleaned text is stored back on the item under "_plain_text" so
+    repeated rendering (or a cached response) never re-scrubs the HTML.
+    """
+    text = item.get("_plain_text")
+    if text is None:
+        message = item.get("message") or ""
+        # Strip tags before unescaping so escaped markup in the text
+        # (e.g. "&lt;b&gt;") survives as literal characters
+        text = html.unescape(_TAG_RE.sub('', message)).strip()
+        item["_plain_text"] = text
+    return text
+
+
+def _message_snippet(item: dict, limit: int = 200) -> str:
+    """Return a bounded single-line preview of an item's message."""
+    text = _plain_message(item).replace("\n", " ").strip()
+    if not text:
+        return "[No content]"
+    if len(text) > limit:
+        return text[:limit] + "..."
+    return text
+
+
 def register_discussion_tools(mcp: FastMCP):
     """Register all discussion and announcement MCP tools."""
 
@@ -105,30 +136,30 @@ def register_discussion_tools(mcp: FastMCP):
         course_display = await get_course_code(course_id) or course_identifier
         topic_type = "Announcement" if is_announcement else "Discussion"
 
-        result = f"{topic_type} Details for Course {course_display}:\n\n"
-        result += f"Title: {title}\n"
-        result += f"ID: {topic_id}\n"
-        result += f"Type: {topic_type}\n"
-        result += f"Author: {author_name} (ID: {author_id})\n"
-        result += f"Created: {created_at}\n"
-        result += f"Posted: {posted_at}\n"
+        result = [f"{topic_type} Details for Course {course_display}:\n\n"]
+        result.append(f"Title: {title}\n")
+        result.append(f"ID: {topic_id}\n")
+        result.append(f"Type: {topic_type}\n")
+        result.append(f"Author: {author_name} (ID: {author_id})\n")
+        result.append(f"Created: {created_at}\n")
+        result.append(f"Posted: {posted_at}\n")
 
         if locked:
-            result += "Status: Locked\n"
+            result.append("Status: Locked\n")
         if pinned:
-            result += "Pinned: Yes\n"
+            result.append("Pinned: Yes\n")
         if require_initial_post:
-            result += "Requires Initial Post: Yes\n"
+            result.append("Requires Initial Post: Yes\n")
 
-        result += f"Total Entries: {discussion_entries_count}\n"
+        result.append(f"Total Entries: {discussion_entries_count}\n")
         if unread_count > 0:
-            result += f"Unread Entries: {unread_count}\n"
-        result += f"Read State: {read_state.title()}\n"
+            result.append(f"Unread Entries: {unread_count}\n")
+        result.append(f"Read State: {read_state.title()}\n")
 
         if message:
-            result += f"\nContent:\n{message}"
+            result.append(f"\nContent:\n{message}")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -235,29 +266,20 @@ def register_discussion_tools(mcp: FastMCP):
             # Get message content
             if include_full_content and entry_id_str in full_entries_map:
                 # Use full content from enhanced fetch
-                full_entry = full_entries_map[entry_id_str]
-                message = full_entry.get("message", entry.get("message", ""))
+                source = full_entries_map[entry_id_str]
             else:
                 # Use basic content from original entry
-                message = entry.get("message", "")
-
-            # Process message content
-            import re
-            if message:
-                if include_full_content:
-                    # For full content, clean HTML but keep the full text
-                    message_display = re.sub(r'<[^>]+>', '', message)
-                    message_display = message_display.strip()
-                    if not message_display:
-                        message_display = "[Content contains only HTML/formatting]"
-                else:
-                    # For preview, truncate as before
-                    message_preview = re.sub(r'<[^>]+>', '', message)
-                    if len(message_preview) > 300:
-                        message_preview = message_preview[:300] + "..."
-                    message_display = message_preview.replace("\n", " ").strip()
+                source = entry
+
+            # Process message content (scrubbed once per entry, then cached)
+            if include_full_content:
+                # For full content, clean HTML but keep the full text
+                message_display = _plain_message(source)
+                if not message_display:
+                    message_display = "[Content contains only HTML/formatting]"
             else:
-                message_display = "[No content]"
+                # For preview, truncate as before
+                message_display = _message_snippet(source, limit=300)
 
             # Handle replies
             replies_info = ""
@@ -287,22 +309,14 @@ def register_discussion_tools(mcp: FastMCP):
                         pass  # Use what we have
 
                 if replies:
-                    replies_info = f"\n  Replies ({len(replies)}):\n"
+                    reply_lines = [f"\n  Replies ({len(replies)}):\n"]
                     for i, reply in enumerate(replies, 1):
                         reply_user = reply.get("user_name", "Unknown")
                         reply_created = format_date(reply.get("created_at"))
-                        reply_msg = reply.get("message", "")
-
-                        # Clean reply message
-                        if reply_msg:
-                            reply_clean = re.sub(r'<[^>]+>', '', reply_msg)
-                            if len(reply_clean) > 200:
-                                reply_clean = reply_clean[:200] + "..."
-                            reply_clean = reply_clean.replace("\n", " ").strip()
-                        else:
-                            reply_clean = "[No content]"
-
-                        replies_info += f"    {i}. {reply_user} ({reply_created}): {reply_clean}\n"
+                        reply_clean = _message_snippet(reply)
+
+                        reply_lines.append(f"    {i}. {reply_user} ({reply_created}): {reply_clean}\n")
+                    replies_info = "".join(reply_lines)
                 else:
                     replies_info = "\n  No replies found.\n"
             else:
@@ -320,16 +334,16 @@ def register_discussion_tools(mcp: FastMCP):
                 replies_info = f"\n  Replies: {total_replies_text}"
 
             # Build entry info
-            entry_info = f"Entry ID: {entry_id}\n"
-            entry_info += f"Author: {user_name} (ID: {user_id})\n"
-            entry_info += f"Posted: {created_at}{replies_info}\n"
+            entry_info = [f"Entry ID: {entry_id}\n"]
+            entry_info.append(f"Author: {user_name} (ID: {user_id})\n")
+            entry_info.append(f"Posted: {created_at}{replies_info}\n")
 
             if include_full_content:
-                entry_info += f"Full Content:\n{message_display}\n"
+                entry_info.append(f"Full Content:\n{message_display}\n")
             else:
-                entry_info += f"Content Preview: {message_display}\n"
+                entry_info.append(f"Content Preview: {message_display}\n")
 
-            entries_info.append(entry_info)
+            entries_info.append("".join(entry_info))
 
         # Add helpful footer information
         footer = ""
@@ -446,23 +460,23 @@ def register_discussion_tools(mcp: FastMCP):
         updated_at = format_date(entry_response.get("updated_at"))
         read_state = entry_response.get("read_state", "unknown")
 
-        result = f"Discussion Entry Details for '{topic_title}' in Course {course_display}:\n\n"
-        result += f"Topic ID: {topic_id}\n"
-        result += f"Entry ID: {entry_id}\n"
-        result += f"Author: {user_name} (ID: {user_id})\n"
-        result += f"Posted: {created_at}\n"
+        result = [f"Discussion Entry Details for '{topic_title}' in Course {course_display}:\n\n"]
+        result.append(f"Topic ID: {topic_id}\n")
+        result.append(f"Entry ID: {entry_id}\n")
+        result.append(f"Author: {user_name} (ID: {user_id})\n")
+        result.append(f"Posted: {created_at}\n")
 
         if updated_at != "N/A" and updated_at != created_at:
-            result += f"Updated: {updated_at}\n"
+            result.append(f"Updated: {updated_at}\n")
 
-        result += f"Read State: {read_state.title()}\n"
-        result += f"\nContent:\n{message}\n"
+        result.append(f"Read State: {read_state.title()}\n")
+        result.append(f"\nContent:\n{message}\n")
 
         # Format replies
         if include_replies:
             if replies:
-                result += f"\nReplies ({len(replies)}):\n"
-                result += "=" * 50 + "\n"
+                result.append(f"\nReplies ({len(replies)}):\n")
+                result.append("=" * 50 + "\n")
 
                 for i, reply in enumerate(replies, 1):
                     reply_id = reply.get("id")
@@ -470,17 +484,17 @@ def register_discussion_tools(mcp: FastMCP):
                     reply_message = reply.get("message", "")
                     reply_created_at = format_date(reply.get("created_at"))
 
-                    result += f"\nReply #{i}:\n"
-                    result += f"Reply ID: {reply_id}\n"
-                    result += f"Author: {reply_user_name}\n"
-                    result += f"Posted: {reply_created_at}\n"
-                    result += f"Content:\n{reply_message}\n"
+                    result.append(f"\nReply #{i}:\n")
+                    result.append(f"Reply ID: {reply_id}\n")
+                    result.append(f"Author: {reply_user_name}\n")
+                    result.append(f"Posted: {reply_created_at}\n")
+                    result.append(f"Content:\n{reply_message}\n")
             else:
-                result += "\nNo replies found for this entry."
+                result.append("\nNo replies found for this entry.")
         else:
-            result += "\n(Replies not included - set include_replies=True to fetch them)"
+            result.append("\n(Replies not included - set include_replies=True to fetch them)")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -518,28 +532,20 @@ def register_discussion_tools(mcp: FastMCP):
             topic_title = topic_response.get("title", "Unknown Topic")
 
         course_display = await get_course_code(course_id) or course_identifier
-        result = f"Discussion '{topic_title}' in Course {course_display}:\n\n"
+        result = [f"Discussion '{topic_title}' in Course {course_display}:\n\n"]
 
         # Process each entry
         for entry in entries:
             entry_id = entry.get("id")
             user_name = entry.get("user_name", "Unknown user")
-            message = entry.get("message", "")
             created_at = format_date(entry.get("created_at"))
 
-            # Clean up message for display
-            import re
-            if message:
-                message_preview = re.sub(r'<[^>]+>', '', message)
-                if len(message_preview) > 200:
-                    message_preview = message_preview[:200] + "..."
-                message_preview = message_preview.replace("\n", " ").strip()
-            else:
-                message_preview = "[No content]"
+            # Clean up message for display (cached on the entry)
+            message_preview = _message_snippet(entry)
 
-            result += f"📝 Entry {entry_id} by {user_name}\n"
-            result += f"   Posted: {created_at}\n"
-            result += f"   Content: {message_preview}\n"
+            result.append(f"📝 Entry {entry_id} by {user_name}\n")
+            result.append(f"   Posted: {created_at}\n")
+            result.append(f"   Content: {message_preview}\n")
 
             # Handle replies
             if include_replies:
@@ -566,44 +572,35 @@ def register_discussion_tools(mcp: FastMCP):
 
                 # Display replies
                 if replies:
-                    result += f"   💬 Replies ({len(replies)}):\n"
+                    result.append(f"   💬 Replies ({len(replies)}):\n")
                     for i, reply in enumerate(replies, 1):
                         reply_user = reply.get("user_name", "Unknown")
                         reply_created = format_date(reply.get("created_at"))
-                        reply_msg = reply.get("message", "")
-
-                        # Clean reply message
-                        if reply_msg:
-                            reply_preview = re.sub(r'<[^>]+>', '', reply_msg)
-                            if len(reply_preview) > 150:
-                                reply_preview = reply_preview[:150] + "..."
-                            reply_preview = reply_preview.replace("\n", " ").strip()
-                        else:
-                            reply_preview = "[No content]"
-
-                        result += f"      └─ Reply {i} by {reply_user} ({reply_created}): {reply_preview}\n"
+                        reply_preview = _message_snippet(reply, limit=150)
+
+                        result.append(f"      └─ Reply {i} by {reply_user} ({reply_created}): {reply_preview}\n")
                 else:
                     recent_count = len(entry.get("recent_replies", []))
                     has_more = entry.get("has_more_replies", False)
                     if recent_count > 0 or has_more:
-                        result += f"   💬 Replies: {recent_count}{'+ (has more)' if has_more else ''} (failed to fetch details)\n"
+                        result.append(f"   💬 Replies: {recent_count}{'+ (has more)' if has_more else ''} (failed to fetch details)\n")
                     else:
-                        result += "   💬 No replies\n"
+                        result.append("   💬 No replies\n")
             else:
                 # Just show reply count without fetching
                 recent_count = len(entry.get("recent_replies", []))
                 has_more = entry.get("has_more_replies", False)
                 if recent_count > 0 or has_more:
-                    result += f"   💬 Replies: {recent_count}{'+ (has more)' if has_more else ''}\n"
+                    result.append(f"   💬 Replies: {recent_count}{'+ (has more)' if has_more else ''}\n")
                 else:
-                    result += "   💬 No replies\n"
+                    result.append("   💬 No replies\n")
 
-            result += "\n"
+            result.append("\n")
 
         if not include_replies:
-            result += "\n💡 Tip: Use include_replies=True to fetch detailed reply content"
+            result.append("\n💡 Tip: Use include_replies=True to fetch detailed reply content")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -649,15 +646,15 @@ def register_discussion_tools(mcp: FastMCP):
 
         # Build confirmation message
         course_display = await get_course_code(course_id) or course_identifier
-        result = "Discussion entry posted successfully!\n\n"
-        result += f"Course: {course_display}\n"
-        result += f"Discussion Topic: {topic_title} (ID: {topic_id})\n"
-        result += f"Entry ID: {entry_id}\n"
-        result += f"Entry Author: {entry_user_name}\n"
-        result += f"Posted: {entry_created_at}\n\n"
-        result += f"Your Entry:\n{message}\n"
+        result = ["Discussion entry posted successfully!\n\n"]
+        result.append(f"Course: {course_display}\n")
+        result.append(f"Discussion Topic: {topic_title} (ID: {topic_id})\n")
+        result.append(f"Entry ID: {entry_id}\n")
+        result.append(f"Entry Author: {entry_user_name}\n")
+        result.append(f"Posted: {entry_created_at}\n\n")
+        result.append(f"Your Entry:\n{message}\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -757,21 +754,29 @@ def register_discussion_tools(mcp: FastMCP):
     # ===== ANNOUNCEMENT TOOLS =====
 
     @mcp.tool()
-    async def list_announcements(course_identifier: str) -> str:
-        """List announcements for a specific course.
+    async def list_announcements(course_identifier: str | int | list[str | int]) -> str:
+        """List announcements for one or more courses.
 
         Args:
-            course_identifier: The Canvas course code (e.g., badm_554_120251_246794) or ID
+            course_identifier: The Canvas course code (e.g., badm_554_120251_246794)
+                              or ID, or a list of them. Multiple courses are
+                              fetched in a single aggregated request.
         """
-        course_id = await get_course_id(course_identifier)
+        identifiers = course_identifier if isinstance(course_identifier, list) else [course_identifier]
+        course_ids = [await get_course_id(identifier) for identifier in identifiers]
 
+        # The aggregated /announcements endpoint accepts many context_codes[]
+        # at once, so N courses cost one request instead of N. Without explicit
+        # dates Canvas only returns the last 14 days, so pass a wide window to
+        # match the full history the per-course endpoint used to return.
         params = {
-            "include[]": ["announcement"],
-            "only_announcements": True,
+            "context_codes[]": [f"course_{course_id}" for course_id in course_ids],
+            "start_date": "1900-01-01",
+            "end_date": "2999-12-31",
             "per_page": 100
         }
 
-        announcements = await fetch_all_paginated_results(f"/courses/{course_id}/discussion_topics", params)
+        announcements = await fetch_all_paginated_results("/announcements", params)
 
         if isinstance(announcements, dict) and "error" in announcements:
             return f"Error fetching announcements: {announcements['error']}"
@@ -779,17 +784,29 @@ def register_discussion_tools(mcp: FastMCP):
         if not announcements:
             return f"No announcements found for course {course_identifier}."
 
+        multiple_courses = len(course_ids) > 1
+
         announcements_info = []
         for announcement in announcements:
             announcement_id = announcement.get("id")
             title = announcement.get("title", "Untitled announcement")
             posted_at = format_date(announcement.get("posted_at"))
+            # Scrubbed once and cached on the announcement dict
+            snippet = _message_snippet(announcement)
 
-            announcements_info.append(
-                f"ID: {announcement_id}\nTitle: {title}\nPosted: {posted_at}\n"
-            )
+            info = f"ID: {announcement_id}\nTitle: {title}\nPosted: {posted_at}\nMessage: {snippet}\n"
 
-        course_display = await get_course_code(course_id) or course_identifier
+            if multiple_courses:
+                announcement_course_id = announcement.get("context_code", "").removeprefix("course_")
+                announcement_display = await get_course_code(announcement_course_id) or announcement_course_id
+                info = f"Course: {announcement_display}\n" + info
+
+            announcements_info.append(info)
+
+        if multiple_courses:
+            return f"Announcements for {len(course_ids)} Courses:\n\n" + "\n".join(announcements_info)
+
+        course_display = await get_course_code(course_ids[0]) or course_identifier
         return f"Announcements for Course {course_display}:\n\n" + "\n".join(announcements_info)
 
     @mcp.tool()
@@ -982,24 +999,24 @@ def register_discussion_tools(mcp: FastMCP):
         }
 
         course_display = await get_course_code(course_id) or course_identifier
-        result = f"Bulk deletion results for course {course_display}:\n\n"
-        result += f"Summary: {summary['successful']} successful, {summary['failed']} failed out of {summary['total']} total\n\n"
+        result = [f"Bulk deletion results for course {course_display}:\n\n"]
+        result.append(f"Summary: {summary['successful']} successful, {summary['failed']} failed out of {summary['total']} total\n\n")
 
         if successful:
-            result += "Successfully deleted:\n"
+            result.append("Successfully deleted:\n")
             for item in successful:
-                result += f"  - ID: {item['id']}, Title: {item['title']}\n"
-            result += "\n"
+                result.append(f"  - ID: {item['id']}, Title: {item['title']}\n")
+            result.append("\n")
 
         if failed:
-            result += "Failed to delete:\n"
+            result.append("Failed to delete:\n")
             for item in failed:
-                result += f"  - ID: {item['id']}"
+                result.append(f"  - ID: {item['id']}")
                 if 'title' in item:
-                    result += f", Title: {item['title']}"
-                result += f", Error: {item['error']}\n"
+                    result.append(f", Title: {item['title']}")
+                result.append(f", Error: {item['error']}\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -1055,14 +1072,14 @@ def register_discussion_tools(mcp: FastMCP):
         # Handle dry run
         if dry_run:
             course_display = await get_course_code(course_id) or course_identifier
-            result = f"DRY RUN - Would delete announcement from course {course_display}:\n\n"
-            result += f"ID: {announcement_id}\n"
-            result += f"Title: {actual_title}\n"
-            result += "Status: dry_run\n"
-            result += "Message: Announcement would be deleted (dry run mode)\n"
+            result = [f"DRY RUN - Would delete announcement from course {course_display}:\n\n"]
+            result.append(f"ID: {announcement_id}\n")
+            result.append(f"Title: {actual_title}\n")
+            result.append("Status: dry_run\n")
+            result.append("Message: Announcement would be deleted (dry run mode)\n")
             if require_title_match:
-                result += f"Title matched: {title_matched}\n"
-            return result
+                result.append(f"Title matched: {title_matched}\n")
+            return "".join(result)
 
         # Proceed with actual deletion
         response = await make_canvas_request(
@@ -1073,15 +1090,15 @@ def register_discussion_tools(mcp: FastMCP):
             return f"Error deleting announcement '{actual_title}': {response['error']}"
 
         course_display = await get_course_code(course_id) or course_identifier
-        result = f"Announcement deleted successfully from course {course_display}:\n\n"
-        result += f"ID: {announcement_id}\n"
-        result += f"Title: {actual_title}\n"
-        result += "Status: deleted\n"
-        result += "Message: Announcement deleted successfully\n"
+        result = [f"Announcement deleted successfully from course {course_display}:\n\n"]
+        result.append(f"ID: {announcement_id}\n")
+        result.append(f"Title: {actual_title}\n")
+        result.append("Status: deleted\n")
+        result.append("Message: Announcement deleted successfully\n")
         if require_title_match:
-            result += f"Title matched: {title_matched}\n"
+            result.append(f"Title matched: {title_matched}\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -1187,27 +1204,27 @@ def register_discussion_tools(mcp: FastMCP):
             limit_reached = True
 
         course_display = await get_course_code(course_id) or course_identifier
-        result = f"Criteria-based deletion results for course {course_display}:\n\n"
-        result += f"Search criteria: {json.dumps(criteria, indent=2)}\n\n"
-        result += f"Matched {len(matched)} announcements"
+        result = [f"Criteria-based deletion results for course {course_display}:\n\n"]
+        result.append(f"Search criteria: {json.dumps(criteria, indent=2)}\n\n")
+        result.append(f"Matched {len(matched)} announcements")
         if limit_reached:
-            result += f" (limited to {limit})"
-        result += "\n\n"
+            result.append(f" (limited to {limit})")
+        result.append("\n\n")
 
         if not matched:
-            result += "No announcements matched the specified criteria."
-            return result
+            result.append("No announcements matched the specified criteria.")
+            return "".join(result)
 
         # Show what was matched
-        result += "Matched announcements:\n"
+        result.append("Matched announcements:\n")
         for announcement in matched:
-            result += f"  - ID: {announcement.get('id')}, Title: {announcement.get('title', 'Untitled')}, Posted: {format_date(announcement.get('posted_at'))}\n"
-        result += "\n"
+            result.append(f"  - ID: {announcement.get('id')}, Title: {announcement.get('title', 'Untitled')}, Posted: {format_date(announcement.get('posted_at'))}\n")
+        result.append("\n")
 
         if dry_run:
-            result += "DRY RUN: No announcements were actually deleted.\n"
-            result += "Set dry_run=False to perform actual deletions."
-            return result
+            result.append("DRY RUN: No announcements were actually deleted.\n")
+            result.append("Set dry_run=False to perform actual deletions.")
+            return "".join(result)
 
         # Perform actual deletions
         deleted = []
@@ -1239,17 +1256,17 @@ def register_discussion_tools(mcp: FastMCP):
                     "error": str(e)
                 })
 
-        result += f"Deletion completed: {len(deleted)} successful, {len(failed)} failed\n\n"
+        result.append(f"Deletion completed: {len(deleted)} successful, {len(failed)} failed\n\n")
 
         if deleted:
-            result += "Successfully deleted:\n"
+            result.append("Successfully deleted:\n")
             for item in deleted:
-                result += f"  - ID: {item['id']}, Title: {item['title']}\n"
-            result += "\n"
+                result.append(f"  - ID: {item['id']}, Title: {item['title']}\n")
+            result.append("\n")
 
         if failed:
-            result += "Failed to delete:\n"
+            result.append("Failed to delete:\n")
             for item in failed:
-                result += f"  - ID: {item['id']}, Title: {item['title']}, Error: {item['error']}\n"
+                result.append(f"  - ID: {item['id']}, Title: {item['title']}, Error: {item['error']}\n")
 
-        return result
+        return "".join(result)
@@ -152,17 +152,17 @@ def register_other_tools(mcp: FastMCP):
 
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = f"Page Details for Course {course_display}:\n\n"
-        result += f"Title: {title}\n"
-        result += f"URL: {url}\n"
-        result += f"Status: {', '.join(status_info)}\n"
-        result += f"Created: {created_at}\n"
-        result += f"Updated: {updated_at}\n"
-        result += f"Last Edited By: {editor_name}\n"
-        result += f"Editing Roles: {editing_roles or 'Not specified'}\n"
-        result += f"\nContent Preview:\n{body_clean}"
-
-        return result
+        result = [f"Page Details for Course {course_display}:\n\n"]
+        result.append(f"Title: {title}\n")
+        result.append(f"URL: {url}\n")
+        result.append(f"Status: {', '.join(status_info)}\n")
+        result.append(f"Created: {created_at}\n")
+        result.append(f"Updated: {updated_at}\n")
+        result.append(f"Last Edited By: {editor_name}\n")
+        result.append(f"Editing Roles: {editing_roles or 'Not specified'}\n")
+        result.append(f"\nContent Preview:\n{body_clean}")
+
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -232,16 +232,16 @@ def register_other_tools(mcp: FastMCP):
 
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = f"Successfully created page in Course {course_display}:\n\n"
-        result += f"Title: {page_title}\n"
-        result += f"URL: {page_url}\n"
-        result += f"Status: {published_status}\n"
-        result += f"Created: {created_at}\n"
+        result = [f"Successfully created page in Course {course_display}:\n\n"]
+        result.append(f"Title: {page_title}\n")
+        result.append(f"URL: {page_url}\n")
+        result.append(f"Status: {published_status}\n")
+        result.append(f"Created: {created_at}\n")
 
         if front_page:
-            result += "Set as front page: Yes\n"
+            result.append("Set as front page: Yes\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -298,34 +298,34 @@ def register_other_tools(mcp: FastMCP):
         config = get_config()
         stats = get_anonymization_stats()
 
-        result = "🔒 Data Anonymization Status:\n\n"
+        result = ["🔒 Data Anonymization Status:\n\n"]
 
         if config.enable_data_anonymization:
-            result += "✅ **ANONYMIZATION ENABLED** - Student data is protected\n\n"
-            result += "📊 Session Statistics:\n"
-            result += f"  • Total unique students anonymized: {stats['total_anonymized_ids']}\n"
-            result += f"  • Privacy protection: {stats['privacy_status']}\n"
-            result += f"  • Debug logging: {'ON' if config.anonymization_debug else 'OFF'}\n\n"
+            result.append("✅ **ANONYMIZATION ENABLED** - Student data is protected\n\n")
+            result.append("📊 Session Statistics:\n")
+            result.append(f"  • Total unique students anonymized: {stats['total_anonymized_ids']}\n")
+            result.append(f"  • Privacy protection: {stats['privacy_status']}\n")
+            result.append(f"  • Debug logging: {'ON' if config.anonymization_debug else 'OFF'}\n\n")
 
             if stats['total_anonymized_ids'] > 0:
-                result += "🎭 Anonymous ID Examples:\n"
+                result.append("🎭 Anonymous ID Examples:\n")
                 for i, (real_hint, anon_id) in enumerate(stats['sample_mappings'].items()):
-                    result += f"  • {real_hint} → {anon_id}\n"
+                    result.append(f"  • {real_hint} → {anon_id}\n")
                     if i >= 2:  # Limit to 3 examples
                         break
-                result += "\n"
+                result.append("\n")
 
-            result += "🛡️ **FERPA Compliance**: Data anonymized before AI processing\n"
-            result += "📍 **Data Location**: All processing happens locally on your machine\n"
+            result.append("🛡️ **FERPA Compliance**: Data anonymized before AI processing\n")
+            result.append("📍 **Data Location**: All processing happens locally on your machine\n")
 
         else:
-            result += "⚠️ **ANONYMIZATION DISABLED** - Student data is NOT protected\n\n"
-            result += "🚨 **PRIVACY RISK**: Real student names and data sent to AI\n"
-            result += "⚖️ **COMPLIANCE**: May violate FERPA requirements\n\n"
-            result += "💡 **Recommendation**: Enable anonymization in your .env file:\n"
-            result += "   ENABLE_DATA_ANONYMIZATION=true\n"
+            result.append("⚠️ **ANONYMIZATION DISABLED** - Student data is NOT protected\n\n")
+            result.append("🚨 **PRIVACY RISK**: Real student names and data sent to AI\n")
+            result.append("⚖️ **COMPLIANCE**: May violate FERPA requirements\n\n")
+            result.append("💡 **Recommendation**: Enable anonymization in your .env file:\n")
+            result.append("   ENABLE_DATA_ANONYMIZATION=true\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -365,7 +365,7 @@ def register_other_tools(mcp: FastMCP):
             module_name = module_response.get("name", "Unknown Module")
 
         course_display = await get_course_code(course_id) or course_identifier
-        result = f"Module Items for '{module_name}' in Course {course_display}:\n\n"
+        result = [f"Module Items for '{module_name}' in Course {course_display}:\n\n"]
 
         for item in items:
             item_id = item.get("id")
@@ -376,18 +376,18 @@ def register_other_tools(mcp: FastMCP):
             external_url = item.get("external_url", "")
             published = item.get("published", False)
 
-            result += f"Item: {title}\n"
-            result += f"Type: {item_type}\n"
-            result += f"ID: {item_id}\n"
+            result.append(f"Item: {title}\n")
+            result.append(f"Type: {item_type}\n")
+            result.append(f"ID: {item_id}\n")
             if content_id:
-                result += f"Content ID: {content_id}\n"
+                result.append(f"Content ID: {content_id}\n")
             if url:
-                result += f"URL: {url}\n"
+                result.append(f"URL: {url}\n")
             if external_url:
-                result += f"External URL: {external_url}\n"
-            result += f"Published: {'Yes' if published else 'No'}\n\n"
+                result.append(f"External URL: {external_url}\n")
+            result.append(f"Published: {'Yes' if published else 'No'}\n\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -412,7 +412,7 @@ def register_other_tools(mcp: FastMCP):
 
         # Format the output
         course_display = await get_course_code(course_id) or course_identifier
-        output = f"Groups for Course {course_display}:\n\n"
+        output = [f"Groups for Course {course_display}:\n\n"]
 
         for group in groups:
             group_id = group.get("id")
@@ -420,10 +420,10 @@ def register_other_tools(mcp: FastMCP):
             group_category = group.get("group_category_id", "Uncategorized")
             member_count = group.get("members_count", 0)
 
-            output += f"Group: {group_name}\n"
-            output += f"ID: {group_id}\n"
-            output += f"Category ID: {group_category}\n"
-            output += f"Member Count: {member_count}\n"
+            output.append(f"Group: {group_name}\n")
+            output.append(f"ID: {group_id}\n")
+            output.append(f"Category ID: {group_category}\n")
+            output.append(f"Member Count: {member_count}\n")
 
             # Get members for this group
             members = await fetch_all_paginated_results(
@@ -431,9 +431,9 @@ def register_other_tools(mcp: FastMCP):
             )
 
             if isinstance(members, dict) and "error" in members:
-                output += f"Error fetching members: {members['error']}\n"
+                output.append(f"Error fetching members: {members['error']}\n")
             elif not members:
-                output += "No members in this group.\n"
+                output.append("No members in this group.\n")
             else:
                 # Anonymize member data to protect student privacy
                 try:
@@ -441,16 +441,16 @@ def register_other_tools(mcp: FastMCP):
                 except Exception as e:
                     print(f"Warning: Failed to anonymize group member data: {str(e)}")
                     # Continue with original data for functionality
-                output += "Members:\n"
+                output.append("Members:\n")
                 for member in members:
                     member_id = member.get("id")
                     member_name = member.get("name", "Unnamed user")
                     member_email = member.get("email", "No email")
-                    output += f"  - {member_name} (ID: {member_id}, Email: {member_email})\n"
+                    output.append(f"  - {member_name} (ID: {member_id}, Email: {member_email})\n")
 
-            output += "\n"
+            output.append("\n")
 
-        return output
+        return "".join(output)
 
     # ===== USER TOOLS =====
 
@@ -553,23 +553,23 @@ def register_other_tools(mcp: FastMCP):
             assignments = []
 
         course_display = await get_course_code(course_id) or course_identifier
-        output = f"Student Analytics for Course {course_display} ({course_name})\n\n"
+        output = [f"Student Analytics for Course {course_display} ({course_name})\n\n"]
 
-        output += f"Total Students: {len(students)}\n"
-        output += f"Total Assignments: {len(assignments)}\n\n"
+        output.append(f"Total Students: {len(students)}\n")
+        output.append(f"Total Assignments: {len(assignments)}\n\n")
 
         if include_assignment_stats and assignments:
             # Calculate assignment completion stats
             published_assignments = [a for a in assignments if a.get("published", False)]
             total_points = sum(a.get("points_possible", 0) for a in published_assignments)
 
-            output += f"Published Assignments: {len(published_assignments)}\n"
-            output += f"Total Points Available: {total_points}\n\n"
+            output.append(f"Published Assignments: {len(published_assignments)}\n")
+            output.append(f"Total Points Available: {total_points}\n\n")
 
-        output += "This analytics feature provides basic course statistics.\n"
-        output += "For detailed individual student analytics, use specific assignment analytics tools."
+        output.append("This analytics feature provides basic course statistics.\n")
+        output.append("For detailed individual student analytics, use specific assignment analytics tools.")
 
-        return output
+        return "".join(output)
 
     @mcp.tool()
     @validate_params
@@ -642,19 +642,19 @@ def register_other_tools(mcp: FastMCP):
                 writer.writeheader()
                 writer.writerows(mapping_data)
 
-            result = "✅ Student anonymization map created successfully!\n\n"
-            result += f"📁 File location: {filepath}\n"
-            result += f"👥 Students mapped: {len(mapping_data)}\n"
-            result += f"🏫 Course: {course_display}\n\n"
-            result += "⚠️ **SECURITY WARNING:**\n"
-            result += "This file contains sensitive student information and should be:\n"
-            result += "• Kept secure and not shared\n"
-            result += "• Deleted when no longer needed\n"
-            result += "• Never committed to version control\n\n"
-            result += "📋 File format: CSV with columns real_name, real_id, real_email, anonymous_id\n"
-            result += "🔍 Use this file to identify students from their anonymous IDs in tool outputs."
-
-            return result
+            result = ["✅ Student anonymization map created successfully!\n\n"]
+            result.append(f"📁 File location: {filepath}\n")
+            result.append(f"👥 Students mapped: {len(mapping_data)}\n")
+            result.append(f"🏫 Course: {course_display}\n\n")
+            result.append("⚠️ **SECURITY WARNING:**\n")
+            result.append("This file contains sensitive student information and should be:\n")
+            result.append("• Kept secure and not shared\n")
+            result.append("• Deleted when no longer needed\n")
+            result.append("• Never committed to version control\n\n")
+            result.append("📋 File format: CSV with columns real_name, real_id, real_email, anonymous_id\n")
+            result.append("🔍 Use this file to identify students from their anonymous IDs in tool outputs.")
+
+            return "".join(result)
 
         except Exception as e:
             return f"Error creating anonymization map: {str(e)}"
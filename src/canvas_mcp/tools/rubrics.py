@@ -1,6 +1,7 @@
 """Rubric-related MCP tools for Canvas API."""
 
 import json
+from operator import itemgetter
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
@@ -157,35 +158,35 @@ def format_rubric_response(response: dict[str, Any]) -> str:
         rubric = response["rubric"]
         association = response["rubric_association"]
 
-        result = "Rubric Created/Updated Successfully!\n\n"
-        result += "Rubric Details:\n"
-        result += f"  ID: {rubric.get('id', 'N/A')}\n"
-        result += f"  Title: {rubric.get('title', 'Untitled')}\n"
-        result += f"  Context: {rubric.get('context_type', 'N/A')} (ID: {rubric.get('context_id', 'N/A')})\n"
-        result += f"  Points Possible: {rubric.get('points_possible', 0)}\n"
-        result += f"  Reusable: {'Yes' if rubric.get('reusable', False) else 'No'}\n"
-        result += f"  Free Form Comments: {'Yes' if rubric.get('free_form_criterion_comments', False) else 'No'}\n"
+        result = ["Rubric Created/Updated Successfully!\n\n"]
+        result.append("Rubric Details:\n")
+        result.append(f"  ID: {rubric.get('id', 'N/A')}\n")
+        result.append(f"  Title: {rubric.get('title', 'Untitled')}\n")
+        result.append(f"  Context: {rubric.get('context_type', 'N/A')} (ID: {rubric.get('context_id', 'N/A')})\n")
+        result.append(f"  Points Possible: {rubric.get('points_possible', 0)}\n")
+        result.append(f"  Reusable: {'Yes' if rubric.get('reusable', False) else 'No'}\n")
+        result.append(f"  Free Form Comments: {'Yes' if rubric.get('free_form_criterion_comments', False) else 'No'}\n")
 
         if association:
-            result += "\nAssociation Details:\n"
-            result += f"  Associated with: {association.get('association_type', 'N/A')} (ID: {association.get('association_id', 'N/A')})\n"
-            result += f"  Used for Grading: {'Yes' if association.get('use_for_grading', False) else 'No'}\n"
-            result += f"  Purpose: {association.get('purpose', 'N/A')}\n"
+            result.append("\nAssociation Details:\n")
+            result.append(f"  Associated with: {association.get('association_type', 'N/A')} (ID: {association.get('association_id', 'N/A')})\n")
+            result.append(f"  Used for Grading: {'Yes' if association.get('use_for_grading', False) else 'No'}\n")
+            result.append(f"  Purpose: {association.get('purpose', 'N/A')}\n")
 
         # Show criteria count
         data = rubric.get('data', [])
         if data:
-            result += f"\nCriteria: {len(data)} criterion defined\n"
+            result.append(f"\nCriteria: {len(data)} criterion defined\n")
 
-        return result
+        return "".join(result)
 
     # Handle standard rubric response
     else:
-        result = "Rubric Operation Completed!\n\n"
-        result += f"ID: {response.get('id', 'N/A')}\n"
-        result += f"Title: {response.get('title', 'Untitled')}\n"
-        result += f"Points Possible: {response.get('points_possible', 0)}\n"
-        return result
+        result = ["Rubric Operation Completed!\n\n"]
+        result.append(f"ID: {response.get('id', 'N/A')}\n")
+        result.append(f"Title: {response.get('title', 'Untitled')}\n")
+        result.append(f"Points Possible: {response.get('points_possible', 0)}\n")
+        return "".join(result)
 
 
 def build_criteria_structure(criteria: dict[str, Any]) -> dict[str, Any]:
@@ -226,7 +227,7 @@ def build_criteria_structure(criteria: dict[str, Any]) -> dict[str, Any]:
                         "long_description": rating_data.get("long_description", "")
                     })
                 # Sort by points descending
-                rating_items.sort(key=lambda x: x["points"], reverse=True)
+                rating_items.sort(key=itemgetter("points"), reverse=True)
                 formatted_ratings = rating_items
             elif isinstance(ratings, list):
                 # Already in array format, just ensure proper typing
@@ -282,18 +283,18 @@ def register_rubric_tools(mcp: FastMCP) -> None:
         assignment_name = response.get("name", "Unknown Assignment")
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = f"Rubric for Assignment '{assignment_name}' in Course {course_display}:\n\n"
+        result = [f"Rubric for Assignment '{assignment_name}' in Course {course_display}:\n\n"]
 
         # Rubric settings
         if rubric_settings:
-            result += "Rubric Settings:\n"
-            result += f"  Used for Grading: {'Yes' if use_rubric_for_grading else 'No'}\n"
-            result += f"  Points Possible: {rubric_settings.get('points_possible', 'N/A')}\n"
-            result += f"  Hide Score Total: {'Yes' if rubric_settings.get('hide_score_total') else 'No'}\n"
-            result += f"  Hide Points: {'Yes' if rubric_settings.get('hide_points') else 'No'}\n\n"
+            result.append("Rubric Settings:\n")
+            result.append(f"  Used for Grading: {'Yes' if use_rubric_for_grading else 'No'}\n")
+            result.append(f"  Points Possible: {rubric_settings.get('points_possible', 'N/A')}\n")
+            result.append(f"  Hide Score Total: {'Yes' if rubric_settings.get('hide_score_total') else 'No'}\n")
+            result.append(f"  Hide Points: {'Yes' if rubric_settings.get('hide_points') else 'No'}\n\n")
 
         # Rubric criteria summary
-        result += "Criteria Overview:\n"
+        result.append("Criteria Overview:\n")
         total_points = 0
 
         for i, criterion in enumerate(rubric, 1):
@@ -301,14 +302,14 @@ def register_rubric_tools(mcp: FastMCP) -> None:
             criterion_points = criterion.get("points", 0)
             ratings_count = len(criterion.get("ratings", []))
 
-            result += f"{i}. {criterion_description}\n"
-            result += f"   Points: {criterion_points}\n"
-            result += f"   Rating Levels: {ratings_count}\n"
+            result.append(f"{i}. {criterion_description}\n")
+            result.append(f"   Points: {criterion_points}\n")
+            result.append(f"   Rating Levels: {ratings_count}\n")
 
             total_points += criterion_points
 
-        result += f"\nTotal Possible Points: {total_points}\n"
-        result += f"Number of Criteria: {len(rubric)}\n"
+        result.append(f"\nTotal Possible Points: {total_points}\n")
+        result.append(f"Number of Criteria: {len(rubric)}\n")
 
         # Extract rubric ID for use with get_rubric_details
         rubric_id = None
@@ -321,10 +322,10 @@ def register_rubric_tools(mcp: FastMCP) -> None:
                 rubric_id = rubric[0].get("id")
 
         if rubric_id:
-            result += f"Rubric ID: {rubric_id}\n"
-            result += f"\nTo get detailed criteria descriptions, use: get_assignment_rubric_details with assignment_id {assignment_id}"
+            result.append(f"Rubric ID: {rubric_id}\n")
+            result.append(f"\nTo get detailed criteria descriptions, use: get_assignment_rubric_details with assignment_id {assignment_id}")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -362,18 +363,18 @@ def register_rubric_tools(mcp: FastMCP) -> None:
         rubric_settings = response.get("rubric_settings", {})
         use_rubric_for_grading = response.get("use_rubric_for_grading", False)
 
-        result = f"Detailed Rubric for Assignment '{assignment_name}' in Course {course_display}:\n\n"
+        result = [f"Detailed Rubric for Assignment '{assignment_name}' in Course {course_display}:\n\n"]
 
         # Rubric metadata
-        result += f"Assignment ID: {assignment_id}\n"
-        result += f"Used for Grading: {'Yes' if use_rubric_for_grading else 'No'}\n"
+        result.append(f"Assignment ID: {assignment_id}\n")
+        result.append(f"Used for Grading: {'Yes' if use_rubric_for_grading else 'No'}\n")
         if rubric_settings:
-            result += f"Total Points Possible: {rubric_settings.get('points_possible', 'N/A')}\n"
-        result += f"Number of Criteria: {len(rubric)}\n\n"
+            result.append(f"Total Points Possible: {rubric_settings.get('points_possible', 'N/A')}\n")
+        result.append(f"Number of Criteria: {len(rubric)}\n\n")
 
         # Detailed criteria and ratings
-        result += "Detailed Criteria and Rating Scales:\n"
-        result += "=" * 60 + "\n"
+        result.append("Detailed Criteria and Rating Scales:\n")
+        result.append("=" * 60 + "\n")
 
         total_points = 0
         for i, criterion in enumerate(rubric, 1):
@@ -383,17 +384,20 @@ def register_rubric_tools(mcp: FastMCP) -> None:
             points = criterion.get("points", 0)
             ratings = criterion.get("ratings", [])
 
-            result += f"\nCriterion #{i}: {description}\n"
-            result += f"Criterion ID: {criterion_id}\n"
-            result += f"Maximum Points: {points}\n"
+            result.append(f"\nCriterion #{i}: {description}\n")
+            result.append(f"Criterion ID: {criterion_id}\n")
+            result.append(f"Maximum Points: {points}\n")
 
             if long_description and long_description != description:
-                result += f"Full Description: {long_description}\n"
+                result.append(f"Full Description: {long_description}\n")
 
             if ratings:
-                result += f"\nRating Scale ({len(ratings)} levels):\n"
-                # Sort ratings by points (highest to lowest)
-                sorted_ratings = sorted(ratings, key=lambda x: x.get("points", 0), reverse=True)
+                result.append(f"\nRating Scale ({len(ratings)} levels):\n")
+                # Sort ratings by points (highest to lowest); precomputed
+                # keys + itemgetter keep the comparison loop in C
+                keyed = [(rating.get("points", 0), rating) for rating in ratings]
+                keyed.sort(key=itemgetter(0), reverse=True)
+                sorted_ratings = [rating for _, rating in keyed]
 
                 for _, rating in enumerate(sorted_ratings):
                     rating_description = rating.get("description", "No description")
@@ -401,24 +405,24 @@ def register_rubric_tools(mcp: FastMCP) -> None:
                     rating_id = rating.get("id", "N/A")
                     long_desc = rating.get("long_description", "")
 
-                    result += f"  {rating_points} pts: {rating_description}"
+                    result.append(f"  {rating_points} pts: {rating_description}")
                     if rating_id != "N/A":
-                        result += f" [ID: {rating_id}]"
-                    result += "\n"
+                        result.append(f" [ID: {rating_id}]")
+                    result.append("\n")
 
                     if long_desc and long_desc != rating_description:
                         # Format long description nicely
                         formatted_desc = long_desc.replace("\\n", "\n    ")
-                        result += f"    Details: {formatted_desc}\n"
+                        result.append(f"    Details: {formatted_desc}\n")
             else:
-                result += "No rating scale defined for this criterion.\n"
+                result.append("No rating scale defined for this criterion.\n")
 
             total_points += points
-            result += "\n" + "-" * 40 + "\n"
+            result.append("\n" + "-" * 40 + "\n")
 
-        result += f"\nTotal Rubric Points: {total_points}"
+        result.append(f"\nTotal Rubric Points: {total_points}")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -454,18 +458,18 @@ def register_rubric_tools(mcp: FastMCP) -> None:
 
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = f"Detailed Rubric Information for Course {course_display}:\n\n"
-        result += f"Title: {title}\n"
-        result += f"Rubric ID: {rubric_id}\n"
-        result += f"Context: {context_type} ({context_code})\n"
-        result += f"Total Points: {points_possible}\n"
-        result += f"Reusable: {'Yes' if reusable else 'No'}\n"
-        result += f"Read Only: {'Yes' if read_only else 'No'}\n\n"
+        result = [f"Detailed Rubric Information for Course {course_display}:\n\n"]
+        result.append(f"Title: {title}\n")
+        result.append(f"Rubric ID: {rubric_id}\n")
+        result.append(f"Context: {context_type} ({context_code})\n")
+        result.append(f"Total Points: {points_possible}\n")
+        result.append(f"Reusable: {'Yes' if reusable else 'No'}\n")
+        result.append(f"Read Only: {'Yes' if read_only else 'No'}\n\n")
 
         # Detailed criteria and ratings
         if data:
-            result += "Detailed Criteria and Ratings:\n"
-            result += "=" * 50 + "\n"
+            result.append("Detailed Criteria and Ratings:\n")
+            result.append("=" * 50 + "\n")
 
             for i, criterion in enumerate(data, 1):
                 criterion_id = criterion.get("id", "N/A")
@@ -474,28 +478,28 @@ def register_rubric_tools(mcp: FastMCP) -> None:
                 points = criterion.get("points", 0)
                 ratings = criterion.get("ratings", [])
 
-                result += f"\nCriterion #{i}: {description}\n"
-                result += f"ID: {criterion_id}\n"
-                result += f"Points: {points}\n"
+                result.append(f"\nCriterion #{i}: {description}\n")
+                result.append(f"ID: {criterion_id}\n")
+                result.append(f"Points: {points}\n")
 
                 if long_description:
-                    result += f"Description: {truncate_text(long_description, 200)}\n"
+                    result.append(f"Description: {truncate_text(long_description, 200)}\n")
 
                 if ratings:
-                    result += f"Rating Levels ({len(ratings)}):\n"
+                    result.append(f"Rating Levels ({len(ratings)}):\n")
                     for j, rating in enumerate(ratings):
                         rating_description = rating.get("description", "No description")
                         rating_points = rating.get("points", 0)
                         rating_id = rating.get("id", "N/A")
 
-                        result += f"  {j+1}. {rating_description} ({rating_points} pts) [ID: {rating_id}]\n"
+                        result.append(f"  {j+1}. {rating_description} ({rating_points} pts) [ID: {rating_id}]\n")
 
                         if rating.get("long_description"):
-                            result += f"     {truncate_text(rating.get('long_description'), 100)}\n"
+                            result.append(f"     {truncate_text(rating.get('long_description'), 100)}\n")
 
-                result += "\n"
+                result.append("\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -555,21 +559,21 @@ def register_rubric_tools(mcp: FastMCP) -> None:
         # Format rubric assessment
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = f"Rubric Assessment for User {user_id} on '{assignment_name}' in Course {course_display}:\n\n"
+        result = [f"Rubric Assessment for User {user_id} on '{assignment_name}' in Course {course_display}:\n\n"]
 
         # Submission details
         submitted_at = format_date(response.get("submitted_at"))
         graded_at = format_date(response.get("graded_at"))
         score = response.get("score", "Not graded")
 
-        result += "Submission Details:\n"
-        result += f"  Submitted: {submitted_at}\n"
-        result += f"  Graded: {graded_at}\n"
-        result += f"  Score: {score}\n\n"
+        result.append("Submission Details:\n")
+        result.append(f"  Submitted: {submitted_at}\n")
+        result.append(f"  Graded: {graded_at}\n")
+        result.append(f"  Score: {score}\n\n")
 
         # Rubric assessment details
-        result += "Rubric Assessment:\n"
-        result += "=" * 30 + "\n"
+        result.append("Rubric Assessment:\n")
+        result.append("=" * 30 + "\n")
 
         total_rubric_points = 0
 
@@ -586,24 +590,24 @@ def register_rubric_tools(mcp: FastMCP) -> None:
             comments = assessment.get("comments", "")
             rating_id = assessment.get("rating_id")
 
-            result += f"\n{criterion_description}:\n"
-            result += f"  Points Awarded: {points}\n"
+            result.append(f"\n{criterion_description}:\n")
+            result.append(f"  Points Awarded: {points}\n")
 
             if rating_id and criterion_info:
                 # Find the rating description
                 for rating in criterion_info.get("ratings", []):
                     if str(rating.get("id")) == str(rating_id):
-                        result += f"  Rating: {rating.get('description', 'N/A')} ({rating.get('points', 0)} pts)\n"
+                        result.append(f"  Rating: {rating.get('description', 'N/A')} ({rating.get('points', 0)} pts)\n")
                         break
 
             if comments:
-                result += f"  Comments: {comments}\n"
+                result.append(f"  Comments: {comments}\n")
 
             total_rubric_points += points
 
-        result += f"\nTotal Rubric Points: {total_rubric_points}"
+        result.append(f"\nTotal Rubric Points: {total_rubric_points}")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -661,26 +665,26 @@ def register_rubric_tools(mcp: FastMCP) -> None:
 
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = "Rubric Grade Submitted Successfully!\n\n"
-        result += f"Course: {course_display}\n"
-        result += f"Assignment: {assignment_name}\n"
-        result += f"Student ID: {user_id}\n"
-        result += f"Total Rubric Points: {total_points}\n"
-        result += f"Graded At: {format_date(response.get('graded_at'))}\n"
+        result = ["Rubric Grade Submitted Successfully!\n\n"]
+        result.append(f"Course: {course_display}\n")
+        result.append(f"Assignment: {assignment_name}\n")
+        result.append(f"Student ID: {user_id}\n")
+        result.append(f"Total Rubric Points: {total_points}\n")
+        result.append(f"Graded At: {format_date(response.get('graded_at'))}\n")
 
         if comment:
-            result += f"Comment: {comment}\n"
+            result.append(f"Comment: {comment}\n")
 
-        result += "\nRubric Assessment Summary:\n"
+        result.append("\nRubric Assessment Summary:\n")
         for criterion_id, assessment in assessment_data.items():
             points = assessment.get("points", 0)
             comments = assessment.get("comments", "")
-            result += f"  Criterion {criterion_id}: {points} points"
+            result.append(f"  Criterion {criterion_id}: {points} points")
             if comments:
-                result += f" - {truncate_text(comments, 50)}"
-            result += "\n"
+                result.append(f" - {truncate_text(comments, 50)}")
+            result.append("\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -707,7 +711,7 @@ def register_rubric_tools(mcp: FastMCP) -> None:
         # Get course display name
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = f"All Rubrics for Course {course_display}:\n\n"
+        result = [f"All Rubrics for Course {course_display}:\n\n"]
 
         for i, rubric in enumerate(rubrics, 1):
             rubric_id = rubric.get("id", "N/A")
@@ -717,15 +721,15 @@ def register_rubric_tools(mcp: FastMCP) -> None:
             read_only = rubric.get("read_only", False)
             data = rubric.get("data", [])
 
-            result += "=" * 80 + "\n"
-            result += f"Rubric #{i}: {title} (ID: {rubric_id})\n"
-            result += f"Total Points: {points_possible} | Criteria: {len(data)} | "
-            result += f"Reusable: {'Yes' if reusable else 'No'} | "
-            result += f"Read-only: {'Yes' if read_only else 'No'}\n"
+            result.append("=" * 80 + "\n")
+            result.append(f"Rubric #{i}: {title} (ID: {rubric_id})\n")
+            result.append(f"Total Points: {points_possible} | Criteria: {len(data)} | ")
+            result.append(f"Reusable: {'Yes' if reusable else 'No'} | ")
+            result.append(f"Read-only: {'Yes' if read_only else 'No'}\n")
 
             if include_criteria and data:
-                result += "\nCriteria Details:\n"
-                result += "-" * 16 + "\n"
+                result.append("\nCriteria Details:\n")
+                result.append("-" * 16 + "\n")
 
                 for j, criterion in enumerate(data, 1):
                     criterion_id = criterion.get("id", "N/A")
@@ -734,47 +738,50 @@ def register_rubric_tools(mcp: FastMCP) -> None:
                     points = criterion.get("points", 0)
                     ratings = criterion.get("ratings", [])
 
-                    result += f"\n{j}. {description} (ID: {criterion_id}) - {points} points\n"
+                    result.append(f"\n{j}. {description} (ID: {criterion_id}) - {points} points\n")
 
                     if long_description and long_description != description:
                         # Truncate long descriptions to keep output manageable
                         truncated_desc = truncate_text(long_description, 150)
-                        result += f"   Description: {truncated_desc}\n"
+                        result.append(f"   Description: {truncated_desc}\n")
 
                     if ratings:
-                        # Sort ratings by points (highest to lowest)
-                        sorted_ratings = sorted(ratings, key=lambda x: x.get("points", 0), reverse=True)
+                        # Sort ratings by points (highest to lowest);
+                        # precomputed keys + itemgetter run in C
+                        keyed = [(rating.get("points", 0), rating) for rating in ratings]
+                        keyed.sort(key=itemgetter(0), reverse=True)
+                        sorted_ratings = [rating for _, rating in keyed]
 
                         for rating in sorted_ratings:
                             rating_description = rating.get("description", "No description")
                             rating_points = rating.get("points", 0)
                             rating_id = rating.get("id", "N/A")
 
-                            result += f"   - {rating_description} ({rating_points} pts) [ID: {rating_id}]\n"
+                            result.append(f"   - {rating_description} ({rating_points} pts) [ID: {rating_id}]\n")
 
                             # Include long description if it exists and differs
                             rating_long_desc = rating.get("long_description", "")
                             if rating_long_desc and rating_long_desc != rating_description:
                                 truncated_rating_desc = truncate_text(rating_long_desc, 100)
-                                result += f"     {truncated_rating_desc}\n"
+                                result.append(f"     {truncated_rating_desc}\n")
                     else:
-                        result += "   No rating scale defined for this criterion.\n"
+                        result.append("   No rating scale defined for this criterion.\n")
             elif include_criteria:
-                result += "\nNo criteria defined for this rubric.\n"
+                result.append("\nNo criteria defined for this rubric.\n")
 
-            result += "\n"
+            result.append("\n")
 
         # Add summary
-        result += "=" * 80 + "\n"
-        result += f"Total Rubrics Found: {len(rubrics)}\n"
+        result.append("=" * 80 + "\n")
+        result.append(f"Total Rubrics Found: {len(rubrics)}\n")
 
         if include_criteria:
-            result += "\nNote: Use the criterion and rating IDs shown above with the grade_with_rubric tool.\n"
-            result += "Example: {\"criterion_id\": {\"points\": X, \"comments\": \"...\", \"rating_id\": \"rating_id\"}}\n"
+            result.append("\nNote: Use the criterion and rating IDs shown above with the grade_with_rubric tool.\n")
+            result.append("Example: {\"criterion_id\": {\"points\": X, \"comments\": \"...\", \"rating_id\": \"rating_id\"}}\n")
         else:
-            result += "\nTo see detailed criteria and ratings, run this command with include_criteria=True.\n"
+            result.append("\nTo see detailed criteria and ratings, run this command with include_criteria=True.\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -1005,13 +1012,13 @@ def register_rubric_tools(mcp: FastMCP) -> None:
 
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = f"Rubric deleted successfully from course {course_display}!\n\n"
-        result += "Deleted Rubric Details:\n"
-        result += f"  ID: {rubric_id}\n"
-        result += f"  Title: {rubric_title}\n"
-        result += "  All associations have been removed\n"
+        result = [f"Rubric deleted successfully from course {course_display}!\n\n"]
+        result.append("Deleted Rubric Details:\n")
+        result.append(f"  ID: {rubric_id}\n")
+        result.append(f"  Title: {rubric_title}\n")
+        result.append("  All associations have been removed\n")
 
-        return result
+        return "".join(result)
 
     @mcp.tool()
     @validate_params
@@ -1065,11 +1072,11 @@ def register_rubric_tools(mcp: FastMCP) -> None:
 
         course_display = await get_course_code(course_id) or course_identifier
 
-        result = "Rubric associated with assignment successfully!\n\n"
-        result += f"Course: {course_display}\n"
-        result += f"Assignment: {assignment_name} (ID: {assignment_id})\n"
-        result += f"Rubric ID: {rubric_id}\n"
-        result += f"Used for Grading: {'Yes' if use_for_grading else 'No'}\n"
-        result += f"Purpose: {purpose}\n"
+        result = ["Rubric associated with assignment successfully!\n\n"]
+        result.append(f"Course: {course_display}\n")
+        result.append(f"Assignment: {assignment_name} (ID: {assignment_id})\n")
+        result.append(f"Rubric ID: {rubric_id}\n")
+        result.append(f"Used for Grading: {'Yes' if use_for_grading else 'No'}\n")
+        result.append(f"Purpose: {purpose}\n")
 
-        return result
+        return "".join(result)
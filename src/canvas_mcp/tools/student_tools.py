@@ -4,16 +4,79 @@ These tools provide student-focused functionality using Canvas API "/self" endpo
 to access only the student's own data across their enrolled courses.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
 from ..core.cache import get_course_code, get_course_id
-from ..core.client import fetch_all_paginated_results, make_canvas_request
+from ..core.client import (
+    fetch_all_paginated_results,
+    make_canvas_graphql_request,
+    make_canvas_request,
+)
 from ..core.dates import format_date, parse_date
 from ..core.validation import validate_params
 
+# Cap on concurrent per-course requests so fan-outs across a large
+# enrollment list don't slam the Canvas API.
+COURSE_FAN_OUT_LIMIT = 8
+
+# Hoisted so the format specs are parsed once, not per item in the loops
+_GRADE_ROW_TMPL = "• {course_code}: {name}\n  Current Grade: {grade_info}\n"
+_ASSIGNMENT_ROW_TMPL = "• {name}\n  Course: {course}\n  Due: {due}\n  Status: {status}\n"
+_TODO_ROW_TMPL = "• {name}\n  Type: {type}\n  Course: {course}\n  Due: {due}\n"
+_PEER_REVIEW_ROW_TMPL = "• {name}\n  Course: {course}\n  Reviewing: Student {user_id}\n  Status: Incomplete\n"
+
+# Static report headers, allocated once instead of per call
+_HEADER_SUBMISSIONS_ALL = "Submission Status (All Courses):\n"
+_HEADER_GRADES = "Your Course Grades:\n"
+_HEADER_TODO = "Your TODO List:\n"
+_HEADER_PEER_REVIEWS = "Peer Reviews You Need to Complete:\n"
+
+# One GraphQL round trip for assignments + own submissions across every
+# enrolled course, instead of a REST call per course.
+_STUDENT_ASSIGNMENTS_QUERY = """
+query StudentAssignments {
+  allCourses {
+    name
+    courseCode
+    assignmentsConnection {
+      nodes {
+        name
+        dueAt
+        submissionsConnection {
+          nodes {
+            submittedAt
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _assignments_from_graphql(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten a StudentAssignments GraphQL payload into the REST
+    assignment shape the render code expects."""
+    all_assignments = []
+    for course in data.get("allCourses") or []:
+        course_name = course.get("courseCode") or course.get("name", "Unknown")
+        nodes = (course.get("assignmentsConnection") or {}).get("nodes") or []
+        for node in nodes:
+            submissions = (node.get("submissionsConnection") or {}).get("nodes") or []
+            submitted_at = submissions[0].get("submittedAt") if submissions else None
+            all_assignments.append({
+                "name": node.get("name"),
+                "due_at": node.get("dueAt"),
+                "submission": {"submitted_at": submitted_at},
+                "_course_name": course_name,
+            })
+    return all_assignments
+
 
 def register_student_tools(mcp: FastMCP):
     """Register student-specific MCP tools."""
@@ -28,14 +91,16 @@ def register_student_tools(mcp: FastMCP):
         Returns upcoming assignments due within the specified timeframe,
         sorted by due date, with submission status.
         """
-        # Calculate the date range
-        end_date = datetime.now() + timedelta(days=days)
+        # Calculate the date range once, tz-aware so comparisons against
+        # parse_date() results (always UTC) are valid
+        end_date = datetime.now(timezone.utc) + timedelta(days=days)
         end_date_str = end_date.strftime("%Y-%m-%d")
 
-        # Get upcoming events for the current user
+        # Get upcoming events for the current user, letting the server
+        # apply the date window so out-of-range events are never sent
         events = await fetch_all_paginated_results(
             "/users/self/upcoming_events",
-            params={"per_page": 100}
+            params={"end_date": end_date_str, "per_page": 100}
         )
 
         if isinstance(events, dict) and "error" in events:
@@ -44,29 +109,36 @@ def register_student_tools(mcp: FastMCP):
         if not events:
             return f"No assignments due in the next {days} days."
 
-        # Filter to assignments only (not calendar events)
+        # Filter to assignments only (not calendar events), decorating
+        # with the parsed due date in the same pass so the sort never
+        # re-parses timestamps. The local window check stays as a safety
+        # net: end_date is only a server hint, and an instance that
+        # ignores it would otherwise leak assignments past the window.
+        undated = datetime.max.replace(tzinfo=timezone.utc)
         assignments = []
         for event in events:
             if event.get("type") == "assignment" or event.get("assignment"):
                 assignment_data = event.get("assignment", event)
                 due_at = assignment_data.get("due_at")
-
                 if due_at:
-                    # Check if within our date range
                     due_date = parse_date(due_at)
-                    if due_date and due_date <= end_date:
-                        assignments.append(assignment_data)
+                    if due_date is None:
+                        # Unparseable due date: keep it (sorted last)
+                        # rather than guess it out of the window
+                        assignments.append((undated, assignment_data))
+                    elif due_date <= end_date:
+                        assignments.append((due_date, assignment_data))
 
         if not assignments:
             return f"No assignments due in the next {days} days."
 
-        # Sort by due date
-        assignments.sort(key=lambda x: parse_date(x.get("due_at", "")) or datetime.max)
+        # Sort by due date (precomputed keys, C-level extraction)
+        assignments.sort(key=itemgetter(0))
 
         # Format output
         output_lines = [f"Upcoming Assignments (Next {days} Days):\n"]
 
-        for assignment in assignments:
+        for _, assignment in assignments:
             name = assignment.get("name", "Unnamed Assignment")
             due_at = format_date(assignment.get("due_at"))
             course_id = assignment.get("course_id")
@@ -83,10 +155,7 @@ def register_student_tools(mcp: FastMCP):
                 status = "❌ Not Submitted"
 
             output_lines.append(
-                f"• {name}\n"
-                f"  Course: {course_display}\n"
-                f"  Due: {due_at}\n"
-                f"  Status: {status}\n"
+                _ASSIGNMENT_ROW_TMPL.format(name=name, course=course_display, due=due_at, status=status)
             )
 
         return "\n".join(output_lines)
@@ -118,53 +187,77 @@ def register_student_tools(mcp: FastMCP):
             output_lines = [f"Submission Status for {course_display}:\n"]
 
         else:
-            # Get all courses and their assignments
-            courses = await fetch_all_paginated_results(
-                "/courses",
-                params={"enrollment_state": "active", "per_page": 100}
-            )
+            output_lines = [_HEADER_SUBMISSIONS_ALL]
 
-            if isinstance(courses, dict) and "error" in courses:
-                return f"Error fetching courses: {courses['error']}"
+            # Prefer one GraphQL round trip over a REST call per course;
+            # the REST fan-out below stays as the fallback for instances
+            # where GraphQL is unavailable or the query errors.
+            graphql_data = await make_canvas_graphql_request(_STUDENT_ASSIGNMENTS_QUERY)
+
+            if isinstance(graphql_data, dict) and "error" not in graphql_data:
+                assignments = _assignments_from_graphql(graphql_data)
+            else:
+                # Get all courses and their assignments
+                courses = await fetch_all_paginated_results(
+                    "/courses",
+                    params={"enrollment_state": "active", "per_page": 100}
+                )
 
-            output_lines = ["Submission Status (All Courses):\n"]
-            all_assignments = []
+                if isinstance(courses, dict) and "error" in courses:
+                    return f"Error fetching courses: {courses['error']}"
 
-            for course in courses:
-                course_id = course.get("id")
-                course_name = course.get("course_code", course.get("name", "Unknown"))
+                all_assignments = []
 
-                assignments = await fetch_all_paginated_results(
-                    f"/courses/{course_id}/assignments",
-                    params={"include[]": ["submission"], "per_page": 100}
+                # Fetch every course's assignments concurrently instead of one
+                # round-trip at a time; latency becomes max(RTT) rather than sum.
+                semaphore = asyncio.Semaphore(COURSE_FAN_OUT_LIMIT)
+
+                async def fetch_course_assignments(course):
+                    async with semaphore:
+                        return await fetch_all_paginated_results(
+                            f"/courses/{course.get('id')}/assignments",
+                            params={"include[]": ["submission"], "per_page": 100}
+                        )
+
+                results = await asyncio.gather(
+                    *(fetch_course_assignments(course) for course in courses),
+                    return_exceptions=True,
                 )
 
-                if not isinstance(assignments, dict) or "error" not in assignments:
-                    for assignment in assignments if isinstance(assignments, list) else []:
-                        assignment["_course_name"] = course_name
-                        all_assignments.append(assignment)
+                for course, assignments in zip(courses, results):
+                    course_name = course.get("course_code", course.get("name", "Unknown"))
+
+                    if isinstance(assignments, BaseException):
+                        continue
 
-            assignments = all_assignments
+                    if not isinstance(assignments, dict) or "error" not in assignments:
+                        for assignment in assignments if isinstance(assignments, list) else []:
+                            assignment["_course_name"] = course_name
+                            all_assignments.append(assignment)
+
+                assignments = all_assignments
 
         if not assignments:
             return "No assignments found."
 
-        # Separate submitted and missing
+        # Classify each assignment in a single pass, carrying the values
+        # the render loops need so nothing is re-read or re-parsed later
         submitted = []
         missing = []
+        now_utc = datetime.now(timezone.utc)
 
         for assignment in assignments:
-            submission = assignment.get("submission")
-            is_submitted = submission and submission.get("submitted_at") is not None
+            submission = assignment.get("submission") or {}
+            submitted_at = submission.get("submitted_at")
 
-            if is_submitted:
-                submitted.append(assignment)
+            if submitted_at is not None:
+                submitted.append((assignment, submitted_at))
             else:
                 # Check if past due
                 due_at = assignment.get("due_at")
                 if due_at:
                     due_date = parse_date(due_at)
-                    if due_date and due_date < datetime.now():
+                    if due_date and due_date < now_utc:
                         missing.append((assignment, "OVERDUE"))
                     else:
                         missing.append((assignment, "NOT SUBMITTED"))
@@ -188,10 +281,9 @@ def register_student_tools(mcp: FastMCP):
 
         if submitted:
             output_lines.append(f"\n✅ Submitted ({len(submitted)}):\n")
-            for assignment in submitted[:10]:  # Show first 10
+            for assignment, submitted_at in submitted[:10]:  # Show first 10
                 name = assignment.get("name", "Unnamed")
-                submission = assignment.get("submission", {})
-                submitted_at = format_date(submission.get("submitted_at"))
+                submitted_at = format_date(submitted_at)
                 course_name = assignment.get("_course_name", "")
 
                 output_lines.append(
@@ -224,7 +316,7 @@ def register_student_tools(mcp: FastMCP):
         if not courses:
             return "No active course enrollments found."
 
-        output_lines = ["Your Course Grades:\n"]
+        output_lines = [_HEADER_GRADES]
 
         for course in courses:
             name = course.get("name", "Unnamed Course")
@@ -235,7 +327,8 @@ def register_student_tools(mcp: FastMCP):
             if enrollments:
                 enrollment = enrollments[0]  # Student typically has one enrollment per course
 
-                # Current score
+                # Current score; "is not None" checks matter here since a
+                # legitimate 0.0 score is falsy
                 current_score = enrollment.get("computed_current_score")
                 final_score = enrollment.get("computed_final_score")
                 current_grade = enrollment.get("computed_current_grade", "N/A")
@@ -247,16 +340,12 @@ def register_student_tools(mcp: FastMCP):
                     grade_info = f"{final_score:.1f}%"
                 else:
                     grade_info = "No grade yet"
-
-                output_lines.append(
-                    f"• {course_code}: {name}\n"
-                    f"  Current Grade: {grade_info}\n"
-                )
             else:
-                output_lines.append(
-                    f"• {course_code}: {name}\n"
-                    f"  Current Grade: No enrollment data\n"
-                )
+                grade_info = "No enrollment data"
+
+            output_lines.append(
+                _GRADE_ROW_TMPL.format(course_code=course_code, name=name, grade_info=grade_info)
+            )
 
         return "\n".join(output_lines)
 
@@ -278,7 +367,7 @@ def register_student_tools(mcp: FastMCP):
         if not todos:
             return "Your TODO list is empty! 🎉"
 
-        output_lines = ["Your TODO List:\n"]
+        output_lines = [_HEADER_TODO]
 
         for item in todos:
             item_type = item.get("type", "item")
@@ -291,10 +380,7 @@ def register_student_tools(mcp: FastMCP):
             course_display = await get_course_code(course_id) if course_id else "Unknown Course"
 
             output_lines.append(
-                f"• {name}\n"
-                f"  Type: {item_type.title()}\n"
-                f"  Course: {course_display}\n"
-                f"  Due: {due_at}\n"
+                _TODO_ROW_TMPL.format(name=name, type=item_type.title(), course=course_display, due=due_at)
             )
 
         return "\n".join(output_lines)
@@ -324,55 +410,71 @@ def register_student_tools(mcp: FastMCP):
 
         all_peer_reviews = []
 
-        for course_id in course_ids:
-            # Get assignments for this course
-            assignments = await fetch_all_paginated_results(
-                f"/courses/{course_id}/assignments",
-                params={"per_page": 100}
-            )
+        # Fan out across courses (and their peer-reviewed assignments)
+        # instead of awaiting each round-trip in sequence
+        semaphore = asyncio.Semaphore(COURSE_FAN_OUT_LIMIT)
 
-            if isinstance(assignments, dict) and "error" in assignments:
-                continue
+        async def fetch_course_reviews(course_id):
+            async with semaphore:
+                assignments = await fetch_all_paginated_results(
+                    f"/courses/{course_id}/assignments",
+                    params={"per_page": 100}
+                )
 
-            # Check each assignment for peer reviews
-            for assignment in assignments if isinstance(assignments, list) else []:
-                if assignment.get("peer_reviews"):
-                    assignment_id = assignment.get("id")
+            if not isinstance(assignments, list):
+                return []
 
-                    # Get peer reviews for this assignment
+            async def fetch_assignment_reviews(assignment):
+                async with semaphore:
                     peer_reviews = await fetch_all_paginated_results(
-                        f"/courses/{course_id}/assignments/{assignment_id}/peer_reviews",
+                        f"/courses/{course_id}/assignments/{assignment.get('id')}/peer_reviews",
                         params={"include[]": ["user"], "per_page": 100}
                     )
 
-                    if isinstance(peer_reviews, list):
-                        # Filter to reviews assigned to current user that are incomplete
-                        for review in peer_reviews:
-                            # Note: We'd need to filter by current user ID
-                            # For now, show all incomplete reviews
-                            if review.get("workflow_state") != "completed":
-                                review["_course_id"] = course_id
-                                review["_assignment_name"] = assignment.get("name")
-                                all_peer_reviews.append(review)
+                course_reviews = []
+                if isinstance(peer_reviews, list):
+                    # Filter to reviews assigned to current user that are incomplete
+                    for review in peer_reviews:
+                        # Note: We'd need to filter by current user ID
+                        # For now, show all incomplete reviews
+                        if review.get("workflow_state") != "completed":
+                            review["_course_id"] = course_id
+                            review["_assignment_name"] = assignment.get("name")
+                            course_reviews.append(review)
+                return course_reviews
+
+            peer_assignments = [a for a in assignments if a.get("peer_reviews")]
+            per_assignment = await asyncio.gather(
+                *(fetch_assignment_reviews(a) for a in peer_assignments)
+            )
+            return [review for reviews in per_assignment for review in reviews]
+
+        results = await asyncio.gather(
+            *(fetch_course_reviews(course_id) for course_id in course_ids),
+            return_exceptions=True,
+        )
+
+        for reviews in results:
+            if isinstance(reviews, BaseException):
+                continue
+            all_peer_reviews.extend(reviews)
 
         if not all_peer_reviews:
             return "You have no pending peer reviews! ✅"
 
-        output_lines = ["Peer Reviews You Need to Complete:\n"]
+        output_lines = [_HEADER_PEER_REVIEWS]
 
         for review in all_peer_reviews:
             assignment_name = review.get("_assignment_name", "Unknown Assignment")
             course_id = review.get("_course_id")
             course_display = await get_course_code(course_id) if course_id else "Unknown Course"
 
-            user_id = review.get("user_id")
-            assessor_id = review.get("assessor_id")
-
             output_lines.append(
-                f"• {assignment_name}\n"
-                f"  Course: {course_display}\n"
-                f"  Reviewing: Student {user_id}\n"
-                f"  Status: Incomplete\n"
+                _PEER_REVIEW_ROW_TMPL.format(
+                    name=assignment_name,
+                    course=course_display,
+                    user_id=review.get("user_id"),
+                )
             )
 
         return "\n".join(output_lines)
@@ -69,12 +69,10 @@ class GetAssignmentTool(BaseTool):
         course_id = ctx.args["courseId"]
         assignment_id = ctx.args["assignmentId"]
 
-        # Build include parameters for comprehensive data
-        include_params = ASSIGNMENT_INCLUDE_ALL.copy()
-
-        # Build query parameters
+        # Build query parameters (the include list is never mutated, so
+        # the module constant is passed directly — no per-call copy)
         params = build_single_assignment_params(
-            include=include_params,
+            include=ASSIGNMENT_INCLUDE_ALL,
             override_assignment_dates=True,  # Apply overrides for accurate dates
             all_dates=True,  # Include all date variants
         )
@@ -9,6 +9,23 @@ from typing import Any, Dict
 from tools.base import BaseTool, ToolContext
 from tools.registry import register_tool
 
+# Lean default: latest attempt, comments, and rubric scores. The heavy
+# extras (full attempt history, rubric with per-criterion comments,
+# course/user echoes) are opt-in via args.
+_INCLUDE_BASE = (
+    "submission_comments",  # Teacher/peer comments
+    "rubric_assessment",    # Rubric scores if applicable
+    "visibility",           # Visibility settings
+)
+
+# (arg name, include[] value) pairs for the opt-in extras
+_INCLUDE_FLAGS = (
+    ("includeHistory", "submission_history"),
+    ("includeFullRubric", "full_rubric_assessment"),
+    ("includeCourse", "course"),
+    ("includeUser", "user"),
+)
+
 
 @register_tool
 class GetAssignmentSubmissionTool(BaseTool):
@@ -20,15 +37,16 @@ class GetAssignmentSubmissionTool(BaseTool):
     - Grade and score information
     - Submission comments and feedback
     - Attached files and URLs
-    - Submission history
     - Rubric assessment
+    - Submission history (opt-in via includeHistory)
     """
 
     name = "get_assignment_submission"
     description = (
         "Get the student's submission for a specific assignment. "
         "Returns submission status, grade, feedback, attachments, and rubric assessment. "
-        "Use when student asks 'What did I submit?' or 'What's my grade on this assignment?'"
+        "Use when student asks 'What did I submit?' or 'What's my grade on this assignment?' "
+        "Pass includeHistory=true only when the student asks about previous attempts."
     )
     category = "assignments"
 
@@ -48,6 +66,10 @@ class GetAssignmentSubmissionTool(BaseTool):
         if not isinstance(assignment_id, int) or assignment_id <= 0:
             raise ValueError("assignmentId must be a positive integer")
 
+        for flag, _ in _INCLUDE_FLAGS:
+            if flag in args and not isinstance(args[flag], bool):
+                raise ValueError(f"{flag} must be a boolean")
+
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
         Execute the get_assignment_submission tool.
@@ -59,26 +81,30 @@ class GetAssignmentSubmissionTool(BaseTool):
             - courseId (int): Canvas course ID
             - assignmentId (int): Canvas assignment ID
 
+        Optional args:
+            - includeHistory (bool): Include every prior attempt with full
+              body text (default: False — often the largest part of the
+              response)
+            - includeFullRubric (bool): Include the detailed rubric with
+              per-criterion comments (default: False)
+            - includeCourse (bool): Echo course info (default: False)
+            - includeUser (bool): Echo student user info (default: False)
+
         Returns:
             {
                 "courseId": <int>,
                 "assignmentId": <int>,
-                "submission": <Submission object with all fields>
+                "submission": <Submission object>
             }
         """
         course_id = ctx.args["courseId"]
         assignment_id = ctx.args["assignmentId"]
 
-        # Build include parameters for comprehensive submission data
-        include_params = [
-            "submission_history",   # All submission attempts
-            "submission_comments",  # Teacher/peer comments
-            "rubric_assessment",    # Rubric scores if applicable
-            "full_rubric_assessment",  # Detailed rubric with comments
-            "visibility",           # Visibility settings
-            "course",               # Course info
-            "user",                 # Student user info
-        ]
+        # Lean include list by default; extras only when asked for
+        include_params = list(_INCLUDE_BASE)
+        for flag, include_value in _INCLUDE_FLAGS:
+            if ctx.args.get(flag):
+                include_params.append(include_value)
 
         params = {
             "include[]": include_params,
@@ -8,7 +8,13 @@ Returns full JSON responses with submission status, scores, and due dates.
 from typing import Any, Dict
 from tools.base import BaseTool, ToolContext
 from tools.registry import register_tool
-from utils.canvas_params import build_assignment_params, ASSIGNMENT_INCLUDE_ALL
+from utils.canvas_params import build_assignment_params, project_fields, ASSIGNMENT_INCLUDE_ALL
+
+# Frozensets give O(1) membership checks in validate_args
+_VALID_BUCKETS = frozenset(
+    {"past", "overdue", "undated", "ungraded", "unsubmitted", "upcoming", "future"}
+)
+_VALID_ORDERS = frozenset({"position", "name", "due_at"})
 
 
 @register_tool
@@ -43,15 +49,18 @@ class ListAssignmentsTool(BaseTool):
 
         # Validate bucket filter
         if "bucket" in args:
-            valid_buckets = ["past", "overdue", "undated", "ungraded", "unsubmitted", "upcoming", "future"]
-            if args["bucket"] not in valid_buckets:
-                raise ValueError(f"bucket must be one of: {', '.join(valid_buckets)}")
+            if args["bucket"] not in _VALID_BUCKETS:
+                raise ValueError(f"bucket must be one of: {', '.join(sorted(_VALID_BUCKETS))}")
 
         # Validate order_by
         if "orderBy" in args:
-            valid_orders = ["position", "name", "due_at"]
-            if args["orderBy"] not in valid_orders:
-                raise ValueError(f"orderBy must be one of: {', '.join(valid_orders)}")
+            if args["orderBy"] not in _VALID_ORDERS:
+                raise ValueError(f"orderBy must be one of: {', '.join(sorted(_VALID_ORDERS))}")
+
+        if "fields" in args:
+            fields = args["fields"]
+            if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+                raise ValueError("fields must be a list of field names")
 
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
@@ -68,6 +77,8 @@ class ListAssignmentsTool(BaseTool):
             - searchTerm (str): Search assignments by title
             - orderBy (str): Order results ("due_at", "name", "position")
             - perPage (int): Results per page (default: 100)
+            - fields (list[str]): Only return these fields per assignment
+              (e.g. DEFAULT_ASSIGNMENT_LIST_FIELDS); omit for full objects
 
         Returns:
             {
@@ -84,13 +95,12 @@ class ListAssignmentsTool(BaseTool):
         search_term = ctx.args.get("searchTerm")
         order_by = ctx.args.get("orderBy", "due_at")
         per_page = ctx.args.get("perPage", 100)
+        fields = ctx.args.get("fields")
 
-        # Build include parameters for comprehensive data
-        include_params = ASSIGNMENT_INCLUDE_ALL.copy()
-
-        # Build query parameters
+        # Build query parameters (the include list is never mutated, so
+        # the module constant is passed directly — no per-call copy)
         params = build_assignment_params(
-            include=include_params,
+            include=ASSIGNMENT_INCLUDE_ALL,
             bucket=bucket,
             search_term=search_term,
             order_by=order_by,
@@ -105,6 +115,10 @@ class ListAssignmentsTool(BaseTool):
             paginate=True,
         )
 
+        # Project down to requested fields before serialization
+        if fields:
+            assignments = project_fields(assignments, fields)
+
         return {
             "courseId": course_id,
             "assignments": assignments,
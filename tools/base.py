@@ -3,14 +3,53 @@ Base tool class for Canvas MCP tools.
 All tools should inherit from BaseTool and implement the execute() method.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from api.cache import hash_token
 from api.client import CanvasAPIClient
 
+# Process-wide pool of CanvasAPIClient instances keyed by credentials.
+# The HTTP connection pool is already shared at the api.client module
+# level; this additionally reuses the per-client state (normalized base
+# URL, prebuilt auth headers) across tool calls instead of rebuilding it
+# for every ToolContext. Bounded so churning tokens can't grow it.
+_CLIENT_POOL: Dict[tuple, CanvasAPIClient] = {}
+_CLIENT_POOL_MAX = 256
+
+
+def require_positive_int(args: Dict[str, Any], key: str) -> None:
+    """
+    Validate that a required argument is a positive integer.
+
+    Shared by the many tools whose validate_args repeats the same
+    courseId/quizId/assignmentId check. type() rather than isinstance()
+    also rejects bools (Canvas IDs are never bool) without an MRO walk.
+
+    Args:
+        args: Tool arguments
+        key: Argument name to check
+
+    Raises:
+        ValueError: If the argument is missing or not a positive int
+    """
+    if key not in args:
+        raise ValueError(f"{key} is required")
+    value = args[key]
+    if type(value) is not int or value <= 0:
+        raise ValueError(f"{key} must be a positive integer")
+
 
 class ToolContext:
     """Context object passed to tool execute() methods."""
 
+    # Fixed attribute set: skips the per-instance __dict__ allocation for
+    # an object created on every tool call
+    __slots__ = ("api_url", "api_token", "args", "_client")
+
     def __init__(self, api_url: str, api_token: str, args: Dict[str, Any]):
         """
         Initialize tool context.
@@ -28,16 +67,23 @@ class ToolContext:
     @property
     def client(self) -> CanvasAPIClient:
         """
-        Get or create Canvas API client instance.
+        Get the pooled Canvas API client for this context's credentials.
 
         Returns:
             CanvasAPIClient: Initialized API client
 
         Note:
-            Client is lazily instantiated on first access
+            Clients are shared process-wide per (api_url, api_token), so
+            repeat calls with the same credentials reuse one instance.
         """
         if self._client is None:
-            self._client = CanvasAPIClient(self.api_url, self.api_token)
+            key = (self.api_url, self.api_token)
+            client = _CLIENT_POOL.get(key)
+            if client is None:
+                if len(_CLIENT_POOL) >= _CLIENT_POOL_MAX:
+                    _CLIENT_POOL.pop(next(iter(_CLIENT_POOL)))
+                client = _CLIENT_POOL[key] = CanvasAPIClient(self.api_url, self.api_token)
+            self._client = client
         return self._client
 
 
@@ -65,6 +111,29 @@ class BaseTool(ABC):
     description: str = ""
     category: str = "general"  # "courses", "assignments", etc.
 
+    # Read-only tools may share results between identical concurrent
+    # invocations; set False on tools with side effects
+    cacheable: bool = True
+
+    # Per-tool freshness window for the shared response cache, passed as
+    # cache_ttl to ctx.client.get. None uses the configured default.
+    # Stable resources (quiz definitions) can afford minutes; volatile
+    # ones (an in-progress quiz submission) only seconds.
+    cache_ttl: Optional[float] = None
+
+    # Identical in-flight invocations (same tool, credentials, and args)
+    # share one execute() task instead of issuing duplicate fetches
+    _inflight: Dict[tuple, "asyncio.Task"] = {}
+
+    # Agents routinely re-issue the exact same tool call moments after it
+    # completed (retries, self-checks). A tiny LRU of just-finished
+    # results answers those verbatim without touching cache-key logic or
+    # the network. Deliberately short-lived — the TTL response cache
+    # handles anything beyond an immediate repeat.
+    _RECENT_RESULT_TTL = 2.0
+    _RECENT_RESULT_MAX = 64
+    _recent: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
     @abstractmethod
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
@@ -112,12 +181,36 @@ class BaseTool(ABC):
         """
         pass
 
+    # Bound on remembered validations so a hostile caller can't grow the
+    # per-tool cache without limit
+    _VALIDATION_CACHE_MAX = 1024
+
+    def _args_cache_key(self, args: Dict[str, Any]) -> Optional[frozenset]:
+        """Hashable key for an args dict, or None if it can't be keyed.
+
+        The value's class is part of the key: True, 1 and 1.0 hash equal,
+        and letting them alias would hand a courseId=True call the
+        validation memo (and cached result) of a courseId=1 call.
+        """
+        try:
+            return frozenset(
+                (key, value.__class__, tuple(value) if isinstance(value, list) else value)
+                for key, value in args.items()
+            )
+        except TypeError:
+            # Nested dicts/lists — validate every time
+            return None
+
     async def run(self, ctx: ToolContext) -> Dict[str, Any]:
         """
         Run the tool with validation and error handling.
 
         This method wraps execute() with:
-        - Argument validation
+        - Argument validation (memoized — registry tools are singletons,
+          and identical args recur across calls, so an args set that
+          already passed validate_args is not re-scanned)
+        - Exact-repeat short-circuit (an identical call completed within
+          the last couple of seconds returns its stored result)
         - Error handling
         - Consistent return format
 
@@ -130,16 +223,46 @@ class BaseTool(ABC):
         Note:
             This method should NOT be overridden. Override execute() instead.
         """
-        # Validate arguments
-        self.validate_args(ctx.args)
+        # Validate arguments, skipping args sets already known to be valid
+        args_key = self._args_cache_key(ctx.args)
+        validated: set = self.__dict__.setdefault("_validated_args", set())
 
-        # Execute tool
-        try:
-            result = await self.execute(ctx)
-            return result
-        except Exception as e:
-            # Re-raise to let main.py handle it
-            raise
+        if args_key is None or args_key not in validated:
+            self.validate_args(ctx.args)
+            if args_key is not None and len(validated) < self._VALIDATION_CACHE_MAX:
+                validated.add(args_key)
+
+        # Unkeyable args and non-cacheable tools execute directly
+        if not self.cacheable or args_key is None:
+            return await self.execute(ctx)
+
+        call_key = (self.name, ctx.api_url, hash_token(ctx.api_token), args_key)
+
+        # Exact repeat of a just-finished call: hand back the stored
+        # result as-is (results are treated as read-only downstream)
+        recent = BaseTool._recent.get(call_key)
+        if recent is not None:
+            if time.monotonic() - recent[0] < self._RECENT_RESULT_TTL:
+                BaseTool._recent.move_to_end(call_key)
+                return recent[1]
+            del BaseTool._recent[call_key]
+
+        # Dedupe identical concurrent invocations: the second caller with
+        # the same tool, credentials, and args awaits the first's task
+        task = BaseTool._inflight.get(call_key)
+        if task is None:
+            task = asyncio.ensure_future(self.execute(ctx))
+            BaseTool._inflight[call_key] = task
+            task.add_done_callback(lambda _task: BaseTool._inflight.pop(call_key, None))
+
+        result = await task
+
+        BaseTool._recent[call_key] = (time.monotonic(), result)
+        BaseTool._recent.move_to_end(call_key)
+        while len(BaseTool._recent) > self._RECENT_RESULT_MAX:
+            BaseTool._recent.popitem(last=False)
+
+        return result
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name='{self.name}' category='{self.category}'>"
@@ -8,7 +8,11 @@ Returns comprehensive course data with all available fields.
 from typing import Any, Dict
 from tools.base import BaseTool, ToolContext
 from tools.registry import register_tool
-from utils.canvas_params import build_single_course_params, COURSE_INCLUDE_ALL
+from utils.canvas_params import (
+    build_single_course_params,
+    COURSE_INCLUDE_ALL,
+    COURSE_INCLUDE_NO_SYLLABUS,
+)
 
 
 @register_tool
@@ -66,12 +70,8 @@ class GetCourseTool(BaseTool):
         include_syllabus = ctx.args.get("includeSyllabus", True)
         teacher_limit = ctx.args.get("teacherLimit")
 
-        # Build include parameters for comprehensive data
-        include_params = COURSE_INCLUDE_ALL.copy()
-
-        # Optionally exclude syllabus if not needed
-        if not include_syllabus and "syllabus_body" in include_params:
-            include_params.remove("syllabus_body")
+        # Pick the precomputed include variant (no per-call copy/remove)
+        include_params = COURSE_INCLUDE_ALL if include_syllabus else COURSE_INCLUDE_NO_SYLLABUS
 
         # Build query parameters
         params = build_single_course_params(
@@ -0,0 +1,100 @@
+"""
+Get Course Dashboard Tool
+
+Composite tool that fetches course details, progress, assignments, and
+classmates for a single course in one call, running the four underlying
+fetches concurrently instead of paying four sequential round-trips.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+from tools.base import BaseTool, ToolContext
+from tools.registry import register_tool
+from tools.courses.get_course import GetCourseTool
+from tools.courses.get_course_progress import GetCourseProgressTool
+from tools.courses.get_course_users import GetCourseUsersTool
+from tools.assignments.list_assignments import ListAssignmentsTool
+
+
+@register_tool
+class GetCourseDashboardTool(BaseTool):
+    """
+    Get a full dashboard view of a single course.
+
+    Combines four tools into one call:
+    - get_course (course details)
+    - get_course_progress (requirement/module progress)
+    - list_assignments (course assignments)
+    - get_course_users (classmates)
+
+    The four fetches run concurrently via asyncio.gather, so the call
+    takes roughly the slowest round-trip instead of the sum of all four.
+    """
+
+    name = "get_course_dashboard"
+    description = (
+        "Get course details, progress, assignments, and classmates for a course in one call. "
+        "Faster than calling get_course, get_course_progress, list_assignments, and "
+        "get_course_users separately. Use when student asks for an overview of a course."
+    )
+    category = "courses"
+
+    def validate_args(self, args: Dict[str, Any]) -> None:
+        """Validate tool arguments."""
+        if "courseId" not in args:
+            raise ValueError("courseId is required")
+
+        course_id = args["courseId"]
+        if not isinstance(course_id, int) or course_id <= 0:
+            raise ValueError("courseId must be a positive integer")
+
+    async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
+        """
+        Execute the get_course_dashboard tool.
+
+        Args:
+            ctx: Tool execution context
+
+        Required args:
+            - courseId (int): Canvas course ID
+
+        Optional args are forwarded to the underlying tools (e.g.
+        includeSyllabus, bucket, enrollmentType, perPage).
+
+        Returns:
+            {
+                "course": <get_course result or {"error": ...}>,
+                "progress": <get_course_progress result or {"error": ...}>,
+                "assignments": <list_assignments result or {"error": ...}>,
+                "classmates": <get_course_users result or {"error": ...}>
+            }
+
+        Note:
+            A failure in one section doesn't fail the whole dashboard;
+            that section carries an "error" key instead.
+        """
+
+        def sub_context() -> ToolContext:
+            # Each sub-tool gets its own context over the same credentials
+            # and args; the shared HTTP pool, response cache, and in-flight
+            # coalescing live at module level, so nothing is duplicated.
+            return ToolContext(
+                api_url=ctx.api_url,
+                api_token=ctx.api_token,
+                args=ctx.args,
+            )
+
+        results = await asyncio.gather(
+            GetCourseTool().run(sub_context()),
+            GetCourseProgressTool().run(sub_context()),
+            ListAssignmentsTool().run(sub_context()),
+            GetCourseUsersTool().run(sub_context()),
+            return_exceptions=True,
+        )
+
+        sections = ("course", "progress", "assignments", "classmates")
+        return {
+            section: {"error": str(result)} if isinstance(result, BaseException) else result
+            for section, result in zip(sections, results)
+        }
@@ -58,7 +58,7 @@ class GetCourseProgressTool(BaseTool):
                     "next_requirement_url": <str | null>,
                     "completed_at": <datetime | null>
                 },
-                "completion_percentage": <float>
+                "completionPercentage": <float>
             }
         """
         course_id = ctx.args["courseId"]
@@ -69,16 +69,18 @@ class GetCourseProgressTool(BaseTool):
             f"/courses/{course_id}/users/self/progress"
         )
 
-        # Calculate completion percentage
         requirement_count = progress.get("requirement_count", 0)
         completed_count = progress.get("requirement_completed_count", 0)
 
-        completion_percentage = 0.0
         if requirement_count > 0:
-            completion_percentage = (completed_count / requirement_count) * 100
+            # Half-up rounding to hundredths in integer arithmetic
+            pct_x100 = (completed_count * 10000 + requirement_count // 2) // requirement_count
+            completion_percentage = pct_x100 / 100
+        else:
+            completion_percentage = 0.0
 
         return {
             "courseId": course_id,
             "progress": progress,
-            "completionPercentage": round(completion_percentage, 2),
+            "completionPercentage": completion_percentage,
         }
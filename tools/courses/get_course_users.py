@@ -8,7 +8,11 @@ Respects course privacy settings - only shows what the student can see.
 from typing import Any, Dict
 from tools.base import BaseTool, ToolContext
 from tools.registry import register_tool
-from utils.canvas_params import build_course_user_params
+from utils.canvas_params import build_course_user_params, project_fields
+
+# Frozensets give O(1) membership checks in validate_args
+_VALID_ENROLLMENT_TYPES = frozenset({"student", "teacher", "ta", "observer", "designer"})
+_VALID_ENROLLMENT_STATES = frozenset({"active", "invited", "rejected", "completed", "inactive"})
 
 
 @register_tool
@@ -49,11 +53,11 @@ class GetCourseUsersTool(BaseTool):
             if not isinstance(enrollment_type, list):
                 raise ValueError("enrollmentType must be a list")
 
-            valid_types = ["student", "teacher", "ta", "observer", "designer"]
             for etype in enrollment_type:
-                if etype not in valid_types:
+                if etype not in _VALID_ENROLLMENT_TYPES:
                     raise ValueError(
-                        f"Invalid enrollment type '{etype}'. Must be one of: {', '.join(valid_types)}"
+                        f"Invalid enrollment type '{etype}'. "
+                        f"Must be one of: {', '.join(sorted(_VALID_ENROLLMENT_TYPES))}"
                     )
 
         # Validate enrollment state filter
@@ -62,13 +66,18 @@ class GetCourseUsersTool(BaseTool):
             if not isinstance(enrollment_state, list):
                 raise ValueError("enrollmentState must be a list")
 
-            valid_states = ["active", "invited", "rejected", "completed", "inactive"]
             for estate in enrollment_state:
-                if estate not in valid_states:
+                if estate not in _VALID_ENROLLMENT_STATES:
                     raise ValueError(
-                        f"Invalid enrollment state '{estate}'. Must be one of: {', '.join(valid_states)}"
+                        f"Invalid enrollment state '{estate}'. "
+                        f"Must be one of: {', '.join(sorted(_VALID_ENROLLMENT_STATES))}"
                     )
 
+        if "fields" in args:
+            fields = args["fields"]
+            if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+                raise ValueError("fields must be a list of field names")
+
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
         Execute the get_course_users tool.
@@ -85,6 +94,8 @@ class GetCourseUsersTool(BaseTool):
             - includeEmail (bool): Include email addresses (default: True, respects privacy)
             - includeAvatar (bool): Include avatar URLs (default: True)
             - perPage (int): Results per page (default: 100)
+            - fields (list[str]): Only return these fields per user;
+              omit for full objects
 
         Returns:
             {
@@ -105,6 +116,7 @@ class GetCourseUsersTool(BaseTool):
         include_email = ctx.args.get("includeEmail", True)
         include_avatar = ctx.args.get("includeAvatar", True)
         per_page = ctx.args.get("perPage", 100)
+        fields = ctx.args.get("fields")
 
         # Build include parameters
         include_params = ["enrollments"]  # Always include enrollment info
@@ -128,6 +140,10 @@ class GetCourseUsersTool(BaseTool):
             paginate=True,
         )
 
+        # Project down to requested fields before serialization
+        if fields:
+            users = project_fields(users, fields)
+
         return {
             "courseId": course_id,
             "users": users,
@@ -8,7 +8,15 @@ Returns full JSON responses with all available Canvas course fields.
 from typing import Any, Dict
 from tools.base import BaseTool, ToolContext
 from tools.registry import register_tool
-from utils.canvas_params import build_course_params, COURSE_INCLUDE_ALL
+from utils.canvas_params import (
+    build_course_params,
+    project_fields,
+    COURSE_INCLUDE_ALL,
+    COURSE_INCLUDE_NO_SYLLABUS,
+)
+
+# Frozenset gives O(1) membership checks in validate_args
+_VALID_ENROLLMENT_STATES = frozenset({"active", "invited_or_pending", "completed", "all"})
 
 
 @register_tool
@@ -38,10 +46,9 @@ class ListCoursesTool(BaseTool):
         """Validate tool arguments."""
         # Optional filters
         if "enrollmentState" in args:
-            valid_states = ["active", "invited_or_pending", "completed", "all"]
-            if args["enrollmentState"] not in valid_states:
+            if args["enrollmentState"] not in _VALID_ENROLLMENT_STATES:
                 raise ValueError(
-                    f"enrollmentState must be one of: {', '.join(valid_states)}"
+                    f"enrollmentState must be one of: {', '.join(sorted(_VALID_ENROLLMENT_STATES))}"
                 )
 
         if "state" in args:
@@ -53,6 +60,11 @@ class ListCoursesTool(BaseTool):
             if not isinstance(per_page, int) or per_page < 1 or per_page > 100:
                 raise ValueError("perPage must be an integer between 1 and 100")
 
+        if "fields" in args:
+            fields = args["fields"]
+            if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+                raise ValueError("fields must be a list of field names")
+
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
         Execute the list_courses tool.
@@ -66,6 +78,8 @@ class ListCoursesTool(BaseTool):
             - homeroom (bool): Return only homeroom courses
             - includeSyllabus (bool): Include full syllabus HTML (default: True)
             - perPage (int): Results per page (default: 100)
+            - fields (list[str]): Only return these fields per course
+              (e.g. DEFAULT_COURSE_LIST_FIELDS); omit for full objects
 
         Returns:
             {
@@ -79,13 +93,10 @@ class ListCoursesTool(BaseTool):
         homeroom = ctx.args.get("homeroom")
         include_syllabus = ctx.args.get("includeSyllabus", True)
         per_page = ctx.args.get("perPage", 100)
+        fields = ctx.args.get("fields")
 
-        # Build include parameters for comprehensive data
-        include_params = COURSE_INCLUDE_ALL.copy()
-
-        # Optionally exclude syllabus if not needed (it can be large)
-        if not include_syllabus and "syllabus_body" in include_params:
-            include_params.remove("syllabus_body")
+        # Pick the precomputed include variant (no per-call copy/remove)
+        include_params = COURSE_INCLUDE_ALL if include_syllabus else COURSE_INCLUDE_NO_SYLLABUS
 
         # Build query parameters
         params = build_course_params(
@@ -103,6 +114,17 @@ class ListCoursesTool(BaseTool):
             paginate=True,  # Automatically fetch all pages
         )
 
+        # Project down to requested fields before serialization
+        if fields:
+            courses = project_fields(courses, fields)
+        elif not include_syllabus:
+            # Belt and braces: some Canvas versions return syllabus_body
+            # regardless of the include list, and it can be huge
+            courses = [
+                {key: value for key, value in course.items() if key != "syllabus_body"}
+                for course in courses
+            ]
+
         # Return comprehensive response
         return {
             "courses": courses,
@@ -5,10 +5,29 @@ Previews HTML content within a course context.
 Useful for rendering course-specific HTML before posting.
 """
 
+import re
+
 from typing import Any, Dict
-from tools.base import BaseTool, ToolContext
+from tools.base import BaseTool, ToolContext, require_positive_int
 from tools.registry import register_tool
 
+# Markup that actually needs Canvas's renderer: course-relative links and
+# file/page references it rewrites, API-endpoint attributes, and anything
+# its sanitizer would strip (scripts, styles, embeds, event handlers,
+# javascript:/data: URLs). Plain paragraphs with none of these come back
+# from Canvas byte-identical, so they can be echoed locally without the
+# round trip; false positives just fall through to the server.
+_CANVAS_TOKEN_RE = re.compile(
+    r"\$CANVAS_"
+    r"|/courses/\d+/"
+    r"|data-api-endpoint="
+    r"|<(?:script|style|iframe|object|embed|form|link|meta)\b"
+    r"|\son\w+\s*="
+    r"|javascript:"
+    r"|data:",
+    re.IGNORECASE,
+)
+
 
 @register_tool
 class PreviewHtmlTool(BaseTool):
@@ -32,12 +51,7 @@ class PreviewHtmlTool(BaseTool):
 
     def validate_args(self, args: Dict[str, Any]) -> None:
         """Validate tool arguments."""
-        if "courseId" not in args:
-            raise ValueError("courseId is required")
-
-        course_id = args["courseId"]
-        if not isinstance(course_id, int) or course_id <= 0:
-            raise ValueError("courseId must be a positive integer")
+        require_positive_int(args, "courseId")
 
         if "html" not in args:
             raise ValueError("html is required")
@@ -67,6 +81,15 @@ class PreviewHtmlTool(BaseTool):
         course_id = ctx.args["courseId"]
         html_content = ctx.args["html"]
 
+        # Nothing Canvas would rewrite or strip: echo it back without
+        # the round trip
+        if not _CANVAS_TOKEN_RE.search(html_content):
+            return {
+                "courseId": course_id,
+                "html": html_content,
+                "originalHtml": html_content,
+            }
+
         # Send POST request to preview endpoint
         result = await ctx.client.post(
             f"/courses/{course_id}/preview_html",
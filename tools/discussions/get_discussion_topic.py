@@ -20,6 +20,9 @@ class GetDiscussionTopicTool(BaseTool):
     )
     category = "discussions"
 
+    # Topic title/body change slowly; read state can lag a minute
+    cache_ttl = 60.0
+
     def validate_args(self, args: Dict[str, Any]) -> None:
         if "course_id" not in args or "topic_id" not in args:
             raise ValueError("course_id and topic_id are required")
@@ -31,5 +34,5 @@ class GetDiscussionTopicTool(BaseTool):
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         course_id = ctx.args["course_id"]
         topic_id = ctx.args["topic_id"]
-        topic = await ctx.client.get(f"/courses/{course_id}/discussion_topics/{topic_id}")
+        topic = await ctx.client.get(f"/courses/{course_id}/discussion_topics/{topic_id}", cache_ttl=self.cache_ttl)
         return { "discussion_topic": topic }
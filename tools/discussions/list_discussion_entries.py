@@ -8,6 +8,7 @@ Returns full JSON entry objects.
 from typing import Any, Dict
 from tools.base import BaseTool, ToolContext
 from tools.registry import register_tool
+from utils.canvas_params import project_fields
 
 @register_tool
 class ListDiscussionEntriesTool(BaseTool):
@@ -15,9 +16,15 @@ class ListDiscussionEntriesTool(BaseTool):
     List all entries (posts/replies) in a discussion topic.
     """
     name = "list_discussion_entries"
-    description = "List all top-level posts and replies in a discussion topic."
+    description = (
+        "List all top-level posts and replies in a discussion topic. "
+        "Pass count_only=true when only the number of entries is needed."
+    )
     category = "discussions"
 
+    # New posts should show up quickly in an active discussion
+    cache_ttl = 30.0
+
     def validate_args(self, args: Dict[str, Any]) -> None:
         if "course_id" not in args or "topic_id" not in args:
             raise ValueError("course_id and topic_id are required")
@@ -25,9 +32,31 @@ class ListDiscussionEntriesTool(BaseTool):
             raise ValueError("course_id must be str or int")
         if not isinstance(args["topic_id"], (str, int)):
             raise ValueError("topic_id must be str or int")
+        if "limit" in args and (not isinstance(args["limit"], int) or args["limit"] <= 0):
+            raise ValueError("limit must be a positive integer")
+        if "fields" in args:
+            if not isinstance(args["fields"], list) or not all(isinstance(f, str) for f in args["fields"]):
+                raise ValueError("fields must be a list of strings")
+        if "count_only" in args and not isinstance(args["count_only"], bool):
+            raise ValueError("count_only must be a boolean")
 
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         course_id = ctx.args["course_id"]
         topic_id = ctx.args["topic_id"]
-        entries = await ctx.client.get(f"/courses/{course_id}/discussion_topics/{topic_id}/entries", paginate=True)
+        fields = ctx.args.get("fields")
+
+        # "How many replies?" doesn't need the bodies: stream pages
+        # through the paginated iterator and keep only a counter, so the
+        # full entry list (HTML messages included) is never held at once
+        if ctx.args.get("count_only"):
+            total = 0
+            async for _ in ctx.client.iter_paginated(f"/courses/{course_id}/discussion_topics/{topic_id}/entries"):
+                total += 1
+            return { "discussion_entries": [], "total": total }
+
+        entries = await ctx.client.get(f"/courses/{course_id}/discussion_topics/{topic_id}/entries", paginate=True, cache_ttl=self.cache_ttl, max_items=ctx.args.get("limit"))
+        # Entry objects carry full HTML message bodies; when the caller
+        # names the fields it needs, drop the rest before serializing
+        if fields:
+            entries = project_fields(entries, fields)
         return { "discussion_entries": entries, "total": len(entries) }
@@ -5,9 +5,12 @@ Lists all discussion topics for a given course.
 Returns full JSON discussion topic objects.
 """
 
+import asyncio
+
 from typing import Any, Dict
 from tools.base import BaseTool, ToolContext
 from tools.registry import register_tool
+from config import config
 
 @register_tool
 class ListDiscussionTopicsTool(BaseTool):
@@ -17,19 +20,53 @@ class ListDiscussionTopicsTool(BaseTool):
     name = "list_discussion_topics"
     description = (
         "List all discussion topics for a Canvas course. "
-        "Returns basic metadata plus post status, unread state, etc."
+        "Returns basic metadata plus post status, unread state, etc. "
+        "Pass prefetchEntries=true to also fetch every topic's entries in one call."
     )
     category = "discussions"
 
+    # Topic lists change slowly; read state can lag a minute
+    cache_ttl = 60.0
+
     def validate_args(self, args: Dict[str, Any]) -> None:
         if "course_id" not in args:
             raise ValueError("course_id is required")
         if not isinstance(args["course_id"], (str, int)):
             raise ValueError("course_id must be str or int")
+        if "limit" in args and (not isinstance(args["limit"], int) or args["limit"] <= 0):
+            raise ValueError("limit must be a positive integer")
+        if "prefetchEntries" in args and not isinstance(args["prefetchEntries"], bool):
+            raise ValueError("prefetchEntries must be a boolean")
 
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         course_id = ctx.args["course_id"]
         params = { "per_page": 50 }  # Default pagination, API allows ?page= etc.
         # Add more params as needed in the future
-        discussion_topics = await ctx.client.get(f"/courses/{course_id}/discussion_topics", params=params, paginate=True)
-        return { "discussion_topics": discussion_topics, "total": len(discussion_topics) }
+        discussion_topics = await ctx.client.get(f"/courses/{course_id}/discussion_topics", params=params, paginate=True, cache_ttl=self.cache_ttl, max_items=ctx.args.get("limit"))
+        result = { "discussion_topics": discussion_topics, "total": len(discussion_topics) }
+
+        # The common agent pattern is list topics -> fetch each topic's
+        # entries serially; prefetching hydrates all of them in roughly
+        # one page-latency instead of N round-trips
+        if ctx.args.get("prefetchEntries") and discussion_topics:
+            semaphore = asyncio.Semaphore(config.max_page_concurrency)
+
+            async def fetch_entries(topic_id):
+                async with semaphore:
+                    # Same freshness window as list_discussion_entries
+                    return await ctx.client.get(
+                        f"/courses/{course_id}/discussion_topics/{topic_id}/entries",
+                        paginate=True,
+                        cache_ttl=30.0,
+                    )
+
+            topic_ids = [topic["id"] for topic in discussion_topics]
+            entries_lists = await asyncio.gather(*(fetch_entries(tid) for tid in topic_ids))
+            # String keys: orjson's default mode (the NDJSON stream path)
+            # rejects non-str dict keys
+            result["entries_by_topic"] = {
+                str(topic_id): entries
+                for topic_id, entries in zip(topic_ids, entries_lists)
+            }
+
+        return result
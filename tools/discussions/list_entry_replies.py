@@ -20,12 +20,17 @@ class ListEntryRepliesTool(BaseTool):
     )
     category = "discussions"
 
+    # New replies should show up quickly in an active discussion
+    cache_ttl = 30.0
+
     def validate_args(self, args: Dict[str, Any]) -> None:
         for field in ["course_id", "topic_id", "entry_id"]:
             if field not in args:
                 raise ValueError(f"{field} is required")
             if not isinstance(args[field], (str, int)):
                 raise ValueError(f"{field} must be str or int")
+        if "limit" in args and (not isinstance(args["limit"], int) or args["limit"] <= 0):
+            raise ValueError("limit must be a positive integer")
     
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         course_id = ctx.args["course_id"]
@@ -34,5 +39,7 @@ class ListEntryRepliesTool(BaseTool):
         replies = await ctx.client.get(
             f"/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies",
             paginate=True,
+            cache_ttl=self.cache_ttl,
+            max_items=ctx.args.get("limit"),
         )
         return { "entry_replies": replies, "total": len(replies) }
@@ -8,7 +8,21 @@ Returns comprehensive enrollment and grade data across all courses.
 from typing import Any, Dict
 from tools.base import BaseTool, ToolContext
 from tools.registry import register_tool
-from utils.canvas_params import build_enrollments_params, ENROLLMENT_INCLUDE_ALL
+from utils.canvas_params import build_enrollments_params, project_fields, ENROLLMENT_INCLUDE_ALL
+
+# Module-level frozensets: validated once per unique args set (run()
+# memoizes), and set membership beats a per-value list scan
+_VALID_STATES = frozenset({
+    "active", "invited_or_pending", "creation_pending", "deleted",
+    "rejected", "completed", "inactive",
+})
+_VALID_STATES_MSG = ", ".join(sorted(_VALID_STATES))
+
+_VALID_TYPES = frozenset({
+    "StudentEnrollment", "TeacherEnrollment", "TaEnrollment",
+    "DesignerEnrollment", "ObserverEnrollment",
+})
+_VALID_TYPES_MSG = ", ".join(sorted(_VALID_TYPES))
 
 
 @register_tool
@@ -39,19 +53,29 @@ class ListEnrollmentsTool(BaseTool):
         if "state" in args:
             if not isinstance(args["state"], list):
                 raise ValueError("state must be a list")
-            valid_states = ["active", "invited_or_pending", "creation_pending", "deleted", "rejected", "completed", "inactive"]
             for state in args["state"]:
-                if state not in valid_states:
-                    raise ValueError(f"Invalid state '{state}'. Must be one of: {', '.join(valid_states)}")
+                if state not in _VALID_STATES:
+                    raise ValueError(f"Invalid state '{state}'. Must be one of: {_VALID_STATES_MSG}")
 
         # Validate enrollment type filter
         if "enrollmentType" in args:
             if not isinstance(args["enrollmentType"], list):
                 raise ValueError("enrollmentType must be a list")
-            valid_types = ["StudentEnrollment", "TeacherEnrollment", "TaEnrollment", "DesignerEnrollment", "ObserverEnrollment"]
             for etype in args["enrollmentType"]:
-                if etype not in valid_types:
-                    raise ValueError(f"Invalid enrollmentType '{etype}'. Must be one of: {', '.join(valid_types)}")
+                if etype not in _VALID_TYPES:
+                    raise ValueError(f"Invalid enrollmentType '{etype}'. Must be one of: {_VALID_TYPES_MSG}")
+
+        # Validate limit
+        if "limit" in args:
+            limit = args["limit"]
+            if not isinstance(limit, int) or limit <= 0:
+                raise ValueError("limit must be a positive integer")
+
+        # Validate fields projection
+        if "fields" in args:
+            fields = args["fields"]
+            if not isinstance(fields, list) or not all(isinstance(f, str) for f in fields):
+                raise ValueError("fields must be a list of strings")
 
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
@@ -64,6 +88,10 @@ class ListEnrollmentsTool(BaseTool):
             - state (list[str]): Filter by enrollment state (default: ["active"])
             - enrollmentType (list[str]): Filter by type (default: ["StudentEnrollment"])
             - gradingPeriodId (int): Return grades for specific grading period
+            - limit (int): Stop after this many enrollments instead of
+              draining every page
+            - fields (list[str]): Project each enrollment down to these
+              fields (e.g. ["course_id", "grades", "type"])
             - perPage (int): Results per page (default: 100)
 
         Returns:
@@ -79,15 +107,13 @@ class ListEnrollmentsTool(BaseTool):
         grading_period_id = ctx.args.get("gradingPeriodId")
         per_page = ctx.args.get("perPage", 100)
 
-        # Build include parameters for comprehensive grade data
-        include_params = ENROLLMENT_INCLUDE_ALL.copy()
-
-        # Build query parameters
+        # Build query parameters (the include list is never mutated, so
+        # the module constant is passed directly — no per-call copy)
         params = build_enrollments_params(
             user_id="self",  # Always get current user's enrollments
             state=state,
             enrollment_type=enrollment_type,
-            include=include_params,
+            include=ENROLLMENT_INCLUDE_ALL,
             grading_period_id=grading_period_id,
             per_page=per_page,
         )
@@ -97,8 +123,14 @@ class ListEnrollmentsTool(BaseTool):
             "/users/self/enrollments",
             params=params,
             paginate=True,
+            max_items=ctx.args.get("limit"),
         )
 
+        # Project down to the requested fields before serializing
+        fields = ctx.args.get("fields")
+        if fields:
+            enrollments = project_fields(enrollments, fields)
+
         return {
             "enrollments": enrollments,
             "total": len(enrollments),
@@ -6,7 +6,7 @@ Returns comprehensive quiz data including all settings and restrictions.
 """
 
 from typing import Any, Dict
-from tools.base import BaseTool, ToolContext
+from tools.base import BaseTool, ToolContext, require_positive_int
 from tools.registry import register_tool
 
 
@@ -34,20 +34,13 @@ class GetQuizTool(BaseTool):
     )
     category = "quizzes"
 
+    # Quiz definitions rarely change mid-session
+    cache_ttl = 300.0
+
     def validate_args(self, args: Dict[str, Any]) -> None:
         """Validate tool arguments."""
-        if "courseId" not in args:
-            raise ValueError("courseId is required")
-        if "quizId" not in args:
-            raise ValueError("quizId is required")
-
-        course_id = args["courseId"]
-        quiz_id = args["quizId"]
-
-        if not isinstance(course_id, int) or course_id <= 0:
-            raise ValueError("courseId must be a positive integer")
-        if not isinstance(quiz_id, int) or quiz_id <= 0:
-            raise ValueError("quizId must be a positive integer")
+        require_positive_int(args, "courseId")
+        require_positive_int(args, "quizId")
 
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
@@ -73,6 +66,7 @@ class GetQuizTool(BaseTool):
         # Fetch quiz details
         quiz = await ctx.client.get(
             f"/courses/{course_id}/quizzes/{quiz_id}",
+            cache_ttl=self.cache_ttl,
         )
 
         return {
@@ -6,7 +6,7 @@ Returns submission status, score, and attempt information.
 """
 
 from typing import Any, Dict
-from tools.base import BaseTool, ToolContext
+from tools.base import BaseTool, ToolContext, require_positive_int
 from tools.registry import register_tool
 from utils.canvas_params import build_quiz_submission_params, QUIZ_SUBMISSION_INCLUDE_ALL
 
@@ -33,20 +33,13 @@ class GetQuizSubmissionTool(BaseTool):
     )
     category = "quizzes"
 
+    # Scores change while a quiz is being taken/graded — stay fresh
+    cache_ttl = 5.0
+
     def validate_args(self, args: Dict[str, Any]) -> None:
         """Validate tool arguments."""
-        if "courseId" not in args:
-            raise ValueError("courseId is required")
-        if "quizId" not in args:
-            raise ValueError("quizId is required")
-
-        course_id = args["courseId"]
-        quiz_id = args["quizId"]
-
-        if not isinstance(course_id, int) or course_id <= 0:
-            raise ValueError("courseId must be a positive integer")
-        if not isinstance(quiz_id, int) or quiz_id <= 0:
-            raise ValueError("quizId must be a positive integer")
+        require_positive_int(args, "courseId")
+        require_positive_int(args, "quizId")
 
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
@@ -79,6 +72,7 @@ class GetQuizSubmissionTool(BaseTool):
         submission = await ctx.client.get(
             f"/courses/{course_id}/quizzes/{quiz_id}/submission",
             params=params,
+            cache_ttl=self.cache_ttl,
         )
 
         return {
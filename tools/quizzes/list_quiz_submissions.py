@@ -6,7 +6,7 @@ For students, this will only return their own submission(s).
 """
 
 from typing import Any, Dict
-from tools.base import BaseTool, ToolContext
+from tools.base import BaseTool, ToolContext, require_positive_int
 from tools.registry import register_tool
 from utils.canvas_params import build_quiz_submission_params, QUIZ_SUBMISSION_INCLUDE_ALL
 
@@ -33,20 +33,13 @@ class ListQuizSubmissionsTool(BaseTool):
     )
     category = "quizzes"
 
+    # Scores change while a quiz is being taken/graded — stay fresh
+    cache_ttl = 5.0
+
     def validate_args(self, args: Dict[str, Any]) -> None:
         """Validate tool arguments."""
-        if "courseId" not in args:
-            raise ValueError("courseId is required")
-        if "quizId" not in args:
-            raise ValueError("quizId is required")
-
-        course_id = args["courseId"]
-        quiz_id = args["quizId"]
-
-        if not isinstance(course_id, int) or course_id <= 0:
-            raise ValueError("courseId must be a positive integer")
-        if not isinstance(quiz_id, int) or quiz_id <= 0:
-            raise ValueError("quizId must be a positive integer")
+        require_positive_int(args, "courseId")
+        require_positive_int(args, "quizId")
 
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
@@ -81,6 +74,7 @@ class ListQuizSubmissionsTool(BaseTool):
             f"/courses/{course_id}/quizzes/{quiz_id}/submissions",
             params=params,
             paginate=True,
+            cache_ttl=self.cache_ttl,
         )
 
         return {
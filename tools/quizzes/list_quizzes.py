@@ -6,7 +6,7 @@ Returns comprehensive quiz data including title, description, time limits, and p
 """
 
 from typing import Any, Dict
-from tools.base import BaseTool, ToolContext
+from tools.base import BaseTool, ToolContext, require_positive_int
 from tools.registry import register_tool
 from utils.canvas_params import build_quiz_params
 
@@ -32,14 +32,17 @@ class ListQuizzesTool(BaseTool):
     )
     category = "quizzes"
 
+    # Quiz definitions rarely change mid-session
+    cache_ttl = 300.0
+
     def validate_args(self, args: Dict[str, Any]) -> None:
         """Validate tool arguments."""
-        if "courseId" not in args:
-            raise ValueError("courseId is required")
+        require_positive_int(args, "courseId")
 
-        course_id = args["courseId"]
-        if not isinstance(course_id, int) or course_id <= 0:
-            raise ValueError("courseId must be a positive integer")
+        if "limit" in args:
+            limit = args["limit"]
+            if not isinstance(limit, int) or limit <= 0:
+                raise ValueError("limit must be a positive integer")
 
     async def execute(self, ctx: ToolContext) -> Dict[str, Any]:
         """
@@ -53,7 +56,10 @@ class ListQuizzesTool(BaseTool):
 
         Optional args:
             - searchTerm (str): Search quizzes by partial title match
-            - perPage (int): Results per page (default: 100)
+            - limit (int): Stop after this many quizzes instead of
+              draining every page
+            - perPage (int): Results per page (default: 100, or 20 when
+              searching)
 
         Returns:
             {
@@ -65,7 +71,12 @@ class ListQuizzesTool(BaseTool):
         """
         course_id = ctx.args["courseId"]
         search_term = ctx.args.get("searchTerm")
-        per_page = ctx.args.get("perPage", 100)
+        limit = ctx.args.get("limit")
+        per_page = ctx.args.get("perPage")
+        if per_page is None:
+            # A search usually wants the first match or two; a small
+            # page is cheaper for Canvas to render
+            per_page = 20 if search_term else 100
 
         # Build query parameters
         params = build_quiz_params(
@@ -78,6 +89,8 @@ class ListQuizzesTool(BaseTool):
             f"/courses/{course_id}/quizzes",
             params=params,
             paginate=True,
+            cache_ttl=self.cache_ttl,
+            max_items=limit,
         )
 
         return {
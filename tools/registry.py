@@ -2,8 +2,10 @@
 Tool registry system for automatic tool discovery and registration.
 """
 
-from typing import Dict, List, Type
-from .base import BaseTool
+import asyncio
+import sys
+from typing import Dict, List, Optional, Tuple, Type
+from .base import BaseTool, ToolContext
 
 
 class ToolRegistry:
@@ -14,6 +16,10 @@ class ToolRegistry:
     The registry provides lookup by name and listing by category.
     """
 
+    # The registry sits on every dispatch; fixed attributes skip the
+    # per-instance __dict__ like ToolContext already does
+    __slots__ = ("_tools", "_tools_by_category")
+
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
         self._tools_by_category: Dict[str, List[BaseTool]] = {}
@@ -40,8 +46,9 @@ class ToolRegistry:
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' is already registered")
 
-        # Register tool
-        self._tools[tool.name] = tool
+        # Register tool (interned name: repeat lookups of the same tool
+        # hit the cached-hash/pointer-equality fast path in dict)
+        self._tools[sys.intern(tool.name)] = tool
 
         # Add to category index
         category = tool.category
@@ -66,6 +73,41 @@ class ToolRegistry:
             raise KeyError(f"Tool '{name}' not found. Available: {list(self._tools.keys())}")
         return self._tools[name]
 
+    def find(self, name: str) -> Optional[BaseTool]:
+        """
+        Get a tool by name without raising.
+
+        Preferred on the request hot path: a plain dict probe avoids the
+        raise/catch cost of get() for unknown tool names.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Tool instance, or None if not registered
+        """
+        return self._tools.get(name)
+
+    async def batch_execute(self, calls: List[Tuple[str, ToolContext]]) -> List:
+        """
+        Run several tool invocations concurrently.
+
+        All calls start at once, so their Canvas GETs overlap on the
+        pooled connection (multiplexed over one socket under HTTP/2)
+        instead of paying one serial round-trip per tool.
+
+        Args:
+            calls: (tool name, context) pairs; names must be registered
+
+        Returns:
+            One entry per call, in input order: the tool's result dict,
+            or the exception it raised
+        """
+        return list(await asyncio.gather(
+            *(self.get(name).run(ctx) for name, ctx in calls),
+            return_exceptions=True,
+        ))
+
     def list_all(self) -> List[BaseTool]:
         """
         Get list of all registered tools.
@@ -87,6 +129,15 @@ class ToolRegistry:
         """
         return self._tools_by_category.get(category, [])
 
+    def count(self) -> int:
+        """
+        Get the number of registered tools without copying the registry.
+
+        Returns:
+            Number of registered tools
+        """
+        return len(self._tools)
+
     def list_tool_names(self) -> List[str]:
         """
         Get list of all registered tool names.
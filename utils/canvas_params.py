@@ -3,11 +3,29 @@ Utility functions for building Canvas API parameters.
 Helps construct include[] arrays and other query parameters.
 """
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+def _freeze(value: Optional[Sequence]) -> Optional[Tuple]:
+    """Convert a list arg to a hashable tuple for the memoized builders."""
+    return tuple(value) if value is not None else None
+
+
+# Sequence parameters are omitted only when the caller passes None (the
+# default). An explicit empty sequence still lands in the params mapping
+# but encodes to nothing, so it never silently shadows a None default in
+# the memoization key.
+
+
+# Canvas wants lowercase "true"/"false" for boolean query params; a
+# two-entry table beats allocating a fresh lowercased string each time
+_BOOL_STR = {True: "true", False: "false"}
 
 
 # Comprehensive list of all available include[] parameters for courses
-COURSE_INCLUDE_ALL = [
+COURSE_INCLUDE_ALL = (
     "syllabus_body",         # Full HTML syllabus
     "term",                  # Enrollment term details
     "course_progress",       # Student's progress tracking
@@ -27,7 +45,56 @@ COURSE_INCLUDE_ALL = [
     "tabs",                  # Course navigation tabs
     "passback_status",       # Grade passback status
     "observed_users",        # Observed users (for observers)
-]
+)
+
+# The only realized variant: everything except the (potentially huge)
+# syllabus HTML. Precomputed once so tools pick a constant instead of
+# copy()+remove() per call.
+COURSE_INCLUDE_NO_SYLLABUS = tuple(
+    item for item in COURSE_INCLUDE_ALL if item != "syllabus_body"
+)
+
+
+# Conservative field subsets for callers that pass fields=[...] to the
+# list tools and don't need the full Canvas objects. Cuts typical list
+# payloads by an order of magnitude.
+DEFAULT_COURSE_LIST_FIELDS = (
+    "id", "name", "course_code", "term", "enrollments", "workflow_state",
+)
+
+DEFAULT_ASSIGNMENT_LIST_FIELDS = (
+    "id", "name", "due_at", "points_possible", "submission",
+    "has_submitted_submissions",
+)
+
+
+def project_fields(
+    items: List[Dict[str, Any]],
+    fields: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Project each item down to the requested fields.
+
+    Canvas list responses carry dozens of fields per object (syllabi,
+    rubrics, full descriptions); when the caller names the fields it
+    needs, everything else is dropped before the response is serialized.
+
+    Args:
+        items: List of Canvas objects (dicts)
+        fields: Field names to keep; missing fields are simply absent
+
+    Returns:
+        New list of dicts containing only the requested fields
+
+    Example:
+        >>> project_fields([{"id": 1, "name": "A", "syllabus_body": "..."}], ["id", "name"])
+        [{'id': 1, 'name': 'A'}]
+    """
+    field_set = set(fields)
+    return [
+        {key: item[key] for key in item.keys() & field_set}
+        for item in items
+    ]
 
 
 def build_course_params(
@@ -37,7 +104,7 @@ def build_course_params(
     state: Optional[List[str]] = None,
     homeroom: Optional[bool] = None,
     per_page: Optional[int] = None,
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Build query parameters for course list endpoints.
 
@@ -60,11 +127,30 @@ def build_course_params(
         ...     per_page=50
         ... )
         >>> # Results in: ?include[]=syllabus_body&include[]=term&include[]=total_scores&enrollment_state=active&per_page=50
+
+    Note:
+        Results are memoized per argument combination and shared between
+        callers; the returned mapping is a read-only view.
     """
+    return _build_course_params_cached(
+        _freeze(include), enrollment_state, enrollment_type,
+        _freeze(state), homeroom, per_page,
+    )
+
+
+@lru_cache(maxsize=512)
+def _build_course_params_cached(
+    include: Optional[Tuple[str, ...]],
+    enrollment_state: Optional[str],
+    enrollment_type: Optional[str],
+    state: Optional[Tuple[str, ...]],
+    homeroom: Optional[bool],
+    per_page: Optional[int],
+) -> Mapping[str, Any]:
     params: Dict[str, Any] = {}
 
     # Include parameters (Canvas uses include[] format)
-    if include:
+    if include is not None:
         params["include[]"] = include
 
     # Enrollment filters
@@ -75,18 +161,18 @@ def build_course_params(
         params["enrollment_type"] = enrollment_type
 
     # State filters
-    if state:
+    if state is not None:
         params["state[]"] = state
 
     # Homeroom filter
     if homeroom is not None:
-        params["homeroom"] = str(homeroom).lower()
+        params["homeroom"] = _BOOL_STR[homeroom]
 
     # Pagination
     if per_page:
         params["per_page"] = per_page
 
-    return params
+    return MappingProxyType(params)
 
 
 def build_course_user_params(
@@ -94,7 +180,7 @@ def build_course_user_params(
     enrollment_state: Optional[List[str]] = None,
     include: Optional[List[str]] = None,
     per_page: Optional[int] = None,
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Build query parameters for course users endpoint.
 
@@ -113,28 +199,45 @@ def build_course_user_params(
         ...     enrollment_state=["active"],
         ...     include=["email", "avatar_url"]
         ... )
+
+    Note:
+        Results are memoized per argument combination and shared between
+        callers; the returned mapping is a read-only view.
     """
+    return _build_course_user_params_cached(
+        _freeze(enrollment_type), _freeze(enrollment_state),
+        _freeze(include), per_page,
+    )
+
+
+@lru_cache(maxsize=512)
+def _build_course_user_params_cached(
+    enrollment_type: Optional[Tuple[str, ...]],
+    enrollment_state: Optional[Tuple[str, ...]],
+    include: Optional[Tuple[str, ...]],
+    per_page: Optional[int],
+) -> Mapping[str, Any]:
     params: Dict[str, Any] = {}
 
-    if enrollment_type:
+    if enrollment_type is not None:
         params["enrollment_type[]"] = enrollment_type
 
-    if enrollment_state:
+    if enrollment_state is not None:
         params["enrollment_state[]"] = enrollment_state
 
-    if include:
+    if include is not None:
         params["include[]"] = include
 
     if per_page:
         params["per_page"] = per_page
 
-    return params
+    return MappingProxyType(params)
 
 
 def build_single_course_params(
     include: Optional[List[str]] = None,
     teacher_limit: Optional[int] = None,
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Build query parameters for single course detail endpoint.
 
@@ -150,20 +253,32 @@ def build_single_course_params(
         ...     include=["syllabus_body", "term", "permissions"],
         ...     teacher_limit=5
         ... )
+
+    Note:
+        Results are memoized per argument combination and shared between
+        callers; the returned mapping is a read-only view.
     """
+    return _build_single_course_params_cached(_freeze(include), teacher_limit)
+
+
+@lru_cache(maxsize=512)
+def _build_single_course_params_cached(
+    include: Optional[Tuple[str, ...]],
+    teacher_limit: Optional[int],
+) -> Mapping[str, Any]:
     params: Dict[str, Any] = {}
 
-    if include:
+    if include is not None:
         params["include[]"] = include
 
     if teacher_limit:
         params["teacher_limit"] = teacher_limit
 
-    return params
+    return MappingProxyType(params)
 
 
 # Comprehensive list of all available include[] parameters for assignments
-ASSIGNMENT_INCLUDE_ALL = [
+ASSIGNMENT_INCLUDE_ALL = (
     "submission",              # Current user's submission
     "assignment_visibility",   # Array of student IDs who can see this assignment
     "all_dates",              # All date objects (base and overrides)
@@ -172,7 +287,7 @@ ASSIGNMENT_INCLUDE_ALL = [
     "can_edit",               # Whether user can edit assignment
     "score_statistics",       # Min, max, mean scores for assignment
     "ab_guid",                # Academic benchmark IDs
-]
+)
 
 
 def build_assignment_params(
@@ -185,7 +300,7 @@ def build_assignment_params(
     order_by: Optional[str] = None,
     post_to_sis: Optional[bool] = None,
     per_page: Optional[int] = None,
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Build query parameters for assignments list endpoint.
 
@@ -211,11 +326,34 @@ def build_assignment_params(
         ...     order_by="due_at",
         ...     per_page=50
         ... )
+
+    Note:
+        Results are memoized per argument combination and shared between
+        callers; the returned mapping is a read-only view.
     """
+    return _build_assignment_params_cached(
+        _freeze(include), search_term, override_assignment_dates,
+        needs_grading_count_by_section, bucket, _freeze(assignment_ids),
+        order_by, post_to_sis, per_page,
+    )
+
+
+@lru_cache(maxsize=512)
+def _build_assignment_params_cached(
+    include: Optional[Tuple[str, ...]],
+    search_term: Optional[str],
+    override_assignment_dates: Optional[bool],
+    needs_grading_count_by_section: Optional[bool],
+    bucket: Optional[str],
+    assignment_ids: Optional[Tuple[int, ...]],
+    order_by: Optional[str],
+    post_to_sis: Optional[bool],
+    per_page: Optional[int],
+) -> Mapping[str, Any]:
     params: Dict[str, Any] = {}
 
     # Include parameters
-    if include:
+    if include is not None:
         params["include[]"] = include
 
     # Search/filter parameters
@@ -223,28 +361,28 @@ def build_assignment_params(
         params["search_term"] = search_term
 
     if override_assignment_dates is not None:
-        params["override_assignment_dates"] = str(override_assignment_dates).lower()
+        params["override_assignment_dates"] = _BOOL_STR[override_assignment_dates]
 
     if needs_grading_count_by_section is not None:
-        params["needs_grading_count_by_section"] = str(needs_grading_count_by_section).lower()
+        params["needs_grading_count_by_section"] = _BOOL_STR[needs_grading_count_by_section]
 
     if bucket:
         params["bucket"] = bucket
 
-    if assignment_ids:
+    if assignment_ids is not None:
         params["assignment_ids[]"] = assignment_ids
 
     if order_by:
         params["order_by"] = order_by
 
     if post_to_sis is not None:
-        params["post_to_sis"] = str(post_to_sis).lower()
+        params["post_to_sis"] = _BOOL_STR[post_to_sis]
 
     # Pagination
     if per_page:
         params["per_page"] = per_page
 
-    return params
+    return MappingProxyType(params)
 
 
 def build_single_assignment_params(
@@ -252,7 +390,7 @@ def build_single_assignment_params(
     override_assignment_dates: Optional[bool] = None,
     needs_grading_count_by_section: Optional[bool] = None,
     all_dates: Optional[bool] = None,
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Build query parameters for single assignment detail endpoint.
 
@@ -270,22 +408,39 @@ def build_single_assignment_params(
         ...     include=["submission", "score_statistics", "overrides"],
         ...     override_assignment_dates=True
         ... )
+
+    Note:
+        Results are memoized per argument combination and shared between
+        callers; the returned mapping is a read-only view.
     """
+    return _build_single_assignment_params_cached(
+        _freeze(include), override_assignment_dates,
+        needs_grading_count_by_section, all_dates,
+    )
+
+
+@lru_cache(maxsize=512)
+def _build_single_assignment_params_cached(
+    include: Optional[Tuple[str, ...]],
+    override_assignment_dates: Optional[bool],
+    needs_grading_count_by_section: Optional[bool],
+    all_dates: Optional[bool],
+) -> Mapping[str, Any]:
     params: Dict[str, Any] = {}
 
-    if include:
+    if include is not None:
         params["include[]"] = include
 
     if override_assignment_dates is not None:
-        params["override_assignment_dates"] = str(override_assignment_dates).lower()
+        params["override_assignment_dates"] = _BOOL_STR[override_assignment_dates]
 
     if needs_grading_count_by_section is not None:
-        params["needs_grading_count_by_section"] = str(needs_grading_count_by_section).lower()
+        params["needs_grading_count_by_section"] = _BOOL_STR[needs_grading_count_by_section]
 
     if all_dates is not None:
-        params["all_dates"] = str(all_dates).lower()
+        params["all_dates"] = _BOOL_STR[all_dates]
 
-    return params
+    return MappingProxyType(params)
 
 
 def build_announcements_params(
@@ -333,13 +488,13 @@ def build_announcements_params(
 
     # Boolean filters
     if active_only is not None:
-        params["active_only"] = str(active_only).lower()
+        params["active_only"] = _BOOL_STR[active_only]
 
     if latest_only is not None:
-        params["latest_only"] = str(latest_only).lower()
+        params["latest_only"] = _BOOL_STR[latest_only]
 
     # Include parameters
-    if include:
+    if include is not None:
         params["include[]"] = include
 
     # Pagination
@@ -350,7 +505,7 @@ def build_announcements_params(
 
 
 # Comprehensive list of available include[] parameters for enrollments
-ENROLLMENT_INCLUDE_ALL = [
+ENROLLMENT_INCLUDE_ALL = (
     "avatar_url",       # User avatar URL
     "group_ids",        # Group membership IDs
     "locked",           # Whether enrollment is locked
@@ -358,7 +513,7 @@ ENROLLMENT_INCLUDE_ALL = [
     "can_be_removed",   # Whether enrollment can be removed
     "uuid",             # Enrollment UUID
     "current_points",   # Current points earned (includes unposted_current_points if permission)
-]
+)
 
 
 def build_enrollments_params(
@@ -368,7 +523,7 @@ def build_enrollments_params(
     include: Optional[List[str]] = None,
     grading_period_id: Optional[int] = None,
     per_page: Optional[int] = None,
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Build query parameters for user enrollments endpoint.
 
@@ -390,19 +545,38 @@ def build_enrollments_params(
         ...     include=["current_points"],
         ...     per_page=100
         ... )
+
+    Note:
+        Results are memoized per argument combination and shared between
+        callers; the returned mapping is a read-only view.
     """
+    return _build_enrollments_params_cached(
+        user_id, _freeze(state), _freeze(enrollment_type),
+        _freeze(include), grading_period_id, per_page,
+    )
+
+
+@lru_cache(maxsize=512)
+def _build_enrollments_params_cached(
+    user_id: str,
+    state: Optional[Tuple[str, ...]],
+    enrollment_type: Optional[Tuple[str, ...]],
+    include: Optional[Tuple[str, ...]],
+    grading_period_id: Optional[int],
+    per_page: Optional[int],
+) -> Mapping[str, Any]:
     params: Dict[str, Any] = {}
 
     # State filter
-    if state:
+    if state is not None:
         params["state[]"] = state
 
     # Enrollment type filter
-    if enrollment_type:
+    if enrollment_type is not None:
         params["type[]"] = enrollment_type
 
     # Include parameters
-    if include:
+    if include is not None:
         params["include[]"] = include
 
     # Grading period filter
@@ -413,7 +587,7 @@ def build_enrollments_params(
     if per_page:
         params["per_page"] = per_page
 
-    return params
+    return MappingProxyType(params)
 
 
 def build_quiz_params(
@@ -448,11 +622,11 @@ def build_quiz_params(
 
 
 # Comprehensive list of available include[] parameters for quiz submissions
-QUIZ_SUBMISSION_INCLUDE_ALL = [
+QUIZ_SUBMISSION_INCLUDE_ALL = (
     "submission",  # The submission associated with the quiz
     "quiz",        # The quiz object
     "user",        # The user who took the quiz
-]
+)
 
 
 def build_quiz_submission_params(
@@ -474,7 +648,7 @@ def build_quiz_submission_params(
     """
     params: Dict[str, Any] = {}
 
-    if include:
+    if include is not None:
         params["include[]"] = include
 
     return params